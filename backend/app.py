@@ -1,28 +1,36 @@
-from fastapi import FastAPI, HTTPException, Depends, UploadFile, File
+from fastapi import FastAPI, HTTPException, Depends, UploadFile, File, Form
 from pydantic import BaseModel, EmailStr
 from motor.motor_asyncio import AsyncIOMotorClient
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse, Response, FileResponse, RedirectResponse, HTMLResponse, PlainTextResponse
 from bson import ObjectId
-import bcrypt
 import os
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from jose import jwt, JWTError
 import datetime
 from bson import ObjectId, errors
 # REMOVED: from fastapi_mail import FastMail, MessageSchema, ConnectionConfig
-from typing import List, Optional
+from typing import List, Optional, Callable, AsyncIterator, Awaitable
 from fastapi.security import OAuth2PasswordBearer
 from dotenv import load_dotenv
 import magic
 from typing import Tuple, Dict, Any
 import logging
+import asyncio
 import base64
+import hashlib
 import io
+import tempfile
+import re
+from pathlib import Path
+from urllib.parse import quote, urlencode
+from starlette.concurrency import run_in_threadpool
+from starlette.routing import Match
+from fastapi.dependencies.utils import get_flat_dependant
 from PIL import Image
 import httpx
 from collections import defaultdict
-from fastapi import Request
+from fastapi import Request, Query
 import random
 import string
 from typing import Dict
@@ -30,208 +38,20 @@ from typing import Dict
 # NEW: Import Resend SDK
 import resend
 
-try:
-    from pillow_heif import register_heif_opener
-    register_heif_opener()
-    HEIC_SUPPORTED = True
-    print("✅ HEIC support enabled")
-except ImportError:
-    HEIC_SUPPORTED = False
-    print("⚠️ HEIC support not available - install pillow-heif")
-
-class SmartImageCompressor:
-    MAX_SIZE_BYTES = 15 * 1024 * 1024  # 15MB threshold
-    MAX_FILE_SIZE = 50 * 1024 * 1024   # 50MB absolute maximum
-    
-    @staticmethod
-    def is_image_by_filename(filename: str) -> bool:
-        """Validate by file extension - includes HEIC"""
-        if not filename:
-            return False
-        
-        # Include HEIC since we can process them
-        valid_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.tiff', '.tif', '.heic', '.heif'}
-        
-        try:
-            file_extension = filename.lower().split('.')[-1]
-            return f'.{file_extension}' in valid_extensions
-        except:
-            return False
-    
-    @staticmethod
-    def is_image(file_content: bytes) -> Tuple[bool, str]:
-        """Validate if file is a valid image using PIL"""
-        try:
-            if not file_content or len(file_content) == 0:
-                return False, "File is empty"
-            
-            # Try to open the image with PIL (should work with HEIC if pillow-heif is installed)
-            image = Image.open(io.BytesIO(file_content))
-            
-            # Get basic info
-            width, height = image.size
-            format_type = image.format or "Unknown"
-            
-            # Check if dimensions are reasonable
-            if width <= 0 or height <= 0:
-                return False, "Invalid image dimensions"
-            
-            if width > 20000 or height > 20000:
-                return False, "Image dimensions too large (max 20000x20000)"
-            
-            # Verify the image by loading it
-            image.verify()
-            return True, f"Valid {format_type} image ({width}x{height})"
-            
-        except Exception as e:
-            return False, f"Invalid image file: {str(e)}"
-    
-    @staticmethod
-    def convert_to_web_format(
-        image_bytes: bytes,
-        max_width: int = 1920,
-        max_height: int = 1080,
-        quality: int = 85
-    ) -> Tuple[bytes, Dict[str, Any]]:
-        """Convert ANY image format to web-compatible JPEG"""
-        
-        original_size = len(image_bytes)
-        
-        try:
-            # Open image (works with HEIC if pillow-heif is installed)
-            image = Image.open(io.BytesIO(image_bytes))
-            original_dimensions = image.size
-            original_format = image.format or "Unknown"
-            original_mode = image.mode
-            
-            print(f"   📸 Converting {original_format} to JPEG: {original_dimensions} {original_mode}")
-            
-            # ALWAYS convert to RGB for consistent JPEG output
-            if image.mode in ('RGBA', 'LA', 'P'):
-                print(f"   🎨 Converting {image.mode} to RGB")
-                background = Image.new('RGB', image.size, (255, 255, 255))
-                if image.mode == 'P':
-                    image = image.convert('RGBA')
-                if image.mode in ('RGBA', 'LA'):
-                    background.paste(image, mask=image.split()[-1])
-                    image = background
-            elif image.mode != 'RGB':
-                print(f"   🎨 Converting {image.mode} to RGB")
-                image = image.convert('RGB')
-            
-            # Resize if needed
-            if image.size[0] > max_width or image.size[1] > max_height:
-                print(f"   📐 Resizing from {image.size} to fit {max_width}x{max_height}")
-                image.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
-            
-            # ALWAYS save as JPEG for web compatibility
-            output = io.BytesIO()
-            image.save(output, format='JPEG', quality=quality, optimize=True)
-            jpeg_bytes = output.getvalue()
-            
-            # Calculate stats
-            final_size = len(jpeg_bytes)
-            compression_ratio = final_size / original_size
-            savings_percent = round((1 - compression_ratio) * 100, 1)
-            
-            metadata = {
-                'original_size': original_size,
-                'final_size': final_size,
-                'original_dimensions': original_dimensions,
-                'final_dimensions': image.size,
-                'original_format': original_format,
-                'final_format': 'JPEG',
-                'original_mode': original_mode,
-                'compression_ratio': round(compression_ratio, 3),
-                'savings_percent': savings_percent,
-                'quality_used': quality,
-                'method': 'converted_to_jpeg',
-                'web_compatible': True
-            }
-            
-            return jpeg_bytes, metadata
-            
-        except Exception as e:
-            raise Exception(f"Image conversion failed: {str(e)}")
-    
-    @staticmethod
-    def compress_image(
-        image_bytes: bytes,
-        max_width: int = 1920,
-        max_height: int = 1080,
-        quality: int = 85
-    ) -> Tuple[bytes, Dict[str, Any]]:
-        """Compress image (wrapper for convert_to_web_format)"""
-        return SmartImageCompressor.convert_to_web_format(
-            image_bytes, max_width, max_height, quality
-        )
-    
-    @staticmethod
-    def progressive_compress(
-        image_bytes: bytes,
-        target_size: int = 5 * 1024 * 1024  # 5MB target
-    ) -> Tuple[bytes, Dict[str, Any]]:
-        """Progressive compression - always outputs JPEG"""
-        
-        print(f"   🎯 Target size: {target_size / (1024*1024):.1f}MB")
-        
-        # Try different quality levels
-        quality_levels = [85, 75, 65, 55, 45, 35]
-        
-        for quality in quality_levels:
-            try:
-                print(f"   🔧 Trying quality {quality}")
-                jpeg_bytes, metadata = SmartImageCompressor.convert_to_web_format(
-                    image_bytes, quality=quality
-                )
-                
-                if len(jpeg_bytes) <= target_size:
-                    print(f"   ✅ Target achieved with quality {quality}")
-                    metadata['compression_level'] = 'progressive'
-                    metadata['target_achieved'] = True
-                    return jpeg_bytes, metadata
-                    
-            except Exception as e:
-                print(f"   ⚠️ Quality {quality} failed: {e}")
-                continue
-        
-        # Try dimension reduction
-        try:
-            scale_factors = [0.8, 0.6, 0.4, 0.3]
-            
-            for scale in scale_factors:
-                max_w = int(1920 * scale)
-                max_h = int(1080 * scale)
-                
-                print(f"   📏 Trying {scale*100}% scale ({max_w}x{max_h})")
-                
-                jpeg_bytes, metadata = SmartImageCompressor.convert_to_web_format(
-                    image_bytes,
-                    max_width=max_w,
-                    max_height=max_h,
-                    quality=35
-                )
-                
-                if len(jpeg_bytes) <= target_size:
-                    print(f"   ✅ Target achieved with {scale*100}% scale")
-                    metadata['compression_level'] = 'progressive_with_resize'
-                    metadata['scale_factor'] = scale
-                    metadata['target_achieved'] = True
-                    return jpeg_bytes, metadata
-                    
-        except Exception as e:
-            print(f"   ⚠️ Progressive resize failed: {e}")
-        
-        # Best effort fallback
-        try:
-            jpeg_bytes, metadata = SmartImageCompressor.convert_to_web_format(
-                image_bytes, quality=20, max_width=800, max_height=600
-            )
-            metadata['compression_level'] = 'maximum_effort'
-            metadata['target_achieved'] = False
-            return jpeg_bytes, metadata
-        except Exception as e:
-            raise Exception(f"All compression methods failed: {str(e)}")
+from image_processing import SmartImageCompressor, ImageProcessingExecutor, ImageProcessingBusy
+from password_hashing import PasswordHasher, PasswordHashingBusy, VerifiedPassword
+from blob_compression import CompressedBlobStore
+from email_outbox import EmailOutbox
+from email_templates import EmailTemplateRegistry, RenderedEmail
+from email_transport import create_email_transport
+from blob_store import create_blob_store, is_blob_id
+from http_caching import IMMUTABLE_CACHE_CONTROL, ranged_stream_response, etag_matches, not_modified_response
+from rendition_cache import RenditionCache
+from response_cache import CachedResponse, create_response_cache
+from single_flight import SingleFlight
+from snapshot_publisher import SnapshotPublisher, preferred_encoding
+from pagination import MAX_PAGE_SIZE, fetch_page, set_next_cursor
+from json_streaming import DEFAULT_STREAM_BATCH_SIZE, MAX_STREAM_BATCH_SIZE, NDJSON_MEDIA_TYPE, stream_documents, wants_ndjson
 
 # Initialize the compressor
 image_compressor = SmartImageCompressor()
@@ -239,6 +59,31 @@ image_compressor = SmartImageCompressor()
 # Load environment variables
 load_dotenv()
 
+# All compressor work runs in a bounded process pool so uploads never block the event loop
+image_executor = ImageProcessingExecutor()
+
+async def run_image_task(fn, *args, **kwargs):
+    """Run a compressor call in the image worker pool, answering 503 when it is saturated"""
+    try:
+        return await image_executor.run(fn, *args, **kwargs)
+    except ImageProcessingBusy as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+
+# On-demand renditions get their own pool, and wait their turn rather than failing:
+# a cold gallery asks for dozens of thumbnails at once and browsers never retry an <img>
+rendition_executor = ImageProcessingExecutor(
+    max_workers=int(os.getenv("RENDITION_WORKERS", min(2, os.cpu_count() or 1))),
+    max_queue=int(os.getenv("RENDITION_QUEUE_LIMIT", 4)),
+    wait_timeout=float(os.getenv("RENDITION_WAIT_SECONDS", 30))
+)
+
+async def run_rendition_task(fn, *args, **kwargs):
+    """Run a rendition in its worker pool, answering 503 only if no slot frees up in time"""
+    try:
+        return await rendition_executor.run(fn, *args, **kwargs)
+    except ImageProcessingBusy as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+
 # NEW: Configure Resend API
 RESEND_API_KEY = os.getenv("RESEND_API_KEY")
 if not RESEND_API_KEY:
@@ -250,6 +95,8 @@ EMAIL_FROM = "E&S Decorations <noreply@esdecorations.in>"
 
 EMAIL_FROM_NAME = "E&S Decorations"
 
+EMAIL_REPLY_TO = "esdecorationsind@gmail.com"
+
 
 # Constants
 SECRET_KEY = os.getenv("SECRET_KEY", "miniproject")
@@ -266,6 +113,167 @@ TIME_WINDOW = 3600
 # FastAPI Instance
 app = FastAPI()
 
+# Public origin used when image IDs are expanded to URLs (defaults to the request's own origin)
+PUBLIC_BASE_URL = os.getenv("PUBLIC_BASE_URL", "").rstrip("/")
+
+# Multipart framing on top of the file itself
+UPLOAD_FORM_OVERHEAD = 64 * 1024
+MAX_RESUME_SIZE = 5 * 1024 * 1024  # Matches the careers form limit
+# path -> (max file size, 413 detail); the details are defined further down, hence the lambdas
+UPLOAD_SIZE_LIMITS = {
+    "/upload-image": (image_compressor.MAX_FILE_SIZE, lambda: file_too_large_detail()),
+    "/test-compression": (image_compressor.MAX_FILE_SIZE, lambda: file_too_large_detail()),
+    "/job-applications/upload": (MAX_RESUME_SIZE, lambda: RESUME_TOO_LARGE_DETAIL)
+}
+
+# Registered before CORS so the 413 still carries CORS headers
+@app.middleware("http")
+async def reject_oversized_uploads(request: Request, call_next):
+    """Refuse uploads whose declared size is over the cap before the body is read"""
+    if request.url.path in UPLOAD_SIZE_LIMITS:
+        max_size, detail = UPLOAD_SIZE_LIMITS[request.url.path]
+        content_length = request.headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > max_size + UPLOAD_FORM_OVERHEAD:
+            return JSONResponse(status_code=413, content={"detail": detail()})
+    return await call_next(request)
+
+# Public reads are answered from pre-serialised bodies; writes invalidate their namespace.
+# First path segment -> namespace (the backing collection)
+CACHED_READ_NAMESPACES = {
+    "events": "events",
+    "gallery-events": "events",
+    "latest-works": "latest_works",
+    "faqs": "faqs",
+    "job-listings": "job_listings"
+}
+# Response headers that are part of a cached body's meaning
+CACHED_RESPONSE_HEADERS = ("content-type", "x-next-cursor", "link")
+# Browsers may keep cached reads but must revalidate them (cheaply, via ETag) every time
+CACHED_READ_CACHE_CONTROL = "no-cache"
+response_cache = create_response_cache()
+# Concurrent identical reads on a cold cache share one query + serialisation
+read_flights = SingleFlight()
+
+def cached_read_response(request: Request, cached: CachedResponse, cache_status: str) -> Response:
+    """Send a cached body, or 304 when the client already holds this version"""
+    etag = cached.headers["etag"]
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        response = not_modified_response(etag, CACHED_READ_CACHE_CONTROL)
+    else:
+        response = Response(
+            content=cached.body,
+            headers={**cached.headers, "Cache-Control": CACHED_READ_CACHE_CONTROL, "X-Cache": cache_status}
+        )
+    # Accept picks JSON or NDJSON for the same URL, so browser and proxy caches must key on it too
+    response.headers["Vary"] = "Accept"
+    return response
+
+# Route path -> names of the query parameters its endpoint declares
+route_query_params: Dict[str, frozenset] = {}
+
+def declared_query_params(request: Request) -> Optional[frozenset]:
+    """Query parameters the matched endpoint reads, or None if no route matches"""
+    for route in app.router.routes:
+        if getattr(route, "dependant", None) is None or route.matches(request.scope)[0] != Match.FULL:
+            continue
+        if route.path not in route_query_params:
+            route_query_params[route.path] = frozenset(
+                param.alias for param in get_flat_dependant(route.dependant).query_params
+            )
+        return route_query_params[route.path]
+    return None
+
+@app.middleware("http")
+async def serve_cached_reads(request: Request, call_next):
+    namespace = CACHED_READ_NAMESPACES.get(request.url.path.split("/")[1]) if request.method == "GET" else None
+    params = declared_query_params(request) if namespace else None
+    if params is None:
+        return await call_next(request)
+
+    # Parameters the endpoint ignores (tracking tags, cache busters) are dropped before it
+    # runs, so they cannot reach the body or the Link header and need no key of their own
+    query = urlencode(sorted(item for item in request.query_params.multi_items() if item[0] in params))
+    request.scope["query_string"] = query.encode("latin-1")
+    media_type = NDJSON_MEDIA_TYPE if wants_ndjson(request) else "application/json"
+    # Image URLs follow the request's host unless PUBLIC_BASE_URL pins them
+    base = "" if PUBLIC_BASE_URL else str(request.base_url)
+    key = f"{base}{request.url.path}?{query}|{media_type}"
+    cached = await response_cache.get(namespace, key)
+    if cached:
+        return cached_read_response(request, cached, "HIT")
+
+    rendered_here = False
+
+    async def render() -> Tuple[int, CachedResponse]:
+        nonlocal rendered_here
+        rendered_here = True
+        version = await response_cache.version(namespace)
+        response = await call_next(request)
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        if response.status_code != 200:
+            return response.status_code, CachedResponse(body, dict(response.headers))
+
+        headers = {name: value for name, value in response.headers.items() if name in CACHED_RESPONSE_HEADERS}
+        # Content hash, so any change to the payload (a write, a new host, ...) changes the tag
+        headers["etag"] = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        rendered = CachedResponse(body, headers)
+        await response_cache.set(namespace, key, rendered, version)
+        return 200, rendered
+
+    try:
+        status_code, rendered = await read_flights.do((namespace, key), render)
+    except (Exception, asyncio.CancelledError):
+        # The shared render runs inside the leading request, so it dies with it
+        # (e.g. that client disconnected); followers then render for themselves
+        if rendered_here or asyncio.current_task().cancelling():
+            raise
+        status_code, rendered = await render()
+    if status_code != 200:
+        return Response(content=rendered.body, status_code=status_code, headers=rendered.headers)
+    return cached_read_response(request, rendered, "MISS")
+
+# The public site reads these pre-rendered files instead of the live listings, so its
+# traffic never reaches Mongo. Snapshot name -> the public read it is rendered from
+SNAPSHOT_SOURCES = {
+    "faqs": "/faqs",
+    "gallery-events": "/gallery-events?view=summary",
+    "latest-works": "/latest-works",
+    "job-listings": "/job-listings?active=true"
+}
+# Cache namespace -> snapshots rendered from it
+SNAPSHOT_NAMESPACES = {
+    "events": ("gallery-events",),
+    "latest_works": ("latest-works",),
+    "faqs": ("faqs",),
+    "job_listings": ("job-listings",)
+}
+SNAPSHOT_FILE_PATTERN = re.compile(r"^([a-z0-9-]+)(?:\.([0-9a-f]{16}))?\.json$")
+# The unversioned URL moves with every publish; clients revalidate it via ETag
+SNAPSHOT_CACHE_CONTROL = "no-cache"
+
+def snapshot_source(path: str) -> Callable[[str], Awaitable[bytes]]:
+    """Render a public read in-process, so a snapshot is byte for byte what the live endpoint returns"""
+    async def render(base_url: str) -> bytes:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url=base_url) as client:
+            response = await client.get(path)
+        response.raise_for_status()
+        return response.content
+    return render
+
+snapshot_publisher = SnapshotPublisher(
+    os.getenv("SNAPSHOT_DIR", os.path.join(os.path.dirname(__file__), "snapshots")),
+    {name: snapshot_source(path) for name, path in SNAPSHOT_SOURCES.items()},
+    base_url=PUBLIC_BASE_URL
+)
+
+@app.middleware("http")
+async def publish_snapshots_after_writes(request: Request, call_next):
+    response = await call_next(request)
+    namespace = CACHED_READ_NAMESPACES.get(request.url.path.split("/")[1])
+    if request.method in ("POST", "PUT", "PATCH", "DELETE") and namespace and response.status_code < 400:
+        snapshot_publisher.schedule(SNAPSHOT_NAMESPACES[namespace], str(request.base_url).rstrip("/"))
+    return response
+
 # CORS Middleware - Updated for production
 app.add_middleware(
     CORSMiddleware,
@@ -278,8 +286,28 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Pagination cursors for the list endpoints travel in headers
+    expose_headers=["X-Next-Cursor", "Link"],
 )
 
+@app.on_event("shutdown")
+async def shutdown_image_executor():
+    image_executor.shutdown()
+    rendition_executor.shutdown()
+
+@app.on_event("startup")
+async def refresh_snapshots():
+    # Pick up writes made while this process was down; until a rebuild succeeds
+    # the snapshots already on disk keep being served
+    if snapshot_publisher.base_url:
+        snapshot_publisher.schedule(SNAPSHOT_SOURCES)
+    else:
+        print("⚠️ Snapshots will be published after the first admin write (set PUBLIC_BASE_URL to publish on startup)")
+
+@app.on_event("shutdown")
+async def stop_snapshot_publisher():
+    await snapshot_publisher.close()
+
 # MongoDB Connection
 MONGO_URI = os.getenv("MONGODB_URL", "mongodb://127.0.0.1:27017")
 DB_NAME = os.getenv("DB_NAME", "ESWEBSITE")
@@ -292,6 +320,35 @@ latest_works_collection = db["latest_works"]
 job_applications_collection = db["job_applications"]
 job_listings_collection = db["job_listings"]
 events_collection = db["events"]  
+email_outbox_collection = db["email_outbox"]
+
+# Keyset pagination sort orders; each list endpoint has an index matching its filter + sort
+ID_ORDER = [("_id", 1)]
+INQUIRY_ORDER = [("created_at", -1), ("_id", -1)]
+
+@app.on_event("startup")
+async def create_indexes():
+    try:
+        await events_collection.create_index([("type", 1), ("_id", 1)])
+        await contacts_collection.create_index([("is_solved", 1), *INQUIRY_ORDER])
+    except Exception as e:
+        print(f"⚠️ Could not create indexes: {str(e)}")
+
+# Image bytes live in a content-addressed blob store; documents only hold image IDs
+image_store = create_blob_store(db, "images")
+# Resumes too, zstd-compressed at rest; applications keep only a small resume_file reference
+resume_store = CompressedBlobStore(create_blob_store(db, "resumes"))
+
+# Resized/re-encoded renditions of stored images, generated on first request
+RENDITION_WIDTHS = (320, 640, 1280, 1920)
+RENDITION_FORMATS = {"jpeg": "image/jpeg", "webp": "image/webp"}
+rendition_cache = RenditionCache(
+    os.getenv("RENDITION_CACHE_DIR", os.path.join(os.path.dirname(__file__), "rendition_cache")),
+    max_bytes=int(os.getenv("RENDITION_CACHE_MAX_MB", 512)) * 1024 * 1024
+)
+rendition_flights = SingleFlight()
+# Rendition set produced eagerly by /upload-image?renditions=true
+UPLOAD_RENDITIONS = {"thumbnail": 320, "medium": 1280, "full": 1920}
 
 # REMOVED: Initialize FastMail
 # fm = FastMail(email_conf)
@@ -351,15 +408,101 @@ class RequestVerificationCode(BaseModel):
 
 verification_codes: Dict[str, Dict] = {}
 
+# Heavy fields left out of ?view=summary lists; the detail endpoints return them
+SUMMARY_EXCLUDED_FIELDS = ("images", "details")
+FIELD_NAME_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+def list_projection(fields: Optional[str], view: str) -> Optional[Dict[str, int]]:
+    """Mongo projection for ?fields=a,b (only those fields) or ?view=summary (no heavy fields)"""
+    if fields:
+        names = [name.strip() for name in fields.split(",") if name.strip()]
+        invalid = [name for name in names if not FIELD_NAME_PATTERN.match(name)]
+        if invalid:
+            raise HTTPException(status_code=400, detail=f"Invalid field name(s): {', '.join(invalid)}")
+        projection = {name: 1 for name in names}
+        if any(field in projection for field in IMAGE_FIELDS):
+            projection["placeholders"] = 1
+        return projection
+    if view == "summary":
+        return {field: 0 for field in SUMMARY_EXCLUDED_FIELDS}
+    if view != "full":
+        raise HTTPException(status_code=400, detail="view must be one of: full, summary")
+    return None
+
+async def find_one_presented(
+    collection,
+    document_id: str,
+    request: Request,
+    not_found: str,
+    query: Optional[dict] = None
+) -> dict:
+    """Fetch a single document by ID for the detail endpoints, with image URLs expanded"""
+    if not ObjectId.is_valid(document_id):
+        raise HTTPException(status_code=400, detail="Invalid ID format")
+    document = await collection.find_one({"_id": ObjectId(document_id), **(query or {})})
+    if not document:
+        raise HTTPException(status_code=404, detail=not_found)
+    document["_id"] = str(document["_id"])
+    return present_image_fields(document, request)
+
+def with_string_id(document: dict) -> dict:
+    document["_id"] = str(document["_id"])
+    return document
+
+async def list_documents(
+    request: Request,
+    response: Response,
+    collection,
+    query: dict,
+    sort,
+    present: Callable[[dict], dict],
+    limit: Optional[int],
+    cursor: Optional[str],
+    batch_size: int,
+    projection: Optional[Dict[str, int]] = None
+):
+    """Body shared by the list endpoints.
+
+    With limit or cursor this returns one keyset page. Without them the whole
+    listing is streamed from the Mongo cursor a batch at a time (a JSON array,
+    or NDJSON for Accept: application/x-ndjson) instead of being built in memory.
+    """
+    if limit is None and cursor is None:
+        documents = collection.find(query, projection).sort(list(sort))
+        return stream_documents(request, documents, present, batch_size)
+
+    documents, next_cursor = await fetch_page(collection, query, sort, limit, cursor, projection)
+    set_next_cursor(response, request, next_cursor)
+    return [present(document) for document in documents]
+
 # Event Management Endpoints
 @app.get("/events")
-async def get_events():
+async def get_events(
+    request: Request,
+    response: Response,
+    view: str = "full",
+    fields: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    batch_size: int = Query(DEFAULT_STREAM_BATCH_SIZE, ge=1, le=MAX_STREAM_BATCH_SIZE)
+):
+    try:
+        return await list_documents(
+            request, response, events_collection, {}, ID_ORDER,
+            lambda event: present_image_fields(with_string_id(event), request),
+            limit, cursor, batch_size, list_projection(fields, view)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/events/{event_id}")
+async def get_event(event_id: str, request: Request):
     try:
-        events = await events_collection.find().to_list(length=None)
-        # Convert ObjectId to string for each event
-        for event in events:
-            event["_id"] = str(event["_id"])
-        return events
+        return await find_one_presented(events_collection, event_id, request, "Event not found")
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -367,6 +510,7 @@ async def get_events():
 async def create_event(event: EventCreate):
     try:
         result = await events_collection.insert_one(event.dict())
+        await response_cache.invalidate("events")
         if result.inserted_id:
             created_event = await events_collection.find_one(
                 {"_id": result.inserted_id}
@@ -384,6 +528,7 @@ async def update_event(event_id: str, event: EventUpdate):
             {"_id": ObjectId(event_id)},
             {"$set": event.dict()}
         )
+        await response_cache.invalidate("events")
         if result.modified_count == 0:
             raise HTTPException(status_code=404, detail="Event not found")
         updated_event = await events_collection.find_one(
@@ -402,6 +547,7 @@ async def delete_event(event_id: str):
         result = await events_collection.delete_one(
             {"_id": ObjectId(event_id)}
         )
+        await response_cache.invalidate("events")
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Event not found")
         return {"message": "Event deleted successfully"}
@@ -410,235 +556,154 @@ async def delete_event(event_id: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-# NEW: Updated function to send acceptance email using Resend
-async def send_acceptance_email(applicant_name: str, applicant_email: str):
-    """Send job acceptance email using Resend API"""
-    try:
-        # Create the email content
-        subject = "Welcome to E&S Decorations!"
-        
-        # HTML version of the email
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Welcome to E&S Decorations</title>
-        </head>
-        <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; text-align: center; border-radius: 10px 10px 0 0;">
-                <h1 style="color: white; margin: 0; font-size: 28px;">Welcome to E&S Decorations!</h1>
-            </div>
-            
-            <div style="background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
-                <p style="font-size: 18px; margin-bottom: 20px;">Dear <strong>{applicant_name}</strong>,</p>
-                
-                <p style="margin-bottom: 20px;">
-                    Thank you for your interest in E&S Decorations. After reviewing your application, 
-                    we are <strong style="color: #667eea;">pleased to offer you a position</strong> on our team!
-                </p>
-                
-                <div style="background: #e8f4fd; padding: 20px; border-left: 4px solid #667eea; margin: 20px 0;">
-                    <p style="margin: 0; font-weight: bold; color: #667eea;">What's Next?</p>
-                    <p style="margin: 10px 0 0 0;">
-                        Our recruiting team will be in touch soon with the next steps, including:
-                    </p>
-                    <ul style="margin: 10px 0 0 20px;">
-                        <li>Contract signing details</li>
-                        <li>Onboarding information</li>
-                        <li>Your official start date</li>
-                    </ul>
-                </div>
-                
-                <p style="margin-bottom: 20px;">
-                    If you have any questions in the meantime, feel free to reach out to us. 
-                    We're excited to have you join our growing team!
-                </p>
-                
-                <div style="text-align: center; margin: 30px 0;">
-                    <div style="background: #667eea; color: white; padding: 15px 30px; border-radius: 25px; display: inline-block;">
-                        <strong>🎉 Welcome Aboard! 🎉</strong>
-                    </div>
-                </div>
-                
-                <p style="margin-bottom: 5px;"><strong>Best regards,</strong></p>
-                <p style="margin-top: 0; color: #667eea; font-weight: bold;">E&S Decorations Recruiting Team</p>
-            </div>
-            
-            <div style="text-align: center; margin-top: 20px; color: #666; font-size: 12px;">
-                <p>© 2025 E&S Decorations. All rights reserved.</p>
-            </div>
-        </body>
-        </html>
-        """
-        
-        # Plain text version of the email
-        plain_text = f"""
-        Dear {applicant_name},
+# Shared, keep-alive connection pool to Resend (EMAIL_TRANSPORT=sdk for the Resend SDK)
+email_transport = create_email_transport(RESEND_API_KEY)
 
-        Thank you for your interest in E&S Decorations. After reviewing your application, we are pleased to offer you a position on our team!
+async def deliver_email(params: dict) -> str:
+    """Send one email through Resend; returns the Resend email ID"""
+    return await email_transport.send(params)
 
-        What's Next?
-        Our recruiting team will be in touch soon with the next steps, including:
-        • Contract signing details
-        • Onboarding information  
-        • Your official start date
+# Handlers queue their emails here and return; background workers deliver them
+email_outbox = EmailOutbox(
+    email_outbox_collection,
+    deliver_email,
+    send_batch=email_transport.send_batch,
+    workers=int(os.getenv("EMAIL_OUTBOX_WORKERS", 2))
+)
 
-        If you have any questions in the meantime, feel free to reach out to us. We're excited to have you join our growing team!
+@app.on_event("startup")
+async def start_email_outbox():
+    try:
+        await email_outbox.create_indexes()
+    except Exception as e:
+        print(f"⚠️ Could not create email outbox indexes: {str(e)}")
+    email_outbox.start()
+
+@app.on_event("shutdown")
+async def stop_email_outbox():
+    await email_outbox.stop()
+    await email_transport.close()
+
+OUTBOX_ORDER = [("created_at", -1), ("_id", -1)]
+OUTBOX_STATUSES = ("pending", "sending", "sent", "dead")
+
+@app.get("/email-outbox")
+async def get_email_outbox(
+    request: Request,
+    response: Response,
+    status: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    batch_size: int = Query(DEFAULT_STREAM_BATCH_SIZE, ge=1, le=MAX_STREAM_BATCH_SIZE)
+):
+    """Queued and delivered emails, newest first (?status=dead for the dead letters)"""
+    try:
+        if status is not None and status not in OUTBOX_STATUSES:
+            raise HTTPException(status_code=400, detail=f"status must be one of: {', '.join(OUTBOX_STATUSES)}")
+        return await list_documents(
+            request, response, email_outbox_collection,
+            {} if status is None else {"status": status}, OUTBOX_ORDER,
+            with_string_id, limit, cursor, batch_size,
+            {"params.html": 0, "params.text": 0}
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
-        🎉 Welcome Aboard! 🎉
+@app.post("/email-outbox/{outbox_id}/retry")
+async def retry_outbox_email(outbox_id: str):
+    """Put a dead-lettered email back in the queue"""
+    try:
+        if not ObjectId.is_valid(outbox_id):
+            raise HTTPException(status_code=400, detail="Invalid outbox ID format")
+        if not await email_outbox.retry(outbox_id):
+            raise HTTPException(status_code=404, detail="No dead-lettered email with that ID")
+        return {"message": "Email queued for another delivery attempt"}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
-        Best regards,
-        E&S Decorations Recruiting Team
+# Compiled once at import; a template error stops startup instead of a send
+email_templates = EmailTemplateRegistry(globals={
+    "contact_email": EMAIL_REPLY_TO,
+    "email_from": EMAIL_FROM
+}).load()
 
-        © 2025 E&S Decorations. All rights reserved.
-        """
+def rendered_email_params(email: RenderedEmail, to: List[str]) -> dict:
+    return {
+        "from": EMAIL_FROM,
+        "to": to,
+        "subject": email.subject,
+        "html": email.html,
+        "text": email.text,
+        "reply_to": EMAIL_REPLY_TO
+    }
 
-        # Send email using Resend
-        params: resend.Emails.SendParams = {
-            "from": EMAIL_FROM,
-            "to": [applicant_email],
-            "subject": subject,
-            "html": html_content,
-            "text": plain_text,
-            "reply_to": "esdecorationsind@gmail.com"
-        }
+def email_params(template: str, to: List[str], **context) -> dict:
+    """Resend params for one rendered email template"""
+    return rendered_email_params(email_templates.render(template, **context), to)
 
-        email_response = resend.Emails.send(params)
-        
-        # Handle different response formats
-        email_id = None
-        if hasattr(email_response, 'id'):
-            email_id = email_response.id
-        elif isinstance(email_response, dict) and 'id' in email_response:
-            email_id = email_response['id']
-        else:
-            email_id = "unknown"
-            
-        print(f"✅ Acceptance email sent successfully to {applicant_email}. Email ID: {email_id}")
-        return email_response
+def email_params_many(template: str, recipients: List[Tuple[str, Dict[str, Any]]]) -> List[dict]:
+    """Resend params for one template sent to many (address, context) pairs, rendered as a batch"""
+    emails = email_templates.render_many(template, [context for _, context in recipients])
+    return [rendered_email_params(email, [address]) for email, (address, _) in zip(emails, recipients)]
 
-    except Exception as e:
-        print(f"❌ Error sending acceptance email: {str(e)}")
-        raise Exception(f"Failed to send acceptance email: {str(e)}")
+@app.get("/email-templates")
+async def get_email_templates():
+    """Names of the email templates that can be previewed"""
+    return {"templates": email_templates.names()}
 
-async def send_rejection_email(applicant_name: str, applicant_email: str):
-    """Send job rejection email using Resend API"""
+@app.get("/email-templates/{name}/preview")
+async def preview_email_template(name: str, format: str = "html"):
+    """An email template rendered with sample values; the subject is sent percent-encoded in X-Email-Subject"""
     try:
-        # Create the email content
-        subject = "Thank you for your interest in E&S Decorations"
-        
-        # HTML version of the email
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Thank you for your interest in E&S Decorations</title>
-        </head>
-        <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; text-align: center; border-radius: 10px 10px 0 0;">
-                <h1 style="color: white; margin: 0; font-size: 28px;">Thank you for your interest in E&S Decorations</h1>
-            </div>
-            
-            <div style="background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
-                <p style="font-size: 18px; margin-bottom: 20px;">Dear <strong>{applicant_name}</strong>,</p>
-                
-                <p style="margin-bottom: 20px;">
-                    Thank you for taking the time to apply for a position at E&S Decorations. 
-                    We appreciate your interest in joining our team and the effort you put into your application.
-                </p>
-                
-                <p style="margin-bottom: 20px;">
-                    After careful consideration of all applications, we have decided to 
-                    <strong style="color: #e74c3c;">move forward with other candidates</strong> 
-                    whose qualifications more closely match our current needs.
-                </p>
-                
-                <div style="background: #fef9e7; padding: 20px; border-left: 4px solid #f39c12; margin: 20px 0;">
-                    <p style="margin: 0; font-weight: bold; color: #f39c12;">We Encourage You To:</p>
-                    <ul style="margin: 10px 0 0 20px;">
-                        <li>Keep an eye on our future job openings</li>
-                        <li>Continue developing your skills and experience</li>
-                        <li>Apply again when suitable positions become available</li>
-                    </ul>
-                </div>
-                
-                <p style="margin-bottom: 20px;">
-                    We were impressed by your background and encourage you to apply for future opportunities 
-                    that may be a better fit. We will keep your application on file and may reach out 
-                    if a suitable position becomes available.
-                </p>
-                
-                <div style="text-align: center; margin: 30px 0;">
-                    <div style="background: #667eea; color: white; padding: 15px 30px; border-radius: 25px; display: inline-block;">
-                        <strong>🌟 Best of Luck in Your Job Search! 🌟</strong>
-                    </div>
-                </div>
-                
-                <p style="margin-bottom: 5px;"><strong>Best regards,</strong></p>
-                <p style="margin-top: 0; color: #667eea; font-weight: bold;">E&S Decorations Recruiting Team</p>
-            </div>
-            
-            <div style="text-align: center; margin-top: 20px; color: #666; font-size: 12px;">
-                <p>© 2025 E&S Decorations. All rights reserved.</p>
-            </div>
-        </body>
-        </html>
-        """
-        
-        # Plain text version of the email
-        plain_text = f"""
-        Dear {applicant_name},
-
-        Thank you for taking the time to apply for a position at E&S Decorations. We appreciate your interest in joining our team and the effort you put into your application.
-
-        After careful consideration of all applications, we have decided to move forward with other candidates whose qualifications more closely match our current needs.
-
-        We Encourage You To:
-        • Keep an eye on our future job openings
-        • Continue developing your skills and experience
-        • Apply again when suitable positions become available
-
-        We were impressed by your background and encourage you to apply for future opportunities that may be a better fit. We will keep your application on file and may reach out if a suitable position becomes available.
+        if name not in email_templates.names():
+            raise HTTPException(status_code=404, detail="Email template not found")
+        if format not in ("html", "text"):
+            raise HTTPException(status_code=400, detail="format must be one of: html, text")
+        email = email_templates.render_sample(name)
+        headers = {"X-Email-Subject": quote(email.subject, safe=" &-!?,")}
+        if format == "text":
+            return PlainTextResponse(email.text, headers=headers)
+        return HTMLResponse(email.html, headers=headers)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
-        🌟 Best of Luck in Your Job Search! 🌟
+def acceptance_email_params(applicant_name: str, applicant_email: str) -> dict:
+    """Resend params for the job acceptance email"""
+    return email_params("acceptance", [applicant_email], applicant_name=applicant_name)
 
-        Best regards,
-        E&S Decorations Recruiting Team
+async def send_acceptance_email(applicant_name: str, applicant_email: str):
+    """Queue job acceptance email for delivery through Resend; returns the outbox ID"""
+    try:
+        params = acceptance_email_params(applicant_name, applicant_email)
+        outbox_id = await email_outbox.enqueue(params, kind="acceptance")
+        print(f"📨 Acceptance email to {applicant_email} queued ({outbox_id})")
+        return outbox_id
 
-        © 2025 E&S Decorations. All rights reserved.
-        """
+    except Exception as e:
+        print(f"❌ Error queueing acceptance email: {str(e)}")
+        raise Exception(f"Failed to queue acceptance email: {str(e)}")
 
-        # Send email using Resend
-        params: resend.Emails.SendParams = {
-            "from": EMAIL_FROM,
-            "to": [applicant_email],
-            "subject": subject,
-            "html": html_content,
-            "text": plain_text,
-            "reply_to": "esdecorationsind@gmail.com"
-        }
+def rejection_email_params(applicant_name: str, applicant_email: str) -> dict:
+    """Resend params for the job rejection email"""
+    return email_params("rejection", [applicant_email], applicant_name=applicant_name)
 
-        email_response = resend.Emails.send(params)
-        
-        # Handle different response formats
-        email_id = None
-        if hasattr(email_response, 'id'):
-            email_id = email_response.id
-        elif isinstance(email_response, dict) and 'id' in email_response:
-            email_id = email_response['id']
-        else:
-            email_id = "unknown"
-            
-        print(f"✅ Rejection email sent successfully to {applicant_email}. Email ID: {email_id}")
-        return email_response
+async def send_rejection_email(applicant_name: str, applicant_email: str):
+    """Queue job rejection email for delivery through Resend; returns the outbox ID"""
+    try:
+        params = rejection_email_params(applicant_name, applicant_email)
+        outbox_id = await email_outbox.enqueue(params, kind="rejection")
+        print(f"📨 Rejection email to {applicant_email} queued ({outbox_id})")
+        return outbox_id
 
     except Exception as e:
-        print(f"❌ Error sending rejection email: {str(e)}")
-        raise Exception(f"Failed to send rejection email: {str(e)}")
+        print(f"❌ Error queueing rejection email: {str(e)}")
+        raise Exception(f"Failed to queue rejection email: {str(e)}")
 
 # Models
 class EmailSchema(BaseModel):
@@ -696,14 +761,44 @@ class ReplySchema(BaseModel):
     plain_text_body: str
     html_body: str
 
-# Password Hashing
-def hash_password(password: str) -> str:
-    salt = bcrypt.gensalt()
-    hashed_password = bcrypt.hashpw(password.encode("utf-8"), salt)
-    return hashed_password.decode("utf-8")
+# Password Hashing - bcrypt runs in its own bounded thread pool, never on the event loop
+password_hasher = PasswordHasher()
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+async def run_password_task(fn, *args):
+    """Run a password hasher call, answering 503 when the hashing pool is saturated"""
+    try:
+        return await fn(*args)
+    except PasswordHashingBusy as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+
+async def hash_password(password: str) -> str:
+    return await run_password_task(password_hasher.hash, password)
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await run_password_task(password_hasher.verify, plain_password, hashed_password)
+
+async def verify_admin_password(admin: dict, plain_password: str) -> Optional[str]:
+    """Check an admin's password; returns the stored hash (upgraded if BCRYPT_ROUNDS changed) or None"""
+    verified, upgraded = await run_password_task(
+        password_hasher.verify_and_upgrade, plain_password, admin["password"]
+    )
+    if not verified:
+        return None
+    if upgraded is None:
+        return admin["password"]
+    # Only replace the hash we checked, not one a concurrent password change just wrote
+    result = await admins_collection.update_one(
+        {"_id": admin["_id"], "password": admin["password"]},
+        {"$set": {"password": upgraded}}
+    )
+    if result.modified_count == 0:
+        return admin["password"]
+    print(f"🔐 Rehashed password of admin {admin['email']} with cost {password_hasher.rounds}")
+    return upgraded
+
+@app.on_event("shutdown")
+async def shutdown_password_hasher():
+    password_hasher.shutdown()
 
 # Generate JWT Token
 def create_access_token(data: dict, expires_delta: datetime.timedelta | None = None):
@@ -906,32 +1001,84 @@ async def health_check():
     return {
         "status": "healthy", 
         "timestamp": timestamp,
-        "uptime": os.times().elapsed if hasattr(os, 'times') else 0
+        "uptime": os.times().elapsed if hasattr(os, 'times') else 0,
+        "response_cache": response_cache.stats(),
+        "read_coalescing": read_flights.stats(),
+        "snapshots": snapshot_publisher.stats(),
+        "email_outbox": email_outbox.stats(),
+        "password_hashing": password_hasher.stats()
+    }
+
+@app.get("/snapshots/{filename}")
+async def get_snapshot(filename: str, request: Request):
+    """Published snapshot of a public listing, served from disk without touching the database.
+
+    /snapshots/<name>.json is the current version; /snapshots/<name>.<version>.json
+    addresses one version and is immutable. gzip/brotli variants are pre-built.
+    """
+    match = SNAPSHOT_FILE_PATTERN.match(filename)
+    if not match or match.group(1) not in SNAPSHOT_SOURCES:
+        raise HTTPException(status_code=404, detail="Snapshot not found")
+    name, version = match.groups()
+
+    entry = snapshot_publisher.current(name)
+    if entry is None:
+        # Nothing published yet: answer from the live listing instead
+        return RedirectResponse(SNAPSHOT_SOURCES[name], status_code=307)
+    if version is None:
+        version, cache_control = entry["version"], SNAPSHOT_CACHE_CONTROL
+    elif version in entry["versions"]:
+        cache_control = IMMUTABLE_CACHE_CONTROL
+    else:
+        raise HTTPException(status_code=404, detail="Snapshot version not found")
+
+    etag = f'"{version}"'
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified_response(etag, cache_control)
+
+    encoding = preferred_encoding(request.headers.get("accept-encoding"), entry["encodings"])
+    path = snapshot_publisher.path(name, version, encoding)
+    if not os.path.isfile(path):
+        raise HTTPException(status_code=404, detail="Snapshot version not found")
+    headers = {
+        "ETag": etag,
+        "Cache-Control": cache_control,
+        "Vary": "Accept-Encoding",
+        "Content-Location": f"/snapshots/{name}.{version}.json"
+    }
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return FileResponse(path, media_type="application/json", headers=headers)
+
+def format_inquiry(inq: dict) -> dict:
+    # Convert ObjectId to string and format dates
+    return {
+        "id": str(inq["_id"]),
+        "name": inq["name"],
+        "email": inq["email"],
+        "subject": inq["subject"],
+        "message": inq["message"],
+        "is_solved": inq.get("is_solved", False),
+        "created_at": inq.get("created_at", datetime.datetime.utcnow()).isoformat()
     }
 
 # Fetch Unsolved Inquiries
 @app.get("/inquiries")
-async def get_inquiries():
+async def get_inquiries(
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    batch_size: int = Query(DEFAULT_STREAM_BATCH_SIZE, ge=1, le=MAX_STREAM_BATCH_SIZE)
+):
     try:
         # Sort by created_at in descending order (newest first)
-        cursor = contacts_collection.find({"is_solved": False}).sort("created_at", -1)
-        inquiries = await cursor.to_list(length=None)
-        
-        # Convert ObjectId to string and format dates
-        formatted_inquiries = []
-        for inq in inquiries:
-            formatted_inq = {
-                "id": str(inq["_id"]),
-                "name": inq["name"],
-                "email": inq["email"],
-                "subject": inq["subject"],
-                "message": inq["message"],
-                "is_solved": inq.get("is_solved", False),
-                "created_at": inq.get("created_at", datetime.datetime.utcnow()).isoformat()
-            }
-            formatted_inquiries.append(formatted_inq)
-            
-        return formatted_inquiries
+        return await list_documents(
+            request, response, contacts_collection, {"is_solved": False}, INQUIRY_ORDER,
+            format_inquiry, limit, cursor, batch_size
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error fetching inquiries: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -976,110 +1123,19 @@ async def reply_to_inquiry(inquiry_id: str, reply: ReplySchema):
         recipient_name = inquiry.get("name", "Valued Customer")
         original_subject = inquiry.get("subject", "Your Inquiry")
 
-        # Create professional reply email
-        subject = f"Re: {original_subject} - E&S Decorations"
-        
-        # Enhanced HTML version
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Reply from E&S Decorations</title>
-        </head>
-        <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; text-align: center; border-radius: 10px 10px 0 0;">
-                <h1 style="color: white; margin: 0; font-size: 24px;">E&S Decorations</h1>
-                <p style="color: #f0f0f0; margin: 10px 0 0 0; font-size: 14px;">Thank you for reaching out to us</p>
-            </div>
-            
-            <div style="background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
-                <p style="font-size: 16px; margin-bottom: 20px;">Dear <strong>{recipient_name}</strong>,</p>
-                
-                <p style="margin-bottom: 20px;">
-                    Thank you for contacting E&S Decorations. We have received your inquiry and are pleased to respond:
-                </p>
-                
-                <div style="background: white; padding: 20px; border-left: 4px solid #667eea; margin: 20px 0; border-radius: 5px;">
-                    <p style="margin: 0; color: #666; font-size: 14px; font-weight: bold;">Your Original Message:</p>
-                    <p style="margin: 10px 0 0 0; font-style: italic; color: #555;">"{inquiry.get('message', '')[:150]}{'...' if len(inquiry.get('message', '')) > 150 else ''}"</p>
-                </div>
-                
-                <div style="background: #e8f4fd; padding: 20px; border-radius: 5px; margin: 20px 0;">
-                    <p style="margin: 0; font-weight: bold; color: #667eea; margin-bottom: 15px;">Our Response:</p>
-                    <div style="color: #333; line-height: 1.6;">
-                        {reply.html_body}
-                    </div>
-                </div>
-                
-                <div style="margin: 30px 0; padding: 15px; background: #f0f8ff; border-radius: 5px; text-align: center;">
-                    <p style="margin: 0; color: #667eea; font-weight: bold;">Need further assistance?</p>
-                    <p style="margin: 5px 0 0 0; font-size: 14px;">Feel free to reply to this email or contact us directly.</p>
-                </div>
-                
-                <p style="margin-bottom: 5px;"><strong>Best regards,</strong></p>
-                <p style="margin-top: 0; color: #667eea; font-weight: bold;">E&S Decorations Team</p>
-                
-                <div style="margin-top: 30px; padding-top: 20px; border-top: 1px solid #ddd; font-size: 12px; color: #666;">
-                    <p style="margin: 0;">📧 Email: esdecorationsind@gmail.com</p>
-                    <p style="margin: 5px 0 0 0;">🌐 Creating beautiful spaces since [Year]</p>
-                </div>
-            </div>
-            
-            <div style="text-align: center; margin-top: 20px; color: #666; font-size: 12px;">
-                <p>© 2025 E&S Decorations. All rights reserved.</p>
-            </div>
-        </body>
-        </html>
-        """
-        
-        # Enhanced plain text version
-        plain_text = f"""
-Dear {recipient_name},
-
-Thank you for contacting E&S Decorations. We have received your inquiry and are pleased to respond:
-
-Your Original Message:
-"{inquiry.get('message', '')[:150]}{'...' if len(inquiry.get('message', '')) > 150 else ''}"
-
-Our Response:
-{reply.plain_text_body}
-
-Need further assistance?
-Feel free to reply to this email or contact us directly.
-
-Best regards,
-E&S Decorations Team
-
-📧 Email: esdecorationsind@gmail.com
-🌐 Creating beautiful spaces since [Year]
-
-© 2025 E&S Decorations. All rights reserved.
-        """
-
-        # Send email using Resend
-        params: resend.Emails.SendParams = {
-            "from": EMAIL_FROM,
-            "to": [recipient_email],
-            "subject": subject,
-            "html": html_content,
-            "text": plain_text,
-            "reply_to": "esdecorationsind@gmail.com"
-        }
+        # The dashboard sends the reply as HTML plus a plain-text version for the text part
+        params = email_params(
+            "inquiry_reply",
+            [recipient_email],
+            recipient_name=recipient_name,
+            original_subject=original_subject,
+            original_message=inquiry.get("message", ""),
+            reply_html=reply.html_body,
+            reply_text=reply.plain_text_body
+        )
 
-        email_response = resend.Emails.send(params)
-        
-        # Handle different response formats
-        email_id = None
-        if hasattr(email_response, 'id'):
-            email_id = email_response.id
-        elif isinstance(email_response, dict) and 'id' in email_response:
-            email_id = email_response['id']
-        else:
-            email_id = "unknown"
-            
-        print(f"✅ Reply email sent successfully to {recipient_email}. Email ID: {email_id}")
+        outbox_id = await email_outbox.enqueue(params, kind="inquiry_reply")
+        print(f"📨 Reply email to {recipient_email} queued ({outbox_id})")
 
         # Update inquiry status
         await contacts_collection.update_one(
@@ -1087,113 +1143,42 @@ E&S Decorations Team
             {"$set": {"is_solved": True}}
         )
 
-        return {"message": "Reply sent successfully", "email_id": email_id}
+        return {"message": "Reply queued for delivery", "outbox_id": outbox_id}
         
     except Exception as e:
-        logging.error(f"Error sending reply: {str(e)}")
+        logging.error(f"Error queueing reply: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to send reply")
 
 # Admin Login with JWT
+VERIFICATION_CODE_MINUTES = 5
+
 def generate_verification_code() -> str:
     """Generate a 6-digit verification code"""
     return ''.join(random.choices(string.digits, k=6))
 
-async def send_admin_verification_email(email: str, code: str, admin_name: str = "Admin"):
-    """Send verification code via email for admin login"""
+async def send_admin_verification_email(
+    email: str,
+    code: str,
+    admin_name: str = "Admin",
+    expires_at: Optional[datetime.datetime] = None
+):
+    """Queue the admin login verification code email; it is dropped if still undelivered at expires_at"""
     try:
-        subject = "🔐 E&S Decorations - Admin Login Verification"
-        
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <title>Admin Login Verification</title>
-        </head>
-        <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px;">
-            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; text-align: center; border-radius: 10px 10px 0 0;">
-                <h1 style="color: white; margin: 0; font-size: 24px;">🔐 Admin Login Verification</h1>
-                <p style="color: #f0f0f0; margin: 10px 0 0 0;">E&S Decorations Security System</p>
-            </div>
-            
-            <div style="background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
-                <p style="font-size: 16px; margin-bottom: 20px;">Hello <strong>{admin_name}</strong>,</p>
-                
-                <p style="margin-bottom: 20px;">
-                    Someone is attempting to access the E&S Decorations admin panel. If this is you, 
-                    please use the verification code below to complete your login:
-                </p>
-                
-                <div style="text-align: center; margin: 30px 0;">
-                    <div style="background: #667eea; color: white; padding: 25px; border-radius: 15px; font-size: 36px; font-weight: bold; letter-spacing: 8px; display: inline-block; box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);">
-                        {code}
-                    </div>
-                </div>
-                
-                <div style="background: #fff3cd; border: 1px solid #ffeaa7; padding: 20px; border-radius: 8px; margin: 25px 0;">
-                    <p style="margin: 0; color: #856404; font-weight: bold;">⚠️ Security Notice:</p>
-                    <ul style="margin: 10px 0 0 20px; color: #856404;">
-                        <li>This code expires in <strong>5 minutes</strong></li>
-                        <li>Never share this code with anyone</li>
-                        <li>If you didn't request this, ignore this email</li>
-                        <li>Only use this code on the official admin portal</li>
-                    </ul>
-                </div>
-                
-                <div style="text-align: center; margin: 25px 0;">
-                    <p style="color: #666; font-size: 14px;">
-                        This verification code was requested from the E&S Decorations admin system.
-                        <br>Time: {datetime.datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC
-                    </p>
-                </div>
-                
-                <div style="border-top: 1px solid #ddd; padding-top: 20px; margin-top: 30px; text-align: center;">
-                    <p style="margin: 0; color: #667eea; font-weight: bold;">E&S Decorations Security Team</p>
-                    <p style="margin: 5px 0 0 0; font-size: 12px; color: #999;">
-                        This is an automated security message
-                    </p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-        
-        plain_text = f"""
-        E&S Decorations - Admin Login Verification
-
-        Hello {admin_name},
-
-        Someone is attempting to access the E&S Decorations admin panel. If this is you, please use the verification code below to complete your login:
-
-        Verification Code: {code}
-
-        ⚠️ Security Notice:
-        • This code expires in 5 minutes
-        • Never share this code with anyone
-        • If you didn't request this, ignore this email
-        • Only use this code on the official admin portal
-
-        Time: {datetime.datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC
-
-        E&S Decorations Security Team
-        This is an automated security message
-        """
-
-        params: resend.Emails.SendParams = {
-            "from": EMAIL_FROM,
-            "to": [email],
-            "subject": subject,
-            "html": html_content,
-            "text": plain_text,
-            "reply_to": "esdecorationsind@gmail.com"
-        }
+        params = email_params(
+            "admin_verification",
+            [email],
+            admin_name=admin_name,
+            code=code,
+            expires_in_minutes=VERIFICATION_CODE_MINUTES
+        )
 
-        email_response = resend.Emails.send(params)
-        print(f"✅ Admin verification email sent to {email}")
+        # The body carries the login code, so the outbox drops it once delivered
+        await email_outbox.enqueue(params, kind="admin_verification", expires_at=expires_at, sensitive=True)
+        print(f"📨 Admin verification email to {email} queued")
         return True
 
     except Exception as e:
-        print(f"❌ Error sending admin verification email: {str(e)}")
+        print(f"❌ Error queueing admin verification email: {str(e)}")
         return False
 
 # Replace your existing admin login endpoints with these two new endpoints:
@@ -1204,23 +1189,26 @@ async def request_admin_verification(request: RequestVerificationCode):
     try:
         # First validate email and password
         admin = await admins_collection.find_one({"email": request.email})
-        if not admin or not verify_password(request.password, admin["password"]):
+        hashed_password = await verify_admin_password(admin, request.password) if admin else None
+        if not hashed_password:
             raise HTTPException(status_code=401, detail="Invalid email or password")
 
         # Generate verification code
         code = generate_verification_code()
-        expires_at = datetime.datetime.utcnow() + datetime.timedelta(minutes=5)
+        expires_at = datetime.datetime.utcnow() + datetime.timedelta(minutes=VERIFICATION_CODE_MINUTES)
         
         # Store verification code
         verification_codes[request.email] = {
             "code": code,
             "expires": expires_at,
-            "admin_name": admin.get("name", "Admin")
+            "admin_name": admin.get("name", "Admin"),
+            # Lets step 2 confirm the password without another bcrypt check
+            "verified_password": VerifiedPassword(request.password, hashed_password)
         }
 
         # Send verification email
         admin_name = admin.get("name", "Admin")
-        success = await send_admin_verification_email(request.email, code, admin_name)
+        success = await send_admin_verification_email(request.email, code, admin_name, expires_at)
         
         if not success:
             raise HTTPException(status_code=500, detail="Failed to send verification email")
@@ -1257,9 +1245,9 @@ async def admin_login_with_2fa(login_request: AdminLoginRequest):
         if login_request.verification_code != stored_data["code"]:
             raise HTTPException(status_code=401, detail="Invalid verification code")
 
-        # Verify admin credentials again (security)
+        # Verify admin credentials again (security), against the password step 1 checked
         admin = await admins_collection.find_one({"email": login_request.email})
-        if not admin or not verify_password(login_request.password, admin["password"]):
+        if not admin or not stored_data["verified_password"].matches(login_request.password, admin["password"]):
             raise HTTPException(status_code=401, detail="Invalid credentials")
 
         # Clean up verification code
@@ -1305,7 +1293,7 @@ async def add_admin(admin: AdminCreate):
         if existing_admin:
             raise HTTPException(status_code=400, detail="Admin with this email already exists")
 
-        hashed_password = hash_password(admin.password)
+        hashed_password = await hash_password(admin.password)
         new_admin = {
             "name": admin.name,
             "email": admin.email,
@@ -1315,6 +1303,8 @@ async def add_admin(admin: AdminCreate):
 
         result = await admins_collection.insert_one(new_admin)
         return {"message": "Admin added successfully", "admin_id": str(result.inserted_id)}
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error adding admin: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1330,7 +1320,7 @@ async def update_admin(admin_id: str, admin_update: AdminUpdate):
         if admin_update.email:
             update_data["email"] = admin_update.email
         if admin_update.new_password:
-            update_data["password"] = hash_password(admin_update.new_password)
+            update_data["password"] = await hash_password(admin_update.new_password)
 
         if not update_data:
             raise HTTPException(status_code=400, detail="No update data provided")
@@ -1346,19 +1336,30 @@ async def update_admin(admin_id: str, admin_update: AdminUpdate):
         return {"message": "Admin updated successfully"}
     except errors.InvalidId:
         raise HTTPException(status_code=400, detail="Invalid admin ID")
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error updating admin: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 # Job Listings Endpoints
 @app.get("/job-listings")
-async def get_job_listings():
+async def get_job_listings(
+    request: Request,
+    response: Response,
+    active: Optional[bool] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    batch_size: int = Query(DEFAULT_STREAM_BATCH_SIZE, ge=1, le=MAX_STREAM_BATCH_SIZE)
+):
     try:
-        listings = await job_listings_collection.find().to_list(length=None)
-        # Convert ObjectId to string for each listing
-        for listing in listings:
-            listing["_id"] = str(listing["_id"])
-        return listings
+        return await list_documents(
+            request, response, job_listings_collection,
+            {} if active is None else {"isActive": active}, ID_ORDER,
+            with_string_id, limit, cursor, batch_size
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1366,6 +1367,7 @@ async def get_job_listings():
 async def create_job_listing(listing: JobListing):
     try:
         result = await job_listings_collection.insert_one(listing.dict())
+        await response_cache.invalidate("job_listings")
         if result.inserted_id:
             created_listing = await job_listings_collection.find_one(
                 {"_id": result.inserted_id}
@@ -1383,6 +1385,7 @@ async def update_job_listing(listing_id: str, listing: JobListing):
             {"_id": ObjectId(listing_id)},
             {"$set": listing.dict()}
         )
+        await response_cache.invalidate("job_listings")
         if result.modified_count == 0:
             raise HTTPException(status_code=404, detail="Job listing not found")
         updated_listing = await job_listings_collection.find_one(
@@ -1401,6 +1404,7 @@ async def delete_job_listing(listing_id: str):
         result = await job_listings_collection.delete_one(
             {"_id": ObjectId(listing_id)}
         )
+        await response_cache.invalidate("job_listings")
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Job listing not found")
         return {"message": "Job listing deleted successfully"}
@@ -1410,33 +1414,103 @@ async def delete_job_listing(listing_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 # Job Applications Endpoints
+RESUME_TOO_LARGE_DETAIL = "Resume must be less than 5MB"
+RESUME_EXTENSIONS = {
+    "application/pdf": "pdf",
+    "application/msword": "doc",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": "docx"
+}
+# Word files are ZIP/OLE containers that libmagic cannot always name precisely. A container
+# is taken for the Word format it can hold, and only when the client declared that format
+RESUME_CONTAINER_TYPES = {
+    "application/zip": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "application/x-ole-storage": "application/msword",
+    "application/CDFV2": "application/msword"
+}
+# Resumes are personal data: never cache in shared caches, always revalidate
+RESUME_CACHE_CONTROL = "private, no-cache"
+# Resumes stored before type checks may be anything; those are only ever downloaded as opaque bytes
+RESUME_FALLBACK_TYPE = "application/octet-stream"
+
+def resume_url(application_id: str, request: Request) -> str:
+    base = PUBLIC_BASE_URL or str(request.base_url).rstrip("/")
+    return f"{base}/job-applications/{application_id}/resume"
+
+def sniff_resume_type(head: bytes, declared_type: Optional[str]) -> str:
+    """Content type from the file's own bytes; only PDF and Word documents are accepted"""
+    content_type = magic.from_buffer(head, mime=True)
+    if content_type in RESUME_CONTAINER_TYPES and RESUME_CONTAINER_TYPES[content_type] == declared_type:
+        content_type = declared_type
+    if content_type not in RESUME_EXTENSIONS:
+        raise HTTPException(status_code=415, detail="Resume must be a PDF or Word document")
+    return content_type
+
+async def store_resume(resume: str) -> Dict[str, Any]:
+    """Decode a base64 resume into the resume store and return the document's resume_file reference"""
+    try:
+        resume_bytes = base64.b64decode(resume.split("base64,", 1)[-1], validate=True)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid resume format")
+    if len(resume_bytes) > MAX_RESUME_SIZE:
+        raise HTTPException(status_code=413, detail=RESUME_TOO_LARGE_DETAIL)
+
+    # "data:application/pdf;base64,..." declares a type; raw base64 does not
+    declared_type = resume[len("data:"):].split(";", 1)[0] if resume.startswith("data:") else None
+    content_type = sniff_resume_type(resume_bytes[:2048], declared_type)
+    info = await resume_store.put(resume_bytes, content_type)
+    return {"id": info["id"], "content_type": content_type, "size": info["length"]}
+
+async def store_resume_file(path: str, declared_type: Optional[str]) -> Dict[str, Any]:
+    """Copy a spooled resume into the resume store without reading it into memory"""
+    with open(path, "rb") as handle:
+        head = await run_in_threadpool(handle.read, 2048)
+    content_type = sniff_resume_type(head, declared_type)
+    info = await resume_store.put_file(path, content_type)
+    return {"id": info["id"], "content_type": content_type, "size": info["length"]}
+
+def present_job_application(application: dict, request: Request) -> dict:
+    # Convert ObjectId to string
+    application["_id"] = str(application["_id"])
+    # The file itself is served by GET /job-applications/{id}/resume
+    application.pop("resume", None)
+    resume_file = application.pop("resume_file", None)
+    if resume_file:
+        application["resume_url"] = resume_url(application["_id"], request)
+        application["resume_content_type"] = resume_file["content_type"]
+        application["resume_size"] = resume_file["size"]
+    return application
+
 @app.get("/job-applications")
-async def get_job_applications():
+async def get_job_applications(
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    batch_size: int = Query(DEFAULT_STREAM_BATCH_SIZE, ge=1, le=MAX_STREAM_BATCH_SIZE)
+):
     try:
-        applications = await job_applications_collection.find().to_list(length=None)
-        # Convert ObjectId to string for each application
-        for app in applications:
-            app["_id"] = str(app["_id"])
-            # If resume is bytes, convert to base64 string
-            if isinstance(app.get("resume"), bytes):
-                app["resume"] = base64.b64encode(app["resume"]).decode('utf-8')
-        return applications
+        return await list_documents(
+            request, response, job_applications_collection, {}, ID_ORDER,
+            lambda application: present_job_application(application, request),
+            limit, cursor, batch_size,
+            # Never load legacy inline resume bytes just to list applications
+            projection={"resume": 0}
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/job-applications")
-async def submit_job_application(application: JobApplication):
+async def submit_job_application(application: JobApplication, request: Request):
     try:
         # Convert application to dict and handle the resume
         application_dict = application.dict()
         
-        # If resume is provided as base64 string, decode it
-        if application.resume and isinstance(application.resume, str):
-            try:
-                resume_bytes = base64.b64decode(application.resume)
-                application_dict["resume"] = resume_bytes
-            except:
-                raise HTTPException(status_code=400, detail="Invalid resume format")
+        # If resume is provided as base64 string, move it to the resume store
+        resume = application_dict.pop("resume", None)
+        if resume:
+            application_dict["resume_file"] = await store_resume(resume)
         
         # Insert application into database
         result = await job_applications_collection.insert_one(application_dict)
@@ -1446,34 +1520,114 @@ async def submit_job_application(application: JobApplication):
             created_application = await job_applications_collection.find_one(
                 {"_id": result.inserted_id}
             )
-            created_application["_id"] = str(created_application["_id"])
-            # Convert resume back to base64 if it exists
-            if isinstance(created_application.get("resume"), bytes):
-                created_application["resume"] = base64.b64encode(created_application["resume"]).decode('utf-8')
-            return created_application
+            return present_job_application(created_application, request)
         
         raise HTTPException(status_code=500, detail="Failed to submit application")
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/job-applications/upload")
+async def submit_job_application_form(
+    request: Request,
+    jobId: str = Form(...),
+    name: str = Form(...),
+    email: str = Form(...),
+    phone: str = Form(...),
+    experience: str = Form(...),
+    appliedDate: str = Form(...),
+    address: Optional[str] = Form(None),
+    resume: Optional[UploadFile] = File(None)
+):
+    """Multipart variant of POST /job-applications: the resume is streamed to storage, never base64"""
+    spool_path = None
+    try:
+        application_dict = JobApplication(
+            jobId=jobId,
+            name=name,
+            email=email,
+            phone=phone,
+            experience=experience,
+            address=address,
+            appliedDate=appliedDate
+        ).dict(exclude={"resume"})
+
+        if resume is not None and resume.filename:
+            spool_path, _ = await spool_upload(
+                resume, MAX_RESUME_SIZE, too_large_status=413, too_large_detail=RESUME_TOO_LARGE_DETAIL
+            )
+            application_dict["resume_file"] = await store_resume_file(spool_path, resume.content_type)
+
+        result = await job_applications_collection.insert_one(application_dict)
+        created_application = await job_applications_collection.find_one({"_id": result.inserted_id})
+        return present_job_application(created_application, request)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        await run_in_threadpool(remove_spool, spool_path)
+
+@app.get("/job-applications/{application_id}/resume")
+async def download_resume(application_id: str, request: Request):
+    if not ObjectId.is_valid(application_id):
+        raise HTTPException(status_code=400, detail="Invalid application ID")
+    application = await job_applications_collection.find_one(
+        {"_id": ObjectId(application_id)}, {"name": 1, "resume_file": 1}
+    )
+    if not application:
+        raise HTTPException(status_code=404, detail="Application not found")
+    resume_file = application.get("resume_file")
+    if not resume_file:
+        raise HTTPException(status_code=404, detail="Resume not found")
+
+    info = await resume_store.get_info(resume_file["id"])
+    if not info:
+        raise HTTPException(status_code=404, detail="Resume not found")
+
+    filename = re.sub(r"[^A-Za-z0-9_-]+", "_", application.get("name", "")).strip("_") or "applicant"
+    if info["content_type"] in RESUME_EXTENSIONS:
+        media_type, disposition = info["content_type"], "inline"
+        extension = RESUME_EXTENSIONS[media_type]
+    else:
+        # Never let the browser render an unvetted upload (HTML, SVG, ...) on the API origin
+        media_type, disposition, extension = RESUME_FALLBACK_TYPE, "attachment", "bin"
+    return ranged_stream_response(
+        request,
+        length=info["length"],
+        media_type=media_type,
+        etag=f'"{info["id"]}"',
+        stream=lambda start, end: resume_store.stream(info["id"], start, end),
+        cache_control=RESUME_CACHE_CONTROL,
+        extra_headers={
+            "Content-Disposition": f'{disposition}; filename="resume-{filename}.{extension}"',
+            "X-Content-Type-Options": "nosniff"
+        }
+    )
+
+APPLICATION_STATUSES = ("pending", "approved", "rejected")
+
+def validate_application_status(status: str):
+    if status not in APPLICATION_STATUSES:
+        raise HTTPException(status_code=400, detail=f"status must be one of: {', '.join(APPLICATION_STATUSES)}")
+
 @app.patch("/job-applications/{application_id}/status")
 async def update_application_status(application_id: str, status: str):
     try:
-        # First get the application to access the applicant's details
-        application = await job_applications_collection.find_one({"_id": ObjectId(application_id)})
-        if not application:
-            raise HTTPException(status_code=404, detail="Application not found")
-
-        # Update the status
-        result = await job_applications_collection.update_one(
-            {"_id": ObjectId(application_id)},
-            {"$set": {"status": status}}
+        validate_application_status(status)
+        # Only a real change is written (and emailed), as in the bulk endpoint
+        application = await job_applications_collection.find_one_and_update(
+            {"_id": ObjectId(application_id), "status": {"$ne": status}},
+            {"$set": {"status": status}},
+            projection={"name": 1, "email": 1}
         )
-
-        if result.modified_count == 0:
+        if application is None:
+            if await job_applications_collection.count_documents({"_id": ObjectId(application_id)}, limit=1):
+                return {"message": f"Application already {status}"}
             raise HTTPException(status_code=404, detail="Application not found")
 
-        # Send appropriate email based on status
+        # Queue the matching email; delivery happens in the background
         if status == "approved":
             await send_acceptance_email(
                 applicant_name=application["name"],
@@ -1488,18 +1642,124 @@ async def update_application_status(application_id: str, status: str):
         return {"message": f"Application {status} successfully"}
     except errors.InvalidId:
         raise HTTPException(status_code=400, detail="Invalid application ID")
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+MAX_BULK_STATUS_UPDATES = 500
+# Status updates of one bulk request in flight at once
+BULK_STATUS_CONCURRENCY = 16
+# Status -> email template (and outbox kind) an applicant gets on that change
+APPLICATION_STATUS_EMAILS = {
+    "approved": "acceptance",
+    "rejected": "rejection"
+}
+
+class ApplicationStatusChange(BaseModel):
+    id: str
+    status: str
+
+class BulkApplicationStatusUpdate(BaseModel):
+    updates: List[ApplicationStatusChange]
+
+@app.patch("/job-applications/status")
+async def bulk_update_application_status(bulk: BulkApplicationStatusUpdate):
+    """Apply many status changes and queue their emails as batches.
+
+    Each change is a conditional find_one_and_update (only when the status
+    differs), so an email goes out only for a document this request
+    actually changed, even if another admin is updating the same
+    applications. Each application gets a result: updated, unchanged
+    (already in that status, no email), not_found or invalid_id.
+    """
+    try:
+        if len(bulk.updates) > MAX_BULK_STATUS_UPDATES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {MAX_BULK_STATUS_UPDATES} status changes per request"
+            )
+        for change in bulk.updates:
+            validate_application_status(change.status)
+
+        results: Dict[str, str] = {}
+        # Keyed by ID, so an application listed twice gets its last status
+        changes: Dict[str, str] = {}
+        for change in bulk.updates:
+            if ObjectId.is_valid(change.id):
+                changes[change.id] = change.status
+            else:
+                results[change.id] = "invalid_id"
+
+        slots = asyncio.Semaphore(BULK_STATUS_CONCURRENCY)
+
+        async def apply(application_id: str, status: str) -> Optional[Dict[str, Any]]:
+            async with slots:
+                return await job_applications_collection.find_one_and_update(
+                    {"_id": ObjectId(application_id), "status": {"$ne": status}},
+                    {"$set": {"status": status}},
+                    projection={"name": 1, "email": 1}
+                )
+
+        changed = await asyncio.gather(*(apply(application_id, status) for application_id, status in changes.items()))
+
+        recipients = defaultdict(list)
+        untouched = []
+        for (application_id, status), application in zip(changes.items(), changed):
+            if application is None:
+                untouched.append(ObjectId(application_id))
+                continue
+            results[application_id] = "updated"
+            if status in APPLICATION_STATUS_EMAILS:
+                recipients[status].append(application)
+        # Nothing matched: either the application is gone or it already had that status
+        existing = {
+            str(application["_id"])
+            async for application in job_applications_collection.find({"_id": {"$in": untouched}}, {"_id": 1})
+        } if untouched else set()
+        for application_id in untouched:
+            results[str(application_id)] = "unchanged" if str(application_id) in existing else "not_found"
+        updated = sum(application is not None for application in changed)
+
+        emails_queued = 0
+        for status, applicants in recipients.items():
+            kind = APPLICATION_STATUS_EMAILS[status]
+            params = email_params_many(
+                kind, [(applicant["email"], {"applicant_name": applicant["name"]}) for applicant in applicants]
+            )
+            outbox_ids = await email_outbox.enqueue_many(params, kind)
+            emails_queued += len(outbox_ids)
+
+        print(f"✅ Bulk status update: {updated} application(s) changed, {emails_queued} email(s) queued")
+        return {
+            "updated": updated,
+            "emails_queued": emails_queued,
+            "results": [
+                {"id": application_id, "status": changes.get(application_id), "result": results[application_id]}
+                for application_id in dict.fromkeys(change.id for change in bulk.updates)
+            ]
+        }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 # FAQ Endpoints
 @app.get("/faqs")
-async def get_faqs():
+async def get_faqs(
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    batch_size: int = Query(DEFAULT_STREAM_BATCH_SIZE, ge=1, le=MAX_STREAM_BATCH_SIZE)
+):
     try:
-        faqs = await faqs_collection.find().to_list(length=None)
-        # Convert ObjectId to string for each FAQ
-        for faq in faqs:
-            faq["_id"] = str(faq["_id"])
-        return faqs
+        return await list_documents(
+            request, response, faqs_collection, {}, ID_ORDER,
+            with_string_id, limit, cursor, batch_size
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1507,6 +1767,7 @@ async def get_faqs():
 async def create_faq(faq: FAQ):
     try:
         result = await faqs_collection.insert_one(faq.dict())
+        await response_cache.invalidate("faqs")
         if result.inserted_id:
             created_faq = await faqs_collection.find_one({"_id": result.inserted_id})
             created_faq["_id"] = str(created_faq["_id"])
@@ -1522,6 +1783,7 @@ async def update_faq(faq_id: str, faq: FAQ):
             {"_id": ObjectId(faq_id)},
             {"$set": faq.dict()}
         )
+        await response_cache.invalidate("faqs")
         if result.modified_count == 0:
             raise HTTPException(status_code=404, detail="FAQ not found")
         updated_faq = await faqs_collection.find_one({"_id": ObjectId(faq_id)})
@@ -1536,6 +1798,7 @@ async def update_faq(faq_id: str, faq: FAQ):
 async def delete_faq(faq_id: str):
     try:
         result = await faqs_collection.delete_one({"_id": ObjectId(faq_id)})
+        await response_cache.invalidate("faqs")
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="FAQ not found")
         return {"message": "FAQ deleted successfully"}
@@ -1546,40 +1809,312 @@ async def delete_faq(faq_id: str):
 
 # Latest Works Endpoints
 
+# Stored images
+IMAGE_URL_PATTERN = re.compile(r"/images/([0-9a-f]{64})(?:[?#].*)?$")
+IMAGE_FIELDS = ("thumbnail", "images")
+
+def image_url(image_id: str, request: Request) -> str:
+    base = PUBLIC_BASE_URL or str(request.base_url).rstrip("/")
+    return f"{base}/images/{image_id}"
+
+async def intern_image(value: str) -> str:
+    """Turn an image field value into an image ID, storing inline base64 in the blob store.
+
+    Accepts an image ID, an /images/<id> URL (the admin UI sends these back
+    for unchanged images), a data: URL or raw base64.
+    """
+    if not value or is_blob_id(value):
+        return value
+
+    url_match = IMAGE_URL_PATTERN.search(value)
+    if url_match:
+        return url_match.group(1)
+
+    payload = value.split("base64,", 1)[1] if value.startswith("data:") else value
+    try:
+        image_bytes = base64.b64decode(payload, validate=True)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid image data")
+
+    content_type = magic.from_buffer(image_bytes[:2048], mime=True)
+    if not content_type.startswith("image/"):
+        raise HTTPException(status_code=400, detail="Invalid image data")
+
+    try:
+        placeholder = await run_image_task(image_compressor.compute_placeholder, image_bytes)
+    except HTTPException:
+        raise
+    except Exception:
+        placeholder = {}
+    info = await image_store.put(image_bytes, content_type, placeholder)
+    return info["id"]
+
+PLACEHOLDER_FIELDS = ("placeholder", "dominant_color")
+
+async def image_placeholder(image_id: str) -> Optional[Dict[str, str]]:
+    """LQIP preview and dominant colour for a stored image.
+
+    Read from the blob's metadata; images stored before placeholders existed
+    get one computed from their bytes.
+    """
+    info = await image_store.get_info(image_id)
+    if not info:
+        return None
+    if all(field in info["metadata"] for field in PLACEHOLDER_FIELDS):
+        return {field: info["metadata"][field] for field in PLACEHOLDER_FIELDS}
+    try:
+        return await run_image_task(image_compressor.compute_placeholder, await image_store.read(image_id))
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"⚠️ Could not compute placeholder for image {image_id[:12]}: {str(e)}")
+        return None
+
+async def intern_image_fields(document: dict) -> dict:
+    """Replace inline images in thumbnail/images with blob store IDs and record their placeholders"""
+    if isinstance(document.get("thumbnail"), str):
+        document["thumbnail"] = await intern_image(document["thumbnail"])
+    if isinstance(document.get("images"), list):
+        document["images"] = [await intern_image(image) for image in document["images"]]
+
+    # Keyed by image ID so list endpoints can paint placeholders without touching the blobs
+    image_ids = [document.get("thumbnail")] + list(document.get("images") or [])
+    placeholders = {}
+    for image_id in image_ids:
+        if is_blob_id(image_id) and image_id not in placeholders:
+            placeholder = await image_placeholder(image_id)
+            if placeholder:
+                placeholders[image_id] = placeholder
+    document["placeholders"] = placeholders
+    return document
+
+def present_image_fields(document: dict, request: Request) -> dict:
+    """Expand image IDs to URLs for API responses (legacy inline images pass through)"""
+    for field in IMAGE_FIELDS:
+        value = document.get(field)
+        if is_blob_id(value):
+            document[field] = image_url(value, request)
+        elif isinstance(value, list):
+            document[field] = [
+                image_url(image, request) if is_blob_id(image) else image
+                for image in value
+            ]
+    if isinstance(document.get("placeholders"), dict):
+        # Re-key by URL so clients can look a placeholder up by the src they render,
+        # dropping those for images a projection left out
+        shown = {document.get("thumbnail"), *(document.get("images") or [])}
+        document["placeholders"] = {
+            image_url(image_id, request): placeholder
+            for image_id, placeholder in document["placeholders"].items()
+            if image_url(image_id, request) in shown
+        }
+    return document
+
+def rendition_width(requested: int) -> int:
+    """Round a requested width up to the nearest bucket so caches stay small"""
+    for width in RENDITION_WIDTHS:
+        if requested <= width:
+            return width
+    return RENDITION_WIDTHS[-1]
+
+def rendition_key(image_id: str, width: int, fmt: str) -> str:
+    return f"{image_id}-w{width}.{fmt}"
+
+async def get_rendition(image_id: str, width: int, fmt: str) -> Tuple[Optional[str], Optional[bytes]]:
+    """Return (cached file path, None) on a hit or (None, freshly rendered bytes) on a miss.
+
+    Concurrent misses for the same rendition share a single encode.
+    """
+    key = rendition_key(image_id, width, fmt)
+    cached_path = await rendition_cache.get(key)
+    if cached_path:
+        return cached_path, None
+
+    async def render() -> bytes:
+        original = await image_store.read(image_id)
+        data, _ = await run_rendition_task(image_compressor.render_variant, original, width, fmt)
+        await rendition_cache.put(key, data)
+        return data
+
+    return None, await rendition_flights.do(key, render)
+
+def stream_file(handle) -> Callable[[int, Optional[int]], AsyncIterator[bytes]]:
+    """Range-capable chunked reader over an already opened file"""
+    async def stream(start: int, end: Optional[int]):
+        try:
+            await run_in_threadpool(handle.seek, start)
+            remaining = None if end is None else end - start + 1
+            while remaining is None or remaining > 0:
+                size = UPLOAD_CHUNK_SIZE if remaining is None else min(UPLOAD_CHUNK_SIZE, remaining)
+                chunk = await run_in_threadpool(handle.read, size)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+        finally:
+            handle.close()
+    return stream
+
+def stream_bytes(data: bytes) -> Callable[[int, Optional[int]], AsyncIterator[bytes]]:
+    async def stream(start: int, end: Optional[int]):
+        yield data[start:None if end is None else end + 1]
+    return stream
+
+@app.get("/images/{image_id}")
+async def get_image(
+    image_id: str,
+    request: Request,
+    w: Optional[int] = None,
+    fmt: Optional[str] = None
+):
+    """Serve a stored image; the ID is its content hash, so it can be cached forever.
+
+    With ?w= and/or ?fmt=jpeg|webp a width-bucketed rendition is served
+    instead, generated on first request and kept in the rendition cache.
+    """
+    info = await image_store.get_info(image_id) if is_blob_id(image_id) else None
+    if not info:
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    if w is not None or fmt is not None:
+        fmt = (fmt or "jpeg").lower()
+        if fmt not in RENDITION_FORMATS:
+            raise HTTPException(status_code=400, detail="fmt must be one of: jpeg, webp")
+        if w is not None and w <= 0:
+            raise HTTPException(status_code=400, detail="w must be a positive width")
+        width = rendition_width(w or RENDITION_WIDTHS[-1])
+        etag = f'"{rendition_key(image_id, width, fmt)}"'
+        # Revalidation must not cost an encode or a disk read
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return not_modified_response(etag)
+
+        try:
+            cached_path, data = await get_rendition(image_id, width, fmt)
+            handle = await run_in_threadpool(open, cached_path, "rb") if cached_path else None
+        except FileNotFoundError:
+            # Evicted by another worker between lookup and open
+            handle, data = None, (await get_rendition(image_id, width, fmt))[1]
+        except HTTPException:
+            raise
+        except Exception as e:
+            print(f"❌ Rendition {rendition_key(image_id, width, fmt)} failed: {str(e)}")
+            raise HTTPException(status_code=500, detail="Failed to render image")
+
+        length = os.fstat(handle.fileno()).st_size if handle else len(data)
+        try:
+            return ranged_stream_response(
+                request,
+                length=length,
+                media_type=RENDITION_FORMATS[fmt],
+                etag=etag,
+                stream=stream_file(handle) if handle else stream_bytes(data)
+            )
+        except HTTPException:
+            if handle:
+                handle.close()
+            raise
+
+    return ranged_stream_response(
+        request,
+        length=info["length"],
+        media_type=info["content_type"],
+        etag=f'"{image_id}"',
+        stream=lambda start, end: image_store.stream(image_id, start, end)
+    )
+
+# Uploads are copied to disk in chunks so no request ever holds a whole file in memory
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+UPLOAD_SPOOL_DIR = os.getenv("UPLOAD_SPOOL_DIR") or tempfile.gettempdir()
+
+def file_too_large_detail() -> str:
+    max_mb = image_compressor.MAX_FILE_SIZE / (1024*1024)
+    return f"File too large. Maximum size is {max_mb}MB"
+
+async def spool_upload(
+    file: UploadFile,
+    max_size: int,
+    too_large_status: int = 400,
+    too_large_detail: Optional[str] = None
+) -> Tuple[str, int]:
+    """Stream an upload into a temp file, enforcing max_size while reading.
+
+    Returns the spool path (the caller must delete it) and the byte count.
+    """
+    suffix = os.path.splitext(file.filename or "")[1].lower()
+    spool = tempfile.NamedTemporaryFile(dir=UPLOAD_SPOOL_DIR, suffix=suffix, delete=False)
+    size = 0
+    try:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > max_size:
+                raise HTTPException(
+                    status_code=too_large_status,
+                    detail=too_large_detail or file_too_large_detail()
+                )
+            await run_in_threadpool(spool.write, chunk)
+        spool.close()
+        return spool.name, size
+    except BaseException:
+        spool.close()
+        os.unlink(spool.name)
+        raise
+
+def remove_spool(path: Optional[str]):
+    if path:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+async def generate_upload_renditions(image_id: str, image_bytes: bytes, request: Request) -> List[Dict[str, Any]]:
+    """Render the upload rendition set from one decode and warm the rendition cache"""
+    widths = list(UPLOAD_RENDITIONS.values())
+    formats = list(RENDITION_FORMATS)
+    rendered = await run_image_task(image_compressor.render_variants, image_bytes, widths, formats)
+
+    # render_variants returns one result per (width, format) in that order
+    jobs = [(name, width, fmt) for name, width in UPLOAD_RENDITIONS.items() for fmt in formats]
+    results = []
+    for (name, width, fmt), (data, info) in zip(jobs, rendered):
+        # Same key as GET /images/{id}?w=&fmt= so those requests are cache hits
+        await rendition_cache.put(rendition_key(image_id, width, fmt), data)
+        results.append({
+            "name": name,
+            **info,
+            "url": f"{image_url(image_id, request)}?w={width}&fmt={fmt}"
+        })
+    print(f"🖼️  Generated {len(results)} renditions for image {image_id[:12]}")
+    return results
+
 # New image upload endpoint
 @app.post("/upload-image")
-async def upload_image(file: UploadFile = File(...)):
+async def upload_image(request: Request, file: UploadFile = File(...), renditions: bool = False):
+    spool_path = None
     try:
         print(f"\n🚀 Starting upload for: {file.filename}")
         
         if not file.filename:
             raise HTTPException(status_code=400, detail="No filename provided")
         
-        file_content = await file.read()
-        
-        if len(file_content) == 0:
-            raise HTTPException(status_code=400, detail="File is empty")
-        
-        if len(file_content) > image_compressor.MAX_FILE_SIZE:
-            max_mb = image_compressor.MAX_FILE_SIZE / (1024*1024)
-            raise HTTPException(
-                status_code=400, 
-                detail=f"File too large. Maximum size is {max_mb}MB"
-            )
-        
         if not image_compressor.is_image_by_filename(file.filename):
             raise HTTPException(
                 status_code=400, 
                 detail="File type not supported. Please upload: JPG, PNG, GIF, BMP, WebP, TIFF, or HEIC"
             )
         
-        is_valid, validation_message = image_compressor.is_image(file_content)
+        spool_path, file_size = await spool_upload(file, image_compressor.MAX_FILE_SIZE)
+        
+        if file_size == 0:
+            raise HTTPException(status_code=400, detail="File is empty")
+        
+        # Header-only check - the pixels are decoded once, by the processing step below
+        is_valid, validation_message, _ = await run_image_task(image_compressor.probe_image, spool_path)
         if not is_valid:
             raise HTTPException(status_code=400, detail=validation_message)
         
         print(f"✅ Validation passed: {validation_message}")
         
-        file_size = len(file_content)
         print(f"📏 File size: {file_size:,} bytes ({file_size / (1024*1024):.2f} MB)")
         
         # Check if it's a HEIC file - always convert these
@@ -1593,9 +2128,13 @@ async def upload_image(file: UploadFile = File(...)):
             
             try:
                 if file_size > 25 * 1024 * 1024:
-                    final_content, metadata = image_compressor.progressive_compress(file_content)
+                    final_content, metadata = await run_image_task(
+                        image_compressor.progressive_compress, spool_path
+                    )
                 else:
-                    final_content, metadata = image_compressor.convert_to_web_format(file_content)
+                    final_content, metadata = await run_image_task(
+                        image_compressor.convert_to_web_format, spool_path
+                    )
                 
                 compression_applied = True
                 
@@ -1604,6 +2143,8 @@ async def upload_image(file: UploadFile = File(...)):
                 else:
                     print(f"✅ Compressed: {metadata['savings_percent']}% savings")
                 
+            except HTTPException:
+                raise
             except Exception as e:
                 print(f"❌ Processing failed: {str(e)}")
                 raise HTTPException(status_code=500, detail=f"Image processing failed: {str(e)}")
@@ -1612,12 +2153,16 @@ async def upload_image(file: UploadFile = File(...)):
             print(f"✨ File within 15MB limit")
             # Still convert to JPEG for consistency (optional)
             try:
-                final_content, metadata = image_compressor.convert_to_web_format(file_content, quality=95)
+                final_content, metadata = await run_image_task(
+                    image_compressor.convert_to_web_format, spool_path, quality=95
+                )
                 compression_applied = True
                 print(f"🔄 Converted to JPEG for web compatibility")
+            except HTTPException:
+                raise
             except:
                 # Fallback to original if conversion fails
-                final_content = file_content
+                final_content = await run_in_threadpool(Path(spool_path).read_bytes)
                 compression_applied = False
                 metadata = {
                     'original_size': file_size,
@@ -1628,13 +2173,28 @@ async def upload_image(file: UploadFile = File(...)):
                     'reason': 'under_15mb_limit'
                 }
         
+        stored = await image_store.put(
+            final_content,
+            "image/jpeg" if compression_applied else (file.content_type or "application/octet-stream"),
+            {
+                "original_filename": file.filename,
+                **{field: metadata[field] for field in PLACEHOLDER_FIELDS if field in metadata}
+            }
+        )
+        
+        if renditions:
+            metadata["renditions"] = await generate_upload_renditions(stored["id"], final_content, request)
+        
         # Convert to base64 - this should now always be a JPEG
+        # (kept for the admin cropper; saving it back resolves to the same image ID)
         base64_string = base64.b64encode(final_content).decode('utf-8')
         
-        print(f"🎯 Final: {len(final_content):,} bytes as JPEG")
+        print(f"🎯 Final: {len(final_content):,} bytes as JPEG (image {stored['id'][:12]})")
         
         return {
             "image": base64_string,
+            "image_id": stored["id"],
+            "url": image_url(stored["id"], request),
             "compression_applied": compression_applied,
             "metadata": metadata,
             "file_info": {
@@ -1651,6 +2211,8 @@ async def upload_image(file: UploadFile = File(...)):
     except Exception as e:
         print(f"💥 Error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
+    finally:
+        await run_in_threadpool(remove_spool, spool_path)
 
 @app.get("/compression-stats")
 async def get_compression_stats():
@@ -1662,57 +2224,88 @@ async def get_compression_stats():
             "compression_enabled": True,
             "supported_formats": ["JPEG", "PNG", "WebP", "GIF", "BMP"],
             "max_dimensions": "1920x1080",
-            "default_quality": 85
+            "default_quality": 85,
+            "image_workers": image_executor.stats(),
+            "rendition_workers": rendition_executor.stats(),
+            "rendition_cache": rendition_cache.stats(),
+            "rendition_requests": rendition_flights.stats()
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 # Gallery Event Management Endpoints
 @app.get("/gallery-events")
-async def get_gallery_events():
+async def get_gallery_events(
+    request: Request,
+    response: Response,
+    view: str = "full",
+    fields: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    batch_size: int = Query(DEFAULT_STREAM_BATCH_SIZE, ge=1, le=MAX_STREAM_BATCH_SIZE)
+):
     try:
-        events = await events_collection.find({"type": "gallery"}).to_list(length=None)
-        # Convert ObjectId to string for each event
-        for event in events:
-            event["_id"] = str(event["_id"])
-        return events
+        return await list_documents(
+            request, response, events_collection, {"type": "gallery"}, ID_ORDER,
+            lambda event: present_image_fields(with_string_id(event), request),
+            limit, cursor, batch_size, list_projection(fields, view)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/gallery-events/{event_id}")
+async def get_gallery_event(event_id: str, request: Request):
+    try:
+        return await find_one_presented(
+            events_collection, event_id, request, "Gallery event not found", {"type": "gallery"}
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/gallery-events")
-async def create_gallery_event(event: GalleryEventCreate):
+async def create_gallery_event(event: GalleryEventCreate, request: Request):
     try:
-        event_dict = event.dict()
+        event_dict = await intern_image_fields(event.dict())
         event_dict["type"] = "gallery"  # Add type field to distinguish gallery events
         result = await events_collection.insert_one(event_dict)
+        await response_cache.invalidate("events")
         if result.inserted_id:
             created_event = await events_collection.find_one(
                 {"_id": result.inserted_id}
             )
             created_event["_id"] = str(created_event["_id"])
-            return created_event
+            return present_image_fields(created_event, request)
         raise HTTPException(status_code=500, detail="Failed to create event")
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.put("/gallery-events/{event_id}")
-async def update_gallery_event(event_id: str, event: GalleryEventUpdate):
+async def update_gallery_event(event_id: str, event: GalleryEventUpdate, request: Request):
     try:
-        event_dict = event.dict()
+        event_dict = await intern_image_fields(event.dict())
         event_dict["type"] = "gallery"  # Ensure type remains gallery
         result = await events_collection.update_one(
             {"_id": ObjectId(event_id), "type": "gallery"},
             {"$set": event_dict}
         )
+        await response_cache.invalidate("events")
         if result.modified_count == 0:
             raise HTTPException(status_code=404, detail="Gallery event not found")
         updated_event = await events_collection.find_one(
             {"_id": ObjectId(event_id)}
         )
         updated_event["_id"] = str(updated_event["_id"])
-        return updated_event
+        return present_image_fields(updated_event, request)
     except errors.InvalidId:
         raise HTTPException(status_code=400, detail="Invalid event ID")
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1722,6 +2315,7 @@ async def delete_gallery_event(event_id: str):
         result = await events_collection.delete_one(
             {"_id": ObjectId(event_id), "type": "gallery"}
         )
+        await response_cache.invalidate("events")
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Gallery event not found")
         return {"message": "Gallery event deleted successfully"}
@@ -1731,23 +2325,44 @@ async def delete_gallery_event(event_id: str):
         raise HTTPException(status_code=500, detail=str(e))
     
 @app.get("/latest-works")
-async def get_latest_works():
+async def get_latest_works(
+    request: Request,
+    response: Response,
+    view: str = "full",
+    fields: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    batch_size: int = Query(DEFAULT_STREAM_BATCH_SIZE, ge=1, le=MAX_STREAM_BATCH_SIZE)
+):
     try:
-        works = await latest_works_collection.find().to_list(length=None)
-        # Convert ObjectId to string for each work
-        for work in works:
-            work["_id"] = str(work["_id"])
-        return works
+        return await list_documents(
+            request, response, latest_works_collection, {}, ID_ORDER,
+            lambda work: present_image_fields(with_string_id(work), request),
+            limit, cursor, batch_size, list_projection(fields, view)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/latest-works/{work_id}")
+async def get_latest_work(work_id: str, request: Request):
+    try:
+        return await find_one_presented(latest_works_collection, work_id, request, "Work not found")
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/latest-works")
-async def create_latest_work(work: dict):
+async def create_latest_work(work: dict, request: Request):
     try:
         # Validate required fields
         if not all(key in work for key in ["title", "thumbnail", "category"]):
             raise HTTPException(status_code=422, detail="Missing required fields")
 
+        work = await intern_image_fields(work)
+
         # Add compression metadata if available
         if "compression_metadata" not in work and "thumbnail" in work:
             # If thumbnail is already processed, add basic metadata
@@ -1758,30 +2373,37 @@ async def create_latest_work(work: dict):
 
         # Insert the work into MongoDB
         result = await latest_works_collection.insert_one(work)
+        await response_cache.invalidate("latest_works")
         
         if result.inserted_id:
             created_work = await latest_works_collection.find_one({"_id": result.inserted_id})
             created_work["_id"] = str(created_work["_id"])
-            return created_work
+            return present_image_fields(created_work, request)
             
         raise HTTPException(status_code=500, detail="Failed to create work")
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     
 @app.post("/test-compression")
 async def test_compression(file: UploadFile = File(...)):
     """Test endpoint to see compression results without saving"""
+    spool_path = None
     try:
-        file_content = await file.read()
-        
-        if not image_compressor.is_image(file_content):
-            raise HTTPException(status_code=400, detail="File is not a valid image")
+        spool_path, file_size = await spool_upload(file, image_compressor.MAX_FILE_SIZE)
         
-        file_size = len(file_content)
+        is_valid, validation_message, _ = await run_image_task(image_compressor.probe_image, spool_path)
+        if not is_valid:
+            raise HTTPException(status_code=400, detail=validation_message)
         
         # Always compress for testing
-        compressed_content, metadata = image_compressor.compress_image(file_content)
-        progressive_content, progressive_metadata = image_compressor.progressive_compress(file_content)
+        compressed_content, metadata = await run_image_task(
+            image_compressor.compress_image, spool_path
+        )
+        progressive_content, progressive_metadata = await run_image_task(
+            image_compressor.progressive_compress, spool_path
+        )
         
         return {
             "original_size": file_size,
@@ -1798,11 +2420,15 @@ async def test_compression(file: UploadFile = File(...)):
                 "savings": progressive_metadata['savings_percent']
             }
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        await run_in_threadpool(remove_spool, spool_path)
 
 @app.put("/latest-works/{work_id}")
-async def update_latest_work(work_id: str, work: dict):
+async def update_latest_work(work_id: str, work: dict, request: Request):
     try:
         # Validate work_id
         if not ObjectId.is_valid(work_id):
@@ -1812,10 +2438,13 @@ async def update_latest_work(work_id: str, work: dict):
         if not all(key in work for key in ["title", "thumbnail", "category"]):
             raise HTTPException(status_code=422, detail="Missing required fields")
 
+        work = await intern_image_fields(work)
+
         result = await latest_works_collection.update_one(
             {"_id": ObjectId(work_id)},
             {"$set": work}
         )
+        await response_cache.invalidate("latest_works")
         
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Work not found")
@@ -1825,9 +2454,11 @@ async def update_latest_work(work_id: str, work: dict):
             
         updated_work = await latest_works_collection.find_one({"_id": ObjectId(work_id)})
         updated_work["_id"] = str(updated_work["_id"])
-        return updated_work
+        return present_image_fields(updated_work, request)
     except errors.InvalidId:
         raise HTTPException(status_code=400, detail="Invalid work ID format")
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1844,6 +2475,7 @@ async def delete_latest_work(work_id: str):
             raise HTTPException(status_code=404, detail="Work not found")
 
         result = await latest_works_collection.delete_one({"_id": ObjectId(work_id)})
+        await response_cache.invalidate("latest_works")
         
         if result.deleted_count == 0:
             raise HTTPException(status_code=500, detail="Failed to delete work")
@@ -1859,51 +2491,17 @@ async def delete_latest_work(work_id: str):
 async def test_email_sending():
     """Test endpoint to verify Resend API is working correctly"""
     try:
-        params: resend.Emails.SendParams = {
-            "from": EMAIL_FROM,
-            "to": ["esdecorationsind@gmail.com"],  # Send test email to yourself
-            "subject": "🧪 E&S Decorations - Resend API Test",
-            "html": """
-            <div style="font-family: Arial, sans-serif; padding: 20px; background: #f5f5f5;">
-                <div style="max-width: 500px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px;">
-                    <h2 style="color: #667eea; text-align: center;">✅ Resend API Test Successful!</h2>
-                    <p>This is a test email to verify that Resend API integration is working correctly with your E&S Decorations website.</p>
-                    <p><strong>Test Details:</strong></p>
-                    <ul>
-                        <li>API Integration: ✅ Working</li>
-                        <li>Email Sending: ✅ Successful</li>
-                        <li>From Address: esdecorationsind@gmail.com</li>
-                        <li>Test Time: Just now</li>
-                    </ul>
-                    <p style="text-align: center; margin-top: 30px;">
-                        <span style="background: #667eea; color: white; padding: 10px 20px; border-radius: 5px;">
-                            🎉 Ready for Production!
-                        </span>
-                    </p>
-                </div>
-            </div>
-            """,
-            "text": "✅ Resend API Test Successful! This test email confirms that Resend API integration is working correctly with your E&S Decorations website.",
-            "reply_to": "esdecorationsind@gmail.com"
-        }
+        params = email_params("test", [EMAIL_REPLY_TO])  # Send test email to yourself
 
-        email_response = resend.Emails.send(params)
-        
-        # Handle different response formats
-        email_id = None
-        if hasattr(email_response, 'id'):
-            email_id = email_response.id
-        elif isinstance(email_response, dict) and 'id' in email_response:
-            email_id = email_response['id']
-        else:
-            email_id = "unknown"
+        # Sent directly rather than queued, to report whether Resend accepts it
+        email_id = await deliver_email(params)
             
         return {
             "success": True,
             "message": "Test email sent successfully!",
             "email_id": email_id,
             "from": EMAIL_FROM,
-            "to": "esdecorationsind@gmail.com"
+            "to": EMAIL_REPLY_TO
         }
     except Exception as e:
         return {
@@ -0,0 +1,124 @@
+"""Storage saved and CPU spent by at-rest zstd compression of blobs.
+
+Run from the backend directory:
+
+    python -m benchmarks.blob_compression                # synthetic corpus
+    python -m benchmarks.blob_compression cv.pdf ...     # your own files
+"""
+import io
+import os
+import random
+import sys
+import time
+import zipfile
+
+import magic
+import zstandard
+from PIL import Image
+
+from blob_compression import choose_zstd_level, worth_storing_compressed
+
+WORDS = (
+    "experience event decoration wedding catering photography team client venue "
+    "management planning floral lighting stage design coordination budget guest "
+    "schedule vendor kottayam kerala responsible delivered handled customer"
+).split()
+
+
+def prose(word_count: int, seed: int) -> str:
+    rng = random.Random(seed)
+    sentences = []
+    while word_count > 0:
+        length = rng.randint(6, 18)
+        sentences.append(" ".join(rng.choice(WORDS) for _ in range(length)).capitalize() + ".")
+        word_count -= length
+    return " ".join(sentences)
+
+
+def text_pdf(text: str) -> bytes:
+    """A minimal PDF with an uncompressed text content stream, like many CV exporters write"""
+    lines = "\n".join(f"({text[i:i + 90]}) Tj T*" for i in range(0, len(text), 90))
+    stream = f"BT /F1 10 Tf 12 TL 50 800 Td\n{lines}\nET".encode()
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Contents 4 0 R "
+        b"/Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    body = b"%PDF-1.4\n"
+    for number, obj in enumerate(objects, start=1):
+        body += b"%d 0 obj\n" % number + obj + b"\nendobj\n"
+    return body + b"trailer\n<< /Root 1 0 R >>\n%%EOF\n"
+
+
+def scanned_pdf() -> bytes:
+    """A photographed CV: one JPEG page, already compressed"""
+    page = Image.merge("RGB", [Image.effect_noise((1240, 1754), 30)] * 3)
+    buffer = io.BytesIO()
+    page.save(buffer, format="PDF", resolution=150)
+    return buffer.getvalue()
+
+
+def docx(text: str) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", "<Types/>")
+        archive.writestr("word/document.xml", f"<w:document><w:body><w:p>{text}</w:p></w:body></w:document>")
+    return buffer.getvalue()
+
+
+def synthetic_corpus():
+    cv_text = prose(900, seed=1)
+    return [
+        ("cv text.pdf", text_pdf(cv_text)),
+        ("cv long text.pdf", text_pdf(prose(6000, seed=2))),
+        ("cv scanned.pdf", scanned_pdf()),
+        ("cv.docx", docx(cv_text)),
+        ("notes.txt", prose(20000, seed=3).encode()),
+    ]
+
+
+def measure(data: bytes, content_type: str):
+    level = choose_zstd_level(content_type)
+    if level is None:
+        return None, len(data), 0.0, 0.0
+
+    started = time.perf_counter()
+    compressed = zstandard.ZstdCompressor(level=level).compress(data)
+    compressed_at = time.perf_counter()
+    zstandard.ZstdDecompressor().decompress(compressed)
+    decompressed_at = time.perf_counter()
+
+    if not worth_storing_compressed(len(data), len(compressed)):
+        return f"{level} (kept raw)", len(data), compressed_at - started, 0.0
+    return level, len(compressed), compressed_at - started, decompressed_at - compressed_at
+
+
+def main(paths):
+    corpus = [(os.path.basename(p), open(p, "rb").read()) for p in paths] or synthetic_corpus()
+
+    print(f"{'file':<20} {'content type':<32} {'level':>14} {'raw':>9} {'stored':>9} "
+          f"{'saved':>6} {'compress':>9} {'decompress':>10}")
+    total_raw = total_stored = 0
+    total_compress = total_decompress = 0.0
+    for name, data in corpus:
+        content_type = magic.from_buffer(data[:2048], mime=True)
+        level, stored, compress_time, decompress_time = measure(data, content_type)
+        total_raw += len(data)
+        total_stored += stored
+        total_compress += compress_time
+        total_decompress += decompress_time
+        print(f"{name[:20]:<20} {content_type[:32]:<32} {str(level if level is not None else 'skipped'):>14} "
+              f"{len(data) // 1024:>8}K {stored // 1024:>8}K {1 - stored / len(data):>6.0%} "
+              f"{compress_time * 1000:>7.1f}ms {decompress_time * 1000:>8.1f}ms")
+
+    print()
+    print(f"total: {total_raw // 1024}K -> {total_stored // 1024}K "
+          f"({1 - total_stored / total_raw:.0%} saved), "
+          f"{total_compress * 1000:.0f}ms compressing, {total_decompress * 1000:.0f}ms decompressing")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
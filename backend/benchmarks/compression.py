@@ -0,0 +1,68 @@
+"""Compare the fixed quality ladder with quality/scale bisection.
+
+Run from the backend directory:
+
+    python -m benchmarks.compression                 # synthetic corpus
+    python -m benchmarks.compression photo1.jpg ...  # your own files
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+
+from PIL import Image
+
+from image_processing import SmartImageCompressor
+
+TARGET_SIZES = [5 * 1024 * 1024, 1024 * 1024, 400 * 1024, 150 * 1024]
+
+
+def synthetic_corpus():
+    """Photo-like test images: smooth gradients with varying amounts of noise"""
+    corpus = []
+    for width, height, noise in [(4032, 3024, 20), (6000, 4000, 60), (3000, 2000, 120)]:
+        gradient = Image.linear_gradient("L").resize((width, height))
+        texture = Image.effect_noise((width, height), noise)
+        image = Image.merge("RGB", (gradient, texture, gradient.rotate(90).resize((width, height))))
+        buffer = io.BytesIO()
+        image.save(buffer, format="JPEG", quality=95)
+        corpus.append((f"synthetic {width}x{height} noise={noise}", buffer.getvalue()))
+    return corpus
+
+
+def run(image_bytes: bytes, target_size: int, strategy: str):
+    started = time.perf_counter()
+    # The compressor narrates every attempt; keep the benchmark output readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        jpeg_bytes, metadata = SmartImageCompressor.progressive_compress(
+            image_bytes, target_size=target_size, strategy=strategy
+        )
+    return time.perf_counter() - started, metadata
+
+
+def main(paths):
+    corpus = [(os.path.basename(p), open(p, "rb").read()) for p in paths] or synthetic_corpus()
+
+    print(f"{'image':<34} {'target':>8} {'strategy':>8} {'encodes':>7} {'time':>8} "
+          f"{'quality':>7} {'size':>9} {'dimensions':>11}")
+    totals = {"ladder": [0, 0.0], "bisect": [0, 0.0]}
+    for name, image_bytes in corpus:
+        for target_size in TARGET_SIZES:
+            for strategy in ("ladder", "bisect"):
+                elapsed, metadata = run(image_bytes, target_size, strategy)
+                totals[strategy][0] += metadata["encode_attempts"]
+                totals[strategy][1] += elapsed
+                width, height = metadata["final_dimensions"]
+                print(f"{name[:34]:<34} {target_size // 1024:>7}K {strategy:>8} "
+                      f"{metadata['encode_attempts']:>7} {elapsed * 1000:>6.0f}ms "
+                      f"{metadata['quality_used']:>7} {metadata['final_size'] // 1024:>8}K "
+                      f"{width:>5}x{height:<5}")
+
+    print()
+    for strategy, (encodes, elapsed) in totals.items():
+        print(f"{strategy:>8}: {encodes} encodes, {elapsed:.2f}s total")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,59 @@
+"""Cost of building email params: the old f-string bodies versus the template registry.
+
+Run from the backend directory:
+
+    python -m benchmarks.email_templates          # 2000 emails per run
+    python -m benchmarks.email_templates 10000
+
+"f-strings" is the acceptance/rejection code app.py had before the
+registry (benchmarks/legacy_email_bodies.py): no escaping, and a separate
+hand-written text part. "render" is one full Jinja render of the HTML and
+text templates per email, as single sends do; "render_many" is the batch
+path bulk status updates use, one skeleton per batch filled per recipient.
+"""
+import sys
+import time
+
+from benchmarks.legacy_email_bodies import legacy_acceptance_params, legacy_rejection_params
+from email_templates import EmailTemplateRegistry
+
+GLOBALS = {"contact_email": "esdecorationsind@gmail.com", "email_from": "E&S Decorations <noreply@esdecorations.in>"}
+LEGACY = {"acceptance": legacy_acceptance_params, "rejection": legacy_rejection_params}
+BULK_EMAILS = 100
+
+
+def per_second(run, count: int) -> float:
+    started = time.perf_counter()
+    run()
+    return count / (time.perf_counter() - started)
+
+
+def main(count: int):
+    registry = EmailTemplateRegistry(globals=GLOBALS).load()
+    names = [f"Applicant {number}" for number in range(count)]
+
+    print(f"{count} emails per run\n")
+    print(f"{'template':<12} {'f-strings':>12} {'render':>12} {'render_many':>12}")
+    for template, legacy in LEGACY.items():
+        contexts = [{"applicant_name": name} for name in names]
+        old = per_second(lambda: [legacy(name, "applicant@example.com") for name in names], count)
+        single = per_second(lambda: [registry.render(template, **context) for context in contexts], count)
+        batch = per_second(lambda: registry.render_many(template, contexts), count)
+        print(f"{template:<12} {old:>10.0f}/s {single:>10.0f}/s {batch:>10.0f}/s")
+
+    # What one bulk status update of BULK_EMAILS rejections spends building params
+    contexts = [{"applicant_name": name} for name in names[:BULK_EMAILS]]
+    timings = {}
+    for label, run in [
+        ("f-strings", lambda: [legacy_rejection_params(name, "a@example.com") for name in names[:BULK_EMAILS]]),
+        ("render", lambda: [registry.render("rejection", **context) for context in contexts]),
+        ("render_many", lambda: registry.render_many("rejection", contexts))
+    ]:
+        started = time.perf_counter()
+        run()
+        timings[label] = (time.perf_counter() - started) * 1000
+    print(f"\n{BULK_EMAILS} rejection emails: " + ", ".join(f"{label} {ms:.2f}ms" for label, ms in timings.items()))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,113 @@
+"""Sends per second through the Resend SDK versus the pooled httpx transport.
+
+Runs against the local stand-in server (fake_resend.py), started on a free
+port, so no real mail is sent. Run from the backend directory:
+
+    python -m benchmarks.email_transport                 # 200 emails, 20ms server latency
+    python -m benchmarks.email_transport 500 50          # 500 emails, 50ms latency
+
+Both sides talk plain HTTP to localhost here; against api.resend.com every
+new SDK connection also pays a TLS handshake, so the real gap is wider.
+"""
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+
+# The Resend SDK reads its key on import
+os.environ.setdefault("RESEND_API_KEY", "re_benchmark")
+
+import resend
+from email_transport import RESEND_BATCH_LIMIT, ResendHttpTransport, ResendSdkTransport
+
+CONCURRENCY = 10
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_fake_resend(port: int, latency_ms: int) -> subprocess.Popen:
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "fake_resend:app", "--port", str(port), "--log-level", "warning"],
+        env={**os.environ, "FAKE_RESEND_LATENCY_MS": str(latency_ms)}
+    )
+    for _ in range(50):
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/emails")
+            return server
+        except httpx.TransportError:
+            time.sleep(0.1)
+    server.terminate()
+    raise RuntimeError("fake Resend server did not start")
+
+
+def email(number: int):
+    return {
+        "from": "E&S Decorations <noreply@esdecorations.in>",
+        "to": [f"applicant{number}@example.com"],
+        "subject": "Your application",
+        "html": "<p>" + "Thank you for applying. " * 40 + "</p>",
+        "text": "Thank you for applying. " * 40
+    }
+
+
+async def sequential(transport, count: int):
+    for number in range(count):
+        await transport.send(email(number))
+
+
+async def concurrent(transport, count: int):
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def send(number):
+        async with semaphore:
+            await transport.send(email(number))
+
+    await asyncio.gather(*(send(number) for number in range(count)))
+
+
+async def batched(transport, count: int):
+    for start in range(0, count, RESEND_BATCH_LIMIT):
+        await transport.send_batch([email(n) for n in range(start, min(start + RESEND_BATCH_LIMIT, count))])
+
+
+async def main(count: int, latency_ms: int):
+    port = free_port()
+    server = start_fake_resend(port, latency_ms)
+    api_url = f"http://127.0.0.1:{port}"
+    resend.api_url = api_url
+
+    sdk = ResendSdkTransport()
+    pooled = ResendHttpTransport(os.environ["RESEND_API_KEY"], api_url=api_url, max_connections=CONCURRENCY)
+    runs = [
+        ("sdk, one at a time", sdk, sequential),
+        (f"sdk, {CONCURRENCY} concurrent", sdk, concurrent),
+        ("httpx pool, one at a time", pooled, sequential),
+        (f"httpx pool, {CONCURRENCY} concurrent", pooled, concurrent),
+        ("httpx pool, batch API", pooled, batched),
+    ]
+    print(f"{count} emails, {latency_ms}ms simulated Resend latency\n")
+    print(f"{'transport':<32} {'seconds':>8} {'emails/s':>9}")
+    try:
+        for label, transport, run in runs:
+            started = time.perf_counter()
+            await run(transport, count)
+            elapsed = time.perf_counter() - started
+            print(f"{label:<32} {elapsed:>8.2f} {count / elapsed:>9.0f}")
+    finally:
+        await pooled.close()
+        server.terminate()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    ))
@@ -0,0 +1,92 @@
+"""Latency of a public endpoint while a burst of admin logins is being checked.
+
+Fires concurrent password checks at a small ASGI app and, meanwhile, polls
+a cheap public route every 20ms (latency counted from when each poll was
+due), once with bcrypt called inline on the event loop (as the login
+endpoints used to) and once through PasswordHasher's thread pool. Logins
+beyond the pool's queue capacity are answered 503. Run from the backend
+directory:
+
+    python -m benchmarks.login_burst              # 10 logins, cost 12
+    python -m benchmarks.login_burst 30 10        # 30 logins, cost 10
+"""
+import asyncio
+import statistics
+import sys
+import time
+
+import bcrypt
+import httpx
+from fastapi import FastAPI, HTTPException
+
+from password_hashing import PasswordHasher, PasswordHashingBusy
+
+POLL_INTERVAL = 0.02
+
+
+def build_app(hasher: PasswordHasher, hashed_password: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/faqs")
+    async def public_read():
+        return {"faqs": []}
+
+    @app.post("/login/inline")
+    async def login_inline():
+        return {"ok": bcrypt.checkpw(b"correct horse", hashed_password.encode())}
+
+    @app.post("/login/pooled")
+    async def login_pooled():
+        try:
+            return {"ok": await hasher.verify("correct horse", hashed_password)}
+        except PasswordHashingBusy as e:
+            raise HTTPException(status_code=503, detail=str(e))
+
+    return app
+
+
+async def burst(client: httpx.AsyncClient, path: str, logins: int):
+    latencies = []
+    done = asyncio.Event()
+
+    async def poll():
+        # Timed from when the request was due, so time spent waiting for a blocked loop counts
+        while not done.is_set():
+            due = time.perf_counter() + POLL_INTERVAL
+            await asyncio.sleep(POLL_INTERVAL)
+            await client.get("/faqs")
+            latencies.append((time.perf_counter() - due) * 1000)
+
+    poller = asyncio.create_task(poll())
+    await asyncio.sleep(POLL_INTERVAL * 2)
+    started = time.perf_counter()
+    responses = await asyncio.gather(*(client.post(path) for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await poller
+    statuses = [response.status_code for response in responses]
+    return latencies, elapsed, statuses
+
+
+async def main(logins: int, rounds: int):
+    hasher = PasswordHasher(rounds=rounds)
+    hashed_password = bcrypt.hashpw(b"correct horse", bcrypt.gensalt(rounds=rounds)).decode()
+    app = build_app(hasher, hashed_password)
+    print(f"{logins} concurrent logins, bcrypt cost {rounds}, {hasher.max_workers} hashing thread(s), "
+          f"queue capacity {hasher.capacity}\n")
+    print(f"{'bcrypt':<8} {'burst s':>8} {'200s':>5} {'503s':>5} "
+          f"{'polls':>6} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark") as client:
+        for label, path in [("inline", "/login/inline"), ("pooled", "/login/pooled")]:
+            latencies, elapsed, statuses = await burst(client, path, logins)
+            p95 = statistics.quantiles(latencies, n=20, method="inclusive")[-1] if len(latencies) > 1 else latencies[0]
+            print(f"{label:<8} {elapsed:>8.2f} {statuses.count(200):>5} {statuses.count(503):>5} "
+                  f"{len(latencies):>6} {statistics.median(latencies):>8.1f} {p95:>8.1f} {max(latencies):>8.1f}")
+    hasher.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 12
+    ))
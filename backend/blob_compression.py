@@ -0,0 +1,151 @@
+import os
+import tempfile
+from typing import Any, Dict, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from blob_store import BlobStore, STREAM_CHUNK_SIZE
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    print("⚠️ zstd blob compression not available - install zstandard")
+
+# Formats that already carry their own compression; a second pass only costs CPU
+INCOMPRESSIBLE_TYPE_PREFIXES = (
+    "image/",
+    "video/",
+    "audio/",
+    "application/zip",
+    "application/gzip",
+    "application/x-7z-compressed",
+    "application/x-rar",
+    "application/zstd",
+    # DOCX/XLSX/ODT are ZIP containers
+    "application/vnd.openxmlformats-officedocument.",
+    "application/vnd.oasis.opendocument.",
+)
+
+# zstd level by content type prefix. Text compresses far better per level, so it
+# gets more effort; PDFs mix compressed streams with plain-text structure.
+ZSTD_LEVELS = {
+    "text/": 12,
+    "application/json": 12,
+    "application/xml": 12,
+    "application/rtf": 12,
+    "application/pdf": 9,
+    "application/msword": 9,
+}
+DEFAULT_ZSTD_LEVEL = 3
+# Keep the raw bytes unless compression saves at least this fraction
+MIN_SAVINGS = 0.05
+
+
+def choose_zstd_level(content_type: str) -> Optional[int]:
+    """zstd level for a content type, or None when it should be stored as is"""
+    if not ZSTD_AVAILABLE or content_type.startswith(INCOMPRESSIBLE_TYPE_PREFIXES):
+        return None
+    for prefix, level in ZSTD_LEVELS.items():
+        if content_type.startswith(prefix):
+            return level
+    return DEFAULT_ZSTD_LEVEL
+
+
+def worth_storing_compressed(original_length: int, compressed_length: int) -> bool:
+    return compressed_length <= original_length * (1 - MIN_SAVINGS)
+
+
+def _compress_file(path: str, level: int) -> str:
+    """zstd-compress a file into a temp file next to it, in chunks"""
+    compressor = zstandard.ZstdCompressor(level=level)
+    with open(path, "rb") as source, tempfile.NamedTemporaryFile(
+        dir=os.path.dirname(path), suffix=".zst", delete=False
+    ) as target:
+        compressor.copy_stream(source, target, size=os.path.getsize(path), read_size=STREAM_CHUNK_SIZE)
+    return target.name
+
+
+class CompressedBlobStore(BlobStore):
+    """At-rest zstd compression on top of another blob store.
+
+    The level is picked from the content type and already-compressed formats
+    are stored untouched. Compressed blobs record "codec", "zstd_level" and
+    "original_length" in their metadata; get_info() reports the original
+    length and stream() decompresses on the fly, so callers (and Range
+    requests) only ever see the original bytes.
+    """
+
+    def __init__(self, inner: BlobStore):
+        self.inner = inner
+
+    @staticmethod
+    def _logical_info(info: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        if not info or info["metadata"].get("codec") != "zstd":
+            return info
+        return {**info, "length": info["metadata"]["original_length"], "stored_length": info["length"]}
+
+    @staticmethod
+    def _codec_metadata(metadata, level: int, original_length: int) -> Dict[str, Any]:
+        return {**(metadata or {}), "codec": "zstd", "zstd_level": level, "original_length": original_length}
+
+    async def put(self, data, content_type, metadata=None):
+        level = choose_zstd_level(content_type)
+        if level is None:
+            return await self.inner.put(data, content_type, metadata)
+
+        compressed = await run_in_threadpool(zstandard.ZstdCompressor(level=level).compress, data)
+        if not worth_storing_compressed(len(data), len(compressed)):
+            return await self.inner.put(data, content_type, metadata)
+        info = await self.inner.put(
+            compressed, content_type, self._codec_metadata(metadata, level, len(data))
+        )
+        return self._logical_info(info)
+
+    async def put_file(self, path, content_type, metadata=None):
+        level = choose_zstd_level(content_type)
+        if level is None:
+            return await self.inner.put_file(path, content_type, metadata)
+
+        compressed_path = await run_in_threadpool(_compress_file, path, level)
+        try:
+            original_length = os.path.getsize(path)
+            if not worth_storing_compressed(original_length, os.path.getsize(compressed_path)):
+                return await self.inner.put_file(path, content_type, metadata)
+            info = await self.inner.put_file(
+                compressed_path, content_type, self._codec_metadata(metadata, level, original_length)
+            )
+            return self._logical_info(info)
+        finally:
+            os.unlink(compressed_path)
+
+    async def get_info(self, blob_id):
+        return self._logical_info(await self.inner.get_info(blob_id))
+
+    async def stream(self, blob_id, start=0, end=None):
+        info = await self.inner.get_info(blob_id)
+        if not info or info["metadata"].get("codec") != "zstd":
+            async for chunk in self.inner.stream(blob_id, start, end):
+                yield chunk
+            return
+
+        # zstd frames are not seekable: decompress from the start, drop bytes before
+        # the range and stop once it is covered
+        decompressor = zstandard.ZstdDecompressor().decompressobj()
+        position = 0
+        async for compressed in self.inner.stream(blob_id):
+            chunk = decompressor.decompress(compressed)
+            chunk_start, position = position, position + len(chunk)
+            if position <= start:
+                continue
+            chunk = chunk[max(start - chunk_start, 0):]
+            if end is not None and position > end + 1:
+                chunk = chunk[:len(chunk) - (position - end - 1)]
+            if chunk:
+                yield chunk
+            if end is not None and position > end:
+                return
+
+    async def delete(self, blob_id):
+        await self.inner.delete(blob_id)
@@ -0,0 +1,270 @@
+import datetime
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Optional
+
+from motor.motor_asyncio import AsyncIOMotorGridFSBucket
+from pymongo.errors import DuplicateKeyError
+from starlette.concurrency import run_in_threadpool
+
+# Blobs are addressed by the SHA-256 of their bytes, so identical uploads share one copy
+BLOB_ID_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+STREAM_CHUNK_SIZE = 256 * 1024
+
+
+def content_id(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_content_id(path: str) -> str:
+    """SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        while chunk := handle.read(STREAM_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def is_blob_id(value: Any) -> bool:
+    return isinstance(value, str) and bool(BLOB_ID_PATTERN.match(value))
+
+
+class BlobStore(ABC):
+    """Content-addressed binary storage.
+
+    Every backend returns the same info dict from put() and get_info():
+    {"id", "length", "content_type", "metadata", "uploaded_at"}.
+    """
+
+    @abstractmethod
+    async def put(
+        self,
+        data: bytes,
+        content_type: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Store data under its SHA-256; storing the same bytes again is a no-op"""
+
+    async def put_file(
+        self,
+        path: str,
+        content_type: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Like put() but copies from a file on disk without loading it into memory"""
+        data = await run_in_threadpool(Path(path).read_bytes)
+        return await self.put(data, content_type, metadata)
+
+    @abstractmethod
+    async def get_info(self, blob_id: str) -> Optional[Dict[str, Any]]:
+        """Info dict of a stored blob, or None if there is no such blob"""
+
+    @abstractmethod
+    def stream(
+        self,
+        blob_id: str,
+        start: int = 0,
+        end: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """Yield bytes start..end (inclusive) of a blob in chunks; implement as an async generator"""
+
+    async def read(self, blob_id: str) -> bytes:
+        return b"".join([chunk async for chunk in self.stream(blob_id)])
+
+    @abstractmethod
+    async def delete(self, blob_id: str):
+        """Remove a blob and its metadata"""
+
+
+class GridFSBlobStore(BlobStore):
+    """Blobs in a MongoDB GridFS bucket, using the content hash as the file _id"""
+
+    def __init__(self, database, bucket_name: str):
+        self.bucket = AsyncIOMotorGridFSBucket(database, bucket_name=bucket_name)
+        self.files = database[f"{bucket_name}.files"]
+
+    @staticmethod
+    def _to_info(file_doc: Dict[str, Any]) -> Dict[str, Any]:
+        metadata = dict(file_doc.get("metadata") or {})
+        content_type = metadata.pop("contentType", "application/octet-stream")
+        return {
+            "id": file_doc["_id"],
+            "length": file_doc["length"],
+            "content_type": content_type,
+            "metadata": metadata,
+            "uploaded_at": file_doc.get("uploadDate")
+        }
+
+    async def put(self, data, content_type, metadata=None):
+        blob_id = content_id(data)
+        existing = await self.files.find_one({"_id": blob_id})
+        if existing:
+            return self._to_info(existing)
+
+        try:
+            await self.bucket.upload_from_stream_with_id(
+                blob_id,
+                blob_id,
+                data,
+                metadata={**(metadata or {}), "contentType": content_type}
+            )
+        except DuplicateKeyError:
+            # Another request stored the same bytes first
+            pass
+        return await self.get_info(blob_id)
+
+    async def put_file(self, path, content_type, metadata=None):
+        blob_id = await run_in_threadpool(file_content_id, path)
+        existing = await self.files.find_one({"_id": blob_id})
+        if existing:
+            return self._to_info(existing)
+
+        with open(path, "rb") as source:
+            try:
+                # GridFS reads the source in chunk-size pieces
+                await self.bucket.upload_from_stream_with_id(
+                    blob_id,
+                    blob_id,
+                    source,
+                    metadata={**(metadata or {}), "contentType": content_type}
+                )
+            except DuplicateKeyError:
+                pass
+        return await self.get_info(blob_id)
+
+    async def get_info(self, blob_id):
+        file_doc = await self.files.find_one({"_id": blob_id})
+        return self._to_info(file_doc) if file_doc else None
+
+    async def stream(self, blob_id, start=0, end=None):
+        grid_out = await self.bucket.open_download_stream(blob_id)
+        last = grid_out.length - 1 if end is None else min(end, grid_out.length - 1)
+        grid_out.seek(start)
+        remaining = last - start + 1
+        while remaining > 0:
+            chunk = await grid_out.read(min(STREAM_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+    async def delete(self, blob_id):
+        await self.bucket.delete(blob_id)
+
+
+class FilesystemBlobStore(BlobStore):
+    """Blobs on local disk as <root>/<id[:2]>/<id> with a JSON sidecar for metadata"""
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def _path(self, blob_id: str) -> str:
+        return os.path.join(self.root, blob_id[:2], blob_id)
+
+    def _write(self, blob_id: str, data: bytes, info: Dict[str, Any]):
+        directory = os.path.dirname(self._path(blob_id))
+        os.makedirs(directory, exist_ok=True)
+        # Write to a temp file and rename so readers never see a partial blob
+        with tempfile.NamedTemporaryFile(dir=directory, delete=False) as handle:
+            handle.write(data)
+        os.replace(handle.name, self._path(blob_id))
+        self._write_info(blob_id, info)
+
+    def _copy(self, blob_id: str, path: str, info: Dict[str, Any]):
+        directory = os.path.dirname(self._path(blob_id))
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=directory, delete=False) as handle, open(path, "rb") as source:
+            shutil.copyfileobj(source, handle, STREAM_CHUNK_SIZE)
+        os.replace(handle.name, self._path(blob_id))
+        self._write_info(blob_id, info)
+
+    def _write_info(self, blob_id: str, info: Dict[str, Any]):
+        # Written last: a blob counts as stored once its sidecar exists
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(self._path(blob_id)), delete=False) as handle:
+            handle.write(json.dumps(info, default=str).encode())
+        os.replace(handle.name, self._path(blob_id) + ".json")
+
+    def _read_info(self, blob_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(blob_id) + ".json") as handle:
+                return json.load(handle)
+        except FileNotFoundError:
+            return None
+
+    async def put(self, data, content_type, metadata=None):
+        blob_id = content_id(data)
+        existing = await self.get_info(blob_id)
+        if existing:
+            return existing
+
+        info = {
+            "id": blob_id,
+            "length": len(data),
+            "content_type": content_type,
+            "metadata": metadata or {},
+            "uploaded_at": datetime.datetime.utcnow().isoformat()
+        }
+        await run_in_threadpool(self._write, blob_id, data, info)
+        return info
+
+    async def put_file(self, path, content_type, metadata=None):
+        blob_id = await run_in_threadpool(file_content_id, path)
+        existing = await self.get_info(blob_id)
+        if existing:
+            return existing
+
+        info = {
+            "id": blob_id,
+            "length": os.path.getsize(path),
+            "content_type": content_type,
+            "metadata": metadata or {},
+            "uploaded_at": datetime.datetime.utcnow().isoformat()
+        }
+        await run_in_threadpool(self._copy, blob_id, path, info)
+        return info
+
+    async def get_info(self, blob_id):
+        if not is_blob_id(blob_id):
+            return None
+        return await run_in_threadpool(self._read_info, blob_id)
+
+    async def stream(self, blob_id, start=0, end=None):
+        handle = await run_in_threadpool(open, self._path(blob_id), "rb")
+        try:
+            await run_in_threadpool(handle.seek, start)
+            remaining = None if end is None else end - start + 1
+            while remaining is None or remaining > 0:
+                size = STREAM_CHUNK_SIZE if remaining is None else min(STREAM_CHUNK_SIZE, remaining)
+                chunk = await run_in_threadpool(handle.read, size)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+        finally:
+            handle.close()
+
+    async def delete(self, blob_id):
+        for suffix in ("", ".json"):
+            try:
+                await run_in_threadpool(os.unlink, self._path(blob_id) + suffix)
+            except FileNotFoundError:
+                pass
+
+
+def create_blob_store(database, bucket_name: str) -> BlobStore:
+    """Pick the backend from BLOB_STORE_BACKEND ("gridfs" by default, or "filesystem")"""
+    backend = os.getenv("BLOB_STORE_BACKEND", "gridfs").lower()
+    if backend == "filesystem":
+        root = os.getenv("BLOB_STORE_DIR", os.path.join(os.path.dirname(__file__), "blob_store"))
+        return FilesystemBlobStore(os.path.join(root, bucket_name))
+    if backend == "gridfs":
+        return GridFSBlobStore(database, bucket_name)
+    raise ValueError(f"Unknown BLOB_STORE_BACKEND: {backend}")
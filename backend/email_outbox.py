@@ -0,0 +1,300 @@
+import asyncio
+import datetime
+import random
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from bson import ObjectId
+from pymongo import ReturnDocument, UpdateOne
+
+# Outbox document states: pending -> sending -> sent, or back to pending with a
+# later next_attempt_at after a failure, or dead once retries run out
+PENDING, SENDING, SENT, DEAD = "pending", "sending", "sent", "dead"
+
+DEFAULT_WORKERS = 2
+# Emails queued together go out this many per provider call (Resend's batch limit)
+DEFAULT_BATCH_SIZE = 100
+MAX_ATTEMPTS = 8
+# Backoff before retry n is BASE_RETRY_DELAY * 2**(n-1), capped, with jitter
+BASE_RETRY_DELAY = 10
+MAX_RETRY_DELAY = 3600
+# A claimed email whose worker died is picked up again after this long
+SEND_LEASE_SECONDS = 120
+# Idle workers wake this often to catch retries falling due and other processes' emails
+POLL_SECONDS = 5
+
+
+class PermanentEmailError(Exception):
+    """Raised by a sender when retrying cannot help (rejected address, invalid payload)"""
+
+
+def retry_delay(attempts: int) -> float:
+    delay = min(BASE_RETRY_DELAY * 2 ** (attempts - 1), MAX_RETRY_DELAY)
+    return delay * random.uniform(0.5, 1.0)
+
+
+class EmailOutbox:
+    """Durable queue of outgoing emails, delivered by background worker tasks.
+
+    Request handlers enqueue() the send parameters into a Mongo collection
+    and return; workers claim due emails one at a time (an atomic
+    find_one_and_update, so several processes can share the collection),
+    call ``send(params)`` and record the provider's email ID. Failures are
+    retried with exponential backoff and dead-lettered after MAX_ATTEMPTS,
+    or at once for a PermanentEmailError.
+
+    With a ``send_batch`` callable, emails queued together by enqueue_many()
+    share a batch_id and are claimed and sent as one provider call. A batch
+    the provider rejects outright is split up and retried email by email,
+    so one bad address cannot sink the rest.
+
+    Emails enqueued with ``expires_at`` (e.g. login codes) are dropped
+    rather than sent late, and ``sensitive`` ones have their bodies removed
+    once they are sent or dead.
+    """
+
+    def __init__(
+        self,
+        collection,
+        send: Callable[[Dict[str, Any]], Awaitable[str]],
+        send_batch: Optional[Callable[[List[Dict[str, Any]]], Awaitable[List[str]]]] = None,
+        workers: int = DEFAULT_WORKERS,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ):
+        self.collection = collection
+        self.send = send
+        self.send_batch = send_batch
+        self.batch_size = batch_size
+        self.worker_count = workers
+        self._workers: List[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+        self.sent = 0
+        self.retried = 0
+        self.dead = 0
+
+    async def create_indexes(self):
+        await self.collection.create_index([("status", 1), ("next_attempt_at", 1)])
+        await self.collection.create_index([("status", 1), ("locked_until", 1)])
+        await self.collection.create_index("batch_id")
+        await self.collection.create_index("claim")
+
+    @staticmethod
+    def _document(
+        params: Dict[str, Any],
+        kind: str,
+        now: datetime.datetime,
+        expires_at: Optional[datetime.datetime] = None,
+        sensitive: bool = False,
+        batch_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        return {
+            "kind": kind,
+            "params": params,
+            "status": PENDING,
+            "attempts": 0,
+            "created_at": now,
+            "next_attempt_at": now,
+            "expires_at": expires_at,
+            "sensitive": sensitive,
+            "batch_id": batch_id,
+            "last_error": None,
+            "email_id": None
+        }
+
+    async def enqueue(
+        self,
+        params: Dict[str, Any],
+        kind: str,
+        expires_at: Optional[datetime.datetime] = None,
+        sensitive: bool = False
+    ) -> str:
+        """Queue one email; returns the outbox ID"""
+        result = await self.collection.insert_one(
+            self._document(params, kind, datetime.datetime.utcnow(), expires_at, sensitive)
+        )
+        self._wakeup.set()
+        return str(result.inserted_id)
+
+    async def enqueue_many(self, params_list: List[Dict[str, Any]], kind: str) -> List[str]:
+        """Queue many emails in one insert, grouped into batches of batch_size; returns the outbox IDs"""
+        if not params_list:
+            return []
+        now = datetime.datetime.utcnow()
+        documents = []
+        for start in range(0, len(params_list), self.batch_size):
+            batch_id = str(ObjectId()) if self.send_batch else None
+            documents += [
+                self._document(params, kind, now, batch_id=batch_id)
+                for params in params_list[start:start + self.batch_size]
+            ]
+        result = await self.collection.insert_many(documents)
+        self._wakeup.set()
+        return [str(inserted_id) for inserted_id in result.inserted_ids]
+
+    async def retry(self, outbox_id: str) -> bool:
+        """Give a dead email a fresh set of attempts"""
+        result = await self.collection.update_one(
+            {"_id": ObjectId(outbox_id), "status": DEAD, "sensitive": False},
+            {"$set": {
+                "status": PENDING,
+                "attempts": 0,
+                "next_attempt_at": datetime.datetime.utcnow(),
+                "expires_at": None
+            }}
+        )
+        self._wakeup.set()
+        return result.modified_count == 1
+
+    def start(self):
+        self._workers = [asyncio.create_task(self._work()) for _ in range(self.worker_count)]
+
+    async def stop(self):
+        """Cancel the workers; an email cut off mid-send is retried when its lease expires"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def _claim(self) -> List[Dict[str, Any]]:
+        """Lease the next due email, plus the due rest of its batch if it has one"""
+        now = datetime.datetime.utcnow()
+        claim = str(ObjectId())
+        due = {"$or": [
+            {"status": PENDING, "next_attempt_at": {"$lte": now}},
+            {"status": SENDING, "locked_until": {"$lt": now}}
+        ]}
+        lease = {
+            "$set": {
+                "status": SENDING,
+                "locked_until": now + datetime.timedelta(seconds=SEND_LEASE_SECONDS),
+                "claim": claim
+            },
+            "$inc": {"attempts": 1}
+        }
+        email = await self.collection.find_one_and_update(
+            due, lease, sort=[("next_attempt_at", 1)], return_document=ReturnDocument.AFTER
+        )
+        if email is None or not email.get("batch_id"):
+            return [email] if email else []
+        await self.collection.update_many({"$and": [{"batch_id": email["batch_id"]}, due]}, lease)
+        return await self.collection.find({"claim": claim}).to_list(length=None)
+
+    async def _work(self):
+        while True:
+            # Cleared before looking, so an enqueue() during the lookup still wakes us
+            self._wakeup.clear()
+            try:
+                emails = await self._claim()
+            except Exception as e:
+                print(f"⚠️ Email outbox unavailable: {str(e)}")
+                await asyncio.sleep(POLL_SECONDS)
+                continue
+            if not emails:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), POLL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            try:
+                await self._deliver(emails)
+            except Exception as e:
+                # Recording the outcome failed; the lease runs out and the emails are retried
+                print(f"⚠️ Could not record outcome of {len(emails)} email(s): {str(e)}")
+
+    @staticmethod
+    def _finish_update(email: Dict[str, Any], status: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+        update: Dict[str, Any] = {"$set": {"status": status, **fields}, "$unset": {"locked_until": ""}}
+        if email.get("sensitive"):
+            update["$unset"].update({"params.html": "", "params.text": ""})
+        return update
+
+    async def _finish(self, email: Dict[str, Any], status: str, fields: Dict[str, Any]):
+        await self.collection.update_one({"_id": email["_id"]}, self._finish_update(email, status, fields))
+
+    async def _failed(self, email: Dict[str, Any], error: Exception, now: datetime.datetime, delay: float):
+        recipients = ", ".join(email["params"].get("to", []))
+        if isinstance(error, PermanentEmailError) or email["attempts"] >= MAX_ATTEMPTS:
+            self.dead += 1
+            await self._finish(email, DEAD, {"last_error": str(error), "failed_at": now})
+            print(f"❌ {email['kind']} email to {recipients} dead-lettered after "
+                  f"{email['attempts']} attempt(s): {str(error)}")
+            return
+        self.retried += 1
+        await self.collection.update_one(
+            {"_id": email["_id"]},
+            {
+                "$set": {
+                    "status": PENDING,
+                    "last_error": str(error),
+                    "next_attempt_at": now + datetime.timedelta(seconds=delay)
+                },
+                "$unset": {"locked_until": ""}
+            }
+        )
+        print(f"⚠️ {email['kind']} email to {recipients} failed (attempt {email['attempts']}), "
+              f"retrying in {delay:.0f}s: {str(error)}")
+
+    async def _deliver(self, emails: List[Dict[str, Any]]):
+        now = datetime.datetime.utcnow()
+        live = []
+        for email in emails:
+            if email.get("expires_at") and email["expires_at"] < now:
+                self.dead += 1
+                await self._finish(email, DEAD, {"last_error": "expired before it could be delivered"})
+                print(f"❌ {email['kind']} email to {', '.join(email['params'].get('to', []))} expired undelivered")
+            else:
+                live.append(email)
+        if len(live) == 1:
+            await self._deliver_one(live[0], now)
+        elif live:
+            await self._deliver_batch(live, now)
+
+    async def _deliver_one(self, email: Dict[str, Any], now: datetime.datetime):
+        try:
+            email_id = await self.send(email["params"])
+        except Exception as e:
+            await self._failed(email, e, now, retry_delay(email["attempts"]))
+            return
+        self.sent += 1
+        await self._finish(email, SENT, {"email_id": email_id, "sent_at": datetime.datetime.utcnow()})
+        print(f"✅ {email['kind']} email sent to {', '.join(email['params'].get('to', []))}. Email ID: {email_id}")
+
+    async def _deliver_batch(self, emails: List[Dict[str, Any]], now: datetime.datetime):
+        try:
+            email_ids = await self.send_batch([email["params"] for email in emails])
+        except PermanentEmailError as e:
+            # The whole batch is refused for one bad email; send them singly so only it fails
+            await self.collection.update_many(
+                {"_id": {"$in": [email["_id"] for email in emails]}},
+                {
+                    "$set": {"status": PENDING, "next_attempt_at": now, "batch_id": None},
+                    "$unset": {"locked_until": ""},
+                    "$inc": {"attempts": -1}
+                }
+            )
+            print(f"⚠️ Batch of {len(emails)} emails refused, sending them one by one: {str(e)}")
+            return
+        except Exception as e:
+            # One delay for the whole batch so it is retried together
+            delay = retry_delay(max(email["attempts"] for email in emails))
+            for email in emails:
+                await self._failed(email, e, now, delay)
+            return
+
+        sent_at = datetime.datetime.utcnow()
+        await self.collection.bulk_write([
+            UpdateOne(
+                {"_id": email["_id"]},
+                self._finish_update(email, SENT, {"email_id": email_id, "sent_at": sent_at})
+            )
+            for email, email_id in zip(emails, email_ids)
+        ], ordered=False)
+        self.sent += len(emails)
+        print(f"✅ Sent a batch of {len(emails)} {emails[0]['kind']} emails")
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "workers": len(self._workers),
+            "sent": self.sent,
+            "retried": self.retried,
+            "dead": self.dead
+        }
@@ -0,0 +1,270 @@
+import datetime
+import html
+import os
+import re
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from jinja2 import BaseLoader, Environment, FileSystemLoader, StrictUndefined
+from markupsafe import Markup, escape
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), "templates", "email")
+
+# Context the preview endpoint and the benchmark render each template with
+SAMPLE_CONTEXTS: Dict[str, Dict[str, Any]] = {
+    "acceptance": {"applicant_name": "Anjali Menon"},
+    "rejection": {"applicant_name": "Anjali Menon"},
+    "inquiry_reply": {
+        "recipient_name": "Rahul Nair",
+        "original_subject": "Wedding decoration quote",
+        "original_message": "Hi, we are planning a wedding in Kottayam this December for about 300 guests "
+                            "and would like a quote for stage and floral decoration, plus lighting for the hall.",
+        "reply_html": "<p>Thank you for considering us! Our team will call you tomorrow to discuss the details.</p>",
+        "reply_text": "Thank you for considering us! Our team will call you tomorrow to discuss the details."
+    },
+    "admin_verification": {"admin_name": "Admin", "code": "482913", "expires_in_minutes": 5},
+    "test": {"email_from": "E&S Decorations <noreply@esdecorations.in>"}
+}
+
+# Elements that start a new line (or paragraph) in the plain-text part
+PARAGRAPH_TAGS = {"p", "div", "h1", "h2", "h3", "h4", "h5", "h6", "ul", "ol", "table", "tr", "blockquote"}
+SKIPPED_TAGS = {"head", "style", "script"}
+# Jinja statements/expressions/comments (kept as they are in text templates), then HTML tags
+TOKEN_PATTERN = re.compile(
+    r"(\{%.*?%\})|(\{\{.*?\}\})|\{#.*?#\}|<(/?)([a-zA-Z][a-zA-Z0-9]*)([^>]*)>|<!--.*?-->|<![^>]*>",
+    re.S
+)
+HREF_PATTERN = re.compile(r"""href\s*=\s*["']([^"']*)["']""")
+WHITESPACE = re.compile(r"\s+")
+# Stand-ins for per-recipient values when render_many() builds a skeleton; the "&"
+# shows whether a value was autoescaped ("&amp;") or inserted verbatim, and the
+# padding differs between the two renders so length-dependent logic shows up
+SLOT_PATTERN = re.compile(r"\x00([ab])(\d+)(&amp;|&)_*\x00")
+SLOT_PADDING = {"a": 0, "b": 400}
+
+
+class RenderedEmail(NamedTuple):
+    subject: str
+    html: str
+    text: str
+
+
+def _markup_to_text(markup: str, template: bool = False) -> str:
+    """Drop the tags, keeping paragraphs, bullets, line breaks and link URLs.
+
+    With ``template`` set, the input is Jinja source: its tags pass through
+    untouched, so the result is itself a template that renders text.
+    """
+    parts: List[str] = []
+    skipping = 0
+    link = None
+    position = 0
+    for match in TOKEN_PATTERN.finditer(markup):
+        if not skipping and match.start() > position:
+            # Source indentation and line breaks are not content
+            parts.append(WHITESPACE.sub(" ", html.unescape(markup[position:match.start()])))
+        position = match.end()
+        statement, expression, closing, tag, attributes = match.groups()
+        if statement or expression:
+            # Statements are kept even inside <head> so blocks and ifs stay balanced
+            if template and (statement or not skipping):
+                parts.append(match.group())
+            elif not skipping:
+                parts.append(WHITESPACE.sub(" ", match.group()))
+            continue
+        if tag is None:
+            continue
+        tag = tag.lower()
+        if tag in SKIPPED_TAGS:
+            skipping += -1 if closing else 1
+        elif skipping:
+            continue
+        elif tag in PARAGRAPH_TAGS:
+            parts.append("\n\n")
+        elif tag == "li" and not closing:
+            parts.append("\n• ")
+        elif tag == "br":
+            parts.append("\n")
+        elif tag == "a" and not closing:
+            href = HREF_PATTERN.search(attributes)
+            link = html.unescape(href.group(1)) if href else None
+        elif tag == "a" and link:
+            if not link.startswith("mailto:"):
+                parts.append(f" ({link})")
+            link = None
+    if not skipping:
+        parts.append(WHITESPACE.sub(" ", html.unescape(markup[position:])))
+    return "".join(parts)
+
+
+def tidy_text(text: str) -> str:
+    lines = [" ".join(line.split()) for line in text.splitlines()]
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip() + "\n"
+
+
+def html_to_text(markup: str) -> str:
+    """Plain-text alternative of an HTML fragment: paragraphs, bullets, line breaks and link URLs kept"""
+    return tidy_text(_markup_to_text(markup))
+
+
+class _TextTemplateLoader(BaseLoader):
+    """Serves each HTML template converted to a template for its plain-text part"""
+
+    def __init__(self, loader: BaseLoader):
+        self.loader = loader
+
+    def get_source(self, environment, template):
+        source, filename, uptodate = self.loader.get_source(environment, template)
+        return _markup_to_text(source, template=True), filename, uptodate
+
+    def list_templates(self):
+        return self.loader.list_templates()
+
+
+def _trusted_html(markup: str, text: Optional[str] = None) -> Markup:
+    """{{ value|trusted_html(text) }}: markup written by an admin, inserted unescaped"""
+    return Markup(markup)
+
+
+def _trusted_html_as_text(markup: str, text: Optional[str] = None) -> str:
+    # The text part uses the plain-text version when the sender wrote one
+    return text if text else html_to_text(markup)
+
+
+class _Skeleton:
+    """A rendered email split around its per-recipient values, for render_many()"""
+
+    def __init__(self, keys: List[str], subject, html_parts, text):
+        # Each part is (static strings, slot indexes between them)
+        self.keys, self.subject, self.html, self.text = keys, subject, html_parts, text
+
+    @staticmethod
+    def fits(value: str) -> bool:
+        """Only values tidy_text would leave as they are can be filled in after it has run"""
+        return bool(value) and value == " ".join(value.split())
+
+    @staticmethod
+    def _fill(part, values: List[str]) -> str:
+        statics, indexes = part
+        pieces = [statics[0]]
+        for index, static in zip(indexes, statics[1:]):
+            pieces += (values[index], static)
+        return "".join(pieces)
+
+    def fill(self, context: Dict[str, str]) -> RenderedEmail:
+        raw = [context[key] for key in self.keys]
+        escaped = [str(escape(value)) for value in raw]
+        return RenderedEmail(self._fill(self.subject, raw), self._fill(self.html, escaped), self._fill(self.text, raw))
+
+
+class EmailTemplateRegistry:
+    """Email templates compiled once and rendered per recipient.
+
+    Each template is a single HTML source (templates/email/<name>.html,
+    extending _layout.html) with a ``subject`` block. The plain-text part
+    comes from a second template compiled from that same source with the
+    HTML tags converted to text, so the two cannot drift apart and a send
+    never has to parse HTML. Values are autoescaped in the HTML only.
+
+    load() compiles everything up front, so a broken template fails at
+    startup rather than on a send. render_many() renders a batch as one
+    skeleton plus per-recipient values (see _skeleton).
+    """
+
+    def __init__(self, directory: str = TEMPLATE_DIR, globals: Dict[str, Any] = None):
+        loader = FileSystemLoader(directory)
+        options = dict(undefined=StrictUndefined, auto_reload=False, cache_size=-1)
+        self._html_env = Environment(
+            loader=loader, autoescape=True, trim_blocks=True, lstrip_blocks=True, **options
+        )
+        self._text_env = Environment(loader=_TextTemplateLoader(loader), autoescape=False, **options)
+        self._html_env.filters["trusted_html"] = _trusted_html
+        self._text_env.filters["trusted_html"] = _trusted_html_as_text
+        for env in (self._html_env, self._text_env):
+            env.globals.update({"utcnow": datetime.datetime.utcnow, **(globals or {})})
+        self._templates = {}
+
+    def load(self) -> "EmailTemplateRegistry":
+        for filename in self._html_env.list_templates(extensions=["html"]):
+            if os.path.basename(filename).startswith("_"):
+                continue
+            html_template = self._html_env.get_template(filename)
+            text_template = self._text_env.get_template(filename)
+            if "subject" not in html_template.blocks:
+                raise ValueError(f"Email template {filename} has no subject block")
+            self._templates[filename[:-len(".html")]] = (html_template, text_template)
+        return self
+
+    def names(self) -> List[str]:
+        return sorted(self._templates)
+
+    def _render_parts(self, name: str, context: Dict[str, Any]) -> Tuple[str, str, str]:
+        """(subject, html, text before tidy_text)"""
+        if name not in self._templates:
+            raise KeyError(f"Unknown email template: {name}")
+        html_template, text_template = self._templates[name]
+        subject = "".join(text_template.blocks["subject"](text_template.new_context(context)))
+        return subject, html_template.render(context), text_template.render(context)
+
+    def render(self, name: str, **context) -> RenderedEmail:
+        subject, html_body, text = self._render_parts(name, context)
+        return RenderedEmail(subject.strip(), html_body, tidy_text(text))
+
+    def render_sample(self, name: str) -> RenderedEmail:
+        return self.render(name, **SAMPLE_CONTEXTS.get(name, {}))
+
+    def _skeleton(self, name: str, keys: List[str]) -> Optional[_Skeleton]:
+        """Split the template's output around its values, or None if it does more than insert them.
+
+        The template is rendered twice with stand-in strings of different
+        lengths. Each value must come out as its stand-in, autoescaped in the
+        HTML and verbatim in the subject and text, and both renders must have
+        the same static text around them. Otherwise (a value sliced, filtered,
+        marked safe or tested on its length) the caller falls back to
+        rendering every email. Templates must not branch on whether a value
+        is empty, which stand-ins cannot reveal.
+        """
+        renders = []
+        for variant in "ab":
+            padding = "_" * SLOT_PADDING[variant]
+            stand_ins = {key: f"\x00{variant}{index}&{padding}\x00" for index, key in enumerate(keys)}
+            subject, html_body, text = self._render_parts(name, stand_ins)
+            renders.append((subject.strip(), html_body, tidy_text(text)))
+
+        skeleton_parts = []
+        # Subject and text are split after their final clean-up, which stand-ins pass through intact
+        for part, escaped in zip(zip(*renders), (False, True, False)):
+            splits = []
+            for variant, rendered in zip("ab", part):
+                pieces = SLOT_PATTERN.split(rendered)
+                static, slots = pieces[0::4], list(zip(pieces[1::4], pieces[2::4], pieces[3::4]))
+                if any("\x00" in text for text in static):
+                    return None
+                if any(slot_variant != variant or (amp == "&amp;") != escaped for slot_variant, _, amp in slots):
+                    return None
+                splits.append((static, [int(index) for _, index, _ in slots]))
+            if splits[0] != splits[1]:
+                return None
+            skeleton_parts.append(splits[0])
+        return _Skeleton(keys, *skeleton_parts)
+
+    def render_many(self, name: str, contexts: List[Dict[str, Any]]) -> List[RenderedEmail]:
+        """Render one template for many recipients, as cheap as string joins where possible.
+
+        Batches whose contexts all have the same keys and only string values
+        are rendered twice in full to build a skeleton, then filled per
+        recipient; anything else (and any value with stray whitespace) is
+        rendered email by email. The skeleton
+        lives for this call only, so utcnow() is as fresh as in render().
+        """
+        keys = sorted(contexts[0]) if contexts else []
+        uniform = len(contexts) > 2 and all(
+            sorted(context) == keys and all(isinstance(value, str) for value in context.values())
+            for context in contexts
+        )
+        skeleton = self._skeleton(name, keys) if uniform else None
+        if skeleton is None:
+            return [self.render(name, **context) for context in contexts]
+        return [
+            skeleton.fill(context) if all(map(skeleton.fits, context.values())) else self.render(name, **context)
+            for context in contexts
+        ]
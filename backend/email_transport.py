@@ -0,0 +1,134 @@
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List
+
+import httpx
+import resend
+from starlette.concurrency import run_in_threadpool
+
+from email_outbox import PermanentEmailError
+
+RESEND_API_URL = "https://api.resend.com"
+# Resend accepts at most this many emails per batch call
+RESEND_BATCH_LIMIT = 100
+# Errors that repeat identically on retry (bad payload or address)
+PERMANENT_STATUS_CODES = (400, 422)
+
+
+class EmailTransportError(Exception):
+    """A send the provider refused for now (rate limit, outage); worth retrying"""
+
+
+class EmailTransport(ABC):
+    """Sends Resend-shaped email params ({"from", "to", "subject", "html", ...})"""
+
+    @abstractmethod
+    async def send(self, params: Dict[str, Any]) -> str:
+        """Send one email; returns the provider's email ID"""
+
+    @abstractmethod
+    async def send_batch(self, batch: List[Dict[str, Any]]) -> List[str]:
+        """Send up to RESEND_BATCH_LIMIT emails in one call; returns their IDs in order"""
+
+    async def close(self):
+        pass
+
+
+def resend_email_id(email_response) -> str:
+    """Resend responses are objects or dicts depending on the SDK version"""
+    if hasattr(email_response, 'id'):
+        return email_response.id
+    if isinstance(email_response, dict) and 'id' in email_response:
+        return email_response['id']
+    return "unknown"
+
+
+class ResendSdkTransport(EmailTransport):
+    """The blocking Resend SDK, run in the thread pool (one new connection per call)"""
+
+    @staticmethod
+    def _raise_for_error(e: resend.exceptions.ResendError):
+        if str(e.code) in {str(code) for code in PERMANENT_STATUS_CODES}:
+            raise PermanentEmailError(str(e))
+        raise EmailTransportError(str(e))
+
+    async def send(self, params):
+        try:
+            return resend_email_id(await run_in_threadpool(resend.Emails.send, params))
+        except resend.exceptions.ResendError as e:
+            self._raise_for_error(e)
+
+    async def send_batch(self, batch):
+        try:
+            response = await run_in_threadpool(resend.Batch.send, batch)
+        except resend.exceptions.ResendError as e:
+            self._raise_for_error(e)
+        # The API answers {"data": [...]}; the SDK passes that through as is
+        items = response["data"] if isinstance(response, dict) else response
+        return [resend_email_id(item) for item in items]
+
+
+class ResendHttpTransport(EmailTransport):
+    """Resend's REST API over one long-lived httpx.AsyncClient.
+
+    Connections are kept alive and pooled across sends, so a burst of emails
+    pays for TLS setup once instead of once per email, and nothing blocks
+    the event loop or a thread.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_url: str = RESEND_API_URL,
+        timeout: float = 10.0,
+        max_connections: int = 10
+    ):
+        self.client = httpx.AsyncClient(
+            base_url=api_url,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Accept": "application/json",
+                "User-Agent": "es-decorations-backend"
+            },
+            timeout=httpx.Timeout(timeout, connect=5.0),
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        )
+
+    async def _post(self, path: str, payload) -> Any:
+        response = await self.client.post(path, json=payload)
+        if response.status_code < 400:
+            return response.json()
+
+        try:
+            error = response.json()
+            message = f"{error.get('name', 'error')}: {error.get('message', response.text)}"
+        except ValueError:
+            message = response.text or response.reason_phrase
+        message = f"Resend answered {response.status_code} ({message})"
+        if response.status_code in PERMANENT_STATUS_CODES:
+            raise PermanentEmailError(message)
+        raise EmailTransportError(message)
+
+    async def send(self, params):
+        return resend_email_id(await self._post("/emails", params))
+
+    async def send_batch(self, batch):
+        if len(batch) > RESEND_BATCH_LIMIT:
+            raise ValueError(f"At most {RESEND_BATCH_LIMIT} emails per batch")
+        response = await self._post("/emails/batch", batch)
+        return [resend_email_id(item) for item in response["data"]]
+
+    async def close(self):
+        await self.client.aclose()
+
+
+def create_email_transport(api_key: str) -> EmailTransport:
+    """Transport from EMAIL_TRANSPORT: "http" (default, pooled httpx) or "sdk" (Resend SDK)"""
+    if os.getenv("EMAIL_TRANSPORT", "http") == "sdk":
+        return ResendSdkTransport()
+    return ResendHttpTransport(
+        api_key,
+        api_url=os.getenv("RESEND_API_URL", RESEND_API_URL),
+        timeout=float(os.getenv("EMAIL_TIMEOUT_SECONDS", 10)),
+        max_connections=int(os.getenv("EMAIL_MAX_CONNECTIONS", 10))
+    )
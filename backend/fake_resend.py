@@ -0,0 +1,91 @@
+"""Local stand-in for the Resend API, for exercising email delivery without sending real mail.
+
+    uvicorn fake_resend:app --port 8025
+    RESEND_API_URL=http://127.0.0.1:8025 uvicorn app:app
+
+FAKE_RESEND_LATENCY_MS adds a delay to every call and FAKE_RESEND_FAILURE_RATE
+(0-1) makes that share of calls answer 500, to watch retries and backoff.
+Accepted emails are kept in memory and listed by GET /emails.
+"""
+import asyncio
+import os
+import random
+import uuid
+from typing import Any, Dict, List
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+LATENCY_SECONDS = float(os.getenv("FAKE_RESEND_LATENCY_MS", 0)) / 1000
+FAILURE_RATE = float(os.getenv("FAKE_RESEND_FAILURE_RATE", 0))
+REQUIRED_FIELDS = ("from", "to", "subject")
+
+app = FastAPI()
+received: List[Dict[str, Any]] = []
+
+
+def error_response(status_code: int, name: str, message: str) -> JSONResponse:
+    # Same shape as Resend's errors, which the SDK turns into exceptions
+    return JSONResponse(
+        status_code=status_code,
+        content={"statusCode": status_code, "name": name, "message": message}
+    )
+
+
+async def simulate_conditions():
+    if LATENCY_SECONDS:
+        await asyncio.sleep(LATENCY_SECONDS)
+    if random.random() < FAILURE_RATE:
+        return error_response(500, "application_error", "Simulated outage")
+    return None
+
+
+def validation_error(email: Dict[str, Any]):
+    missing = [field for field in REQUIRED_FIELDS if not email.get(field)]
+    if missing:
+        return error_response(422, "missing_required_field", f"Missing `{missing[0]}` field.")
+    recipients = email["to"] if isinstance(email["to"], list) else [email["to"]]
+    invalid = [address for address in recipients if "@" not in str(address)]
+    if invalid:
+        return error_response(422, "validation_error", f"Invalid `to` field: {invalid[0]}")
+    return None
+
+
+def accept(email: Dict[str, Any]) -> Dict[str, str]:
+    email_id = str(uuid.uuid4())
+    received.append({"id": email_id, **email})
+    return {"id": email_id}
+
+
+@app.post("/emails")
+async def send_email(email: Dict[str, Any]):
+    failure = await simulate_conditions()
+    if failure:
+        return failure
+    return validation_error(email) or accept(email)
+
+
+@app.post("/emails/batch")
+async def send_batch(emails: List[Dict[str, Any]]):
+    failure = await simulate_conditions()
+    if failure:
+        return failure
+    if len(emails) > 100:
+        return error_response(422, "validation_error", "Too many emails in batch (max 100).")
+    # Like Resend, one invalid email fails the whole batch
+    for email in emails:
+        error = validation_error(email)
+        if error:
+            return error
+    return {"data": [accept(email) for email in emails]}
+
+
+@app.get("/emails")
+async def list_emails():
+    return received
+
+
+@app.delete("/emails")
+async def clear_emails():
+    received.clear()
+    return {"cleared": True}
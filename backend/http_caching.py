@@ -0,0 +1,104 @@
+import re
+from typing import AsyncIterator, Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+
+# Content-addressed resources never change under the same URL
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+BYTE_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against our ETag"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return any(tag.removeprefix("W/") == etag.removeprefix("W/") for tag in candidates)
+
+
+def parse_byte_range(range_header: Optional[str], length: int) -> Optional[Tuple[int, int]]:
+    """Parse a single "bytes=" range into inclusive (start, end) offsets.
+
+    Returns None when there is no usable Range header (multi-range requests
+    are answered with the full body, which RFC 9110 allows) and raises 416
+    when the range cannot be satisfied.
+    """
+    if not range_header:
+        return None
+    match = BYTE_RANGE_PATTERN.match(range_header.strip())
+    if not match:
+        return None
+
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # Suffix range: the final N bytes
+        suffix = int(last)
+        if suffix == 0:
+            raise_range_not_satisfiable(length)
+        return max(length - suffix, 0), length - 1
+
+    start = int(first)
+    end = min(int(last), length - 1) if last else length - 1
+    if start >= length or start > end:
+        raise_range_not_satisfiable(length)
+    return start, end
+
+
+def raise_range_not_satisfiable(length: int):
+    raise HTTPException(
+        status_code=416,
+        detail="Requested range not satisfiable",
+        headers={"Content-Range": f"bytes */{length}"}
+    )
+
+
+def not_modified_response(etag: str, cache_control: str = IMMUTABLE_CACHE_CONTROL) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+
+
+def ranged_stream_response(
+    request: Request,
+    length: int,
+    media_type: str,
+    etag: str,
+    stream: Callable[[int, Optional[int]], AsyncIterator[bytes]],
+    cache_control: str = IMMUTABLE_CACHE_CONTROL,
+    extra_headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """Serve binary content with ETag revalidation and single-range support.
+
+    ``stream(start, end)`` must yield the bytes start..end (inclusive, end
+    None meaning "to the end").
+    """
+    headers = {
+        "ETag": etag,
+        "Cache-Control": cache_control,
+        "Accept-Ranges": "bytes",
+        **(extra_headers or {})
+    }
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    byte_range = None
+    if_range = request.headers.get("if-range")
+    # A stale If-Range means the client's partial copy is outdated: send everything
+    if not if_range or if_range == etag:
+        byte_range = parse_byte_range(request.headers.get("range"), length)
+
+    if byte_range is None:
+        headers["Content-Length"] = str(length)
+        return StreamingResponse(stream(0, None), media_type=media_type, headers=headers)
+
+    start, end = byte_range
+    headers["Content-Length"] = str(end - start + 1)
+    headers["Content-Range"] = f"bytes {start}-{end}/{length}"
+    return StreamingResponse(
+        stream(start, end), status_code=206, media_type=media_type, headers=headers
+    )
@@ -0,0 +1,767 @@
+import asyncio
+import base64
+import functools
+import io
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Tuple, Dict, Any, Callable, Optional, Union, List, Sequence
+
+from PIL import Image, UnidentifiedImageError
+
+try:
+    from pillow_heif import register_heif_opener
+    register_heif_opener()
+    HEIC_SUPPORTED = True
+    print("✅ HEIC support enabled")
+except ImportError:
+    HEIC_SUPPORTED = False
+    print("⚠️ HEIC support not available - install pillow-heif")
+
+# Compressor entry points accept raw bytes or a path to a spooled upload on disk;
+# paths keep large files out of the pickled arguments sent to worker processes
+ImageSource = Union[bytes, str]
+
+# Renditions are bounded by width only; this height cap just guards extreme panoramas
+RENDITION_MAX_HEIGHT = 4096
+RENDITION_QUALITY = {'jpeg': 82, 'webp': 80}
+# Longest edge of the inline LQIP preview returned with list endpoints
+PLACEHOLDER_SIZE = 16
+# Modes Image.reduce() accepts; anything else is converted before box-reducing
+REDUCIBLE_MODES = ('L', 'LA', 'RGB', 'RGBA', 'I', 'F')
+RENDITION_ENCODE_THREADS = int(os.getenv("RENDITION_ENCODE_THREADS", min(4, os.cpu_count() or 1)))
+# progressive_compress ladder: every quality at full size, then every scale at the lowest quality
+LADDER_QUALITIES = [85, 75, 65, 55, 45, 35]
+LADDER_SCALES = [0.8, 0.6, 0.4, 0.3]
+LADDER_MAX_ENCODES = len(LADDER_QUALITIES) + len(LADDER_SCALES)
+# Bisection stops at the first result this close to the target (and under it)
+TARGET_TOLERANCE = 0.9
+# Typical drop in log(JPEG size) per quality step, for the first probe below 85
+QUALITY_LOG_SLOPE = 0.035
+
+class SmartImageCompressor:
+    MAX_SIZE_BYTES = 15 * 1024 * 1024  # 15MB threshold
+    MAX_FILE_SIZE = 50 * 1024 * 1024   # 50MB absolute maximum
+    # Reduced-resolution decodes keep at least this multiple of the target size;
+    # 1.4 lets a 12MP phone photo (4032x3024 -> 1440x1080) decode at half size
+    REDUCING_GAP = 1.4
+    
+    @staticmethod
+    def is_image_by_filename(filename: str) -> bool:
+        """Validate by file extension - includes HEIC"""
+        if not filename:
+            return False
+        
+        # Include HEIC since we can process them
+        valid_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.tiff', '.tif', '.heic', '.heif'}
+        
+        try:
+            file_extension = filename.lower().split('.')[-1]
+            return f'.{file_extension}' in valid_extensions
+        except:
+            return False
+    
+    @staticmethod
+    def _open(source: ImageSource) -> Image.Image:
+        return Image.open(source if isinstance(source, str) else io.BytesIO(source))
+
+    @staticmethod
+    def _source_size(source: ImageSource) -> int:
+        return os.path.getsize(source) if isinstance(source, str) else len(source)
+
+    @staticmethod
+    def probe_image(source: ImageSource) -> Tuple[bool, str, Dict[str, Any]]:
+        """Header-only validation: format and dimensions without decoding any pixels"""
+        try:
+            if SmartImageCompressor._source_size(source) == 0:
+                return False, "File is empty", {}
+
+            with SmartImageCompressor._open(source) as image:
+                width, height = image.size
+                format_type = image.format or "Unknown"
+                info = {'format': format_type, 'dimensions': (width, height), 'mode': image.mode}
+
+            if width <= 0 or height <= 0:
+                return False, "Invalid image dimensions", info
+
+            if width > 20000 or height > 20000:
+                return False, "Image dimensions too large (max 20000x20000)", info
+
+            return True, f"Valid {format_type} image ({width}x{height})", info
+
+        except UnidentifiedImageError:
+            # Pillow's message would expose the spool path
+            return False, "Invalid image file: unrecognised image format", {}
+        except Exception as e:
+            return False, f"Invalid image file: {str(e)}", {}
+
+    @staticmethod
+    def is_image(file_content: ImageSource) -> Tuple[bool, str]:
+        """Validate if file is a valid image using PIL"""
+        try:
+            if SmartImageCompressor._source_size(file_content) == 0:
+                return False, "File is empty"
+            
+            # Try to open the image with PIL (should work with HEIC if pillow-heif is installed)
+            image = SmartImageCompressor._open(file_content)
+            
+            # Get basic info
+            width, height = image.size
+            format_type = image.format or "Unknown"
+            
+            # Check if dimensions are reasonable
+            if width <= 0 or height <= 0:
+                return False, "Invalid image dimensions"
+            
+            if width > 20000 or height > 20000:
+                return False, "Image dimensions too large (max 20000x20000)"
+            
+            # Verify the image by loading it
+            image.verify()
+            return True, f"Valid {format_type} image ({width}x{height})"
+            
+        except Exception as e:
+            return False, f"Invalid image file: {str(e)}"
+    
+    @staticmethod
+    def _to_rgb(image: Image.Image) -> Image.Image:
+        """Flatten any mode to RGB, compositing transparency onto white"""
+        if image.mode in ('RGBA', 'LA', 'P'):
+            print(f"   🎨 Converting {image.mode} to RGB")
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            if image.mode == 'P':
+                image = image.convert('RGBA')
+            if image.mode in ('RGBA', 'LA'):
+                background.paste(image, mask=image.split()[-1])
+                image = background
+        elif image.mode != 'RGB':
+            print(f"   🎨 Converting {image.mode} to RGB")
+            image = image.convert('RGB')
+        return image
+
+    @staticmethod
+    def _decode(
+        source: ImageSource,
+        max_width: Optional[int] = None,
+        max_height: Optional[int] = None
+    ) -> Tuple[Image.Image, Dict[str, Any]]:
+        """Open, decode and normalise an image to RGB exactly once
+
+        When a target box is given and the source is far larger, the decoder
+        is asked for fewer pixels up front (see _reduce_on_decode).
+        """
+        # Open image (works with HEIC if pillow-heif is installed)
+        image = SmartImageCompressor._open(source)
+        source_info = {
+            'original_dimensions': image.size,
+            'original_format': image.format or "Unknown",
+            'original_mode': image.mode
+        }
+        print(f"   📸 Converting {source_info['original_format']} to JPEG: "
+              f"{source_info['original_dimensions']} {source_info['original_mode']}")
+
+        if max_width and max_height:
+            image = SmartImageCompressor._reduce_on_decode(
+                image, max_width, max_height, source_info
+            )
+
+        # ALWAYS convert to RGB for consistent JPEG output
+        image = SmartImageCompressor._to_rgb(image)
+        image.load()
+        return image, source_info
+
+    @staticmethod
+    def _reduce_on_decode(
+        image: Image.Image,
+        max_width: int,
+        max_height: int,
+        source_info: Dict[str, Any]
+    ) -> Image.Image:
+        """Decode at reduced resolution when the target box is far smaller than the source
+
+        Like Image.thumbnail's reducing_gap, this keeps at least REDUCING_GAP
+        times the target size so the final LANCZOS pass still has enough
+        detail to work with.
+        JPEG uses DCT scaling via draft(), which never materialises the full
+        raster. Other formats (including HEIF - pillow-heif cannot decode
+        embedded thumbnails) are decoded in full, then immediately box-reduced
+        so the RGB conversion and every later stage work on the small copy.
+        """
+        width, height = image.size
+        scale = min(max_width / width, max_height / height)
+        if scale * SmartImageCompressor.REDUCING_GAP >= 1:
+            return image
+
+        requested = (
+            math.ceil(width * scale * SmartImageCompressor.REDUCING_GAP),
+            math.ceil(height * scale * SmartImageCompressor.REDUCING_GAP)
+        )
+
+        if image.format == 'JPEG':
+            image.draft('RGB', requested)
+            if image.size != (width, height):
+                print(f"   ⚡ JPEG draft decode at {image.size} instead of {(width, height)}")
+                source_info['decode_reduction'] = f"draft 1/{width // image.size[0]}"
+            return image
+
+        factor = min(width // requested[0], height // requested[1])
+        if factor < 2:
+            return image
+        image.load()
+        source_format = image.format
+        if image.mode not in REDUCIBLE_MODES:
+            # reduce() rejects palette, bilevel and 16-bit modes; widen first, keeping any transparency
+            has_alpha = image.mode in ('PA', 'RGBa', 'La') or 'transparency' in image.info
+            image = image.convert('RGBA' if has_alpha else 'RGB')
+        print(f"   ⚡ Box-reducing decoded {source_format} by {factor}x")
+        reduced = image.reduce(factor)
+        source_info['decode_reduction'] = f"reduce 1/{factor}"
+        return reduced
+
+    @staticmethod
+    def _fit(image: Image.Image, max_width: int, max_height: int) -> Image.Image:
+        """Return a copy scaled down to fit the box (the input is never modified)"""
+        if image.size[0] <= max_width and image.size[1] <= max_height:
+            return image
+        print(f"   📐 Resizing from {image.size} to fit {max_width}x{max_height}")
+        resized = image.copy()
+        resized.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
+        return resized
+
+    @staticmethod
+    def _encode_jpeg(image: Image.Image, quality: int) -> bytes:
+        output = io.BytesIO()
+        image.save(output, format='JPEG', quality=quality, optimize=True)
+        return output.getvalue()
+
+    @staticmethod
+    def _encode(image: Image.Image, fmt: str, quality: int) -> bytes:
+        if fmt == 'jpeg':
+            return SmartImageCompressor._encode_jpeg(image, quality)
+        if fmt == 'webp':
+            output = io.BytesIO()
+            image.save(output, format='WEBP', quality=quality, method=4)
+            return output.getvalue()
+        raise ValueError(f"Unsupported rendition format: {fmt}")
+
+    @staticmethod
+    def _build_metadata(
+        original_size: int,
+        source_info: Dict[str, Any],
+        image: Image.Image,
+        jpeg_bytes: bytes,
+        quality: int
+    ) -> Dict[str, Any]:
+        final_size = len(jpeg_bytes)
+        compression_ratio = final_size / original_size
+        savings_percent = round((1 - compression_ratio) * 100, 1)
+
+        return {
+            'original_size': original_size,
+            'final_size': final_size,
+            'original_dimensions': source_info['original_dimensions'],
+            'final_dimensions': image.size,
+            'original_format': source_info['original_format'],
+            'final_format': 'JPEG',
+            'original_mode': source_info['original_mode'],
+            'compression_ratio': round(compression_ratio, 3),
+            'savings_percent': savings_percent,
+            'quality_used': quality,
+            'method': 'converted_to_jpeg',
+            'web_compatible': True,
+            'decode_reduction': source_info.get('decode_reduction')
+        }
+
+    @staticmethod
+    def _placeholder(image: Image.Image) -> Dict[str, str]:
+        """Tiny base64 WebP preview plus dominant colour for instant first paint"""
+        preview = image.copy()
+        preview.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE), Image.Resampling.BOX)
+        if preview.mode != 'RGB':
+            preview = preview.convert('RGB')
+
+        buffer = io.BytesIO()
+        # WebP rather than JPEG: at 16px the JPEG headers alone are ~600 bytes
+        preview.save(buffer, format='WEBP', quality=60)
+
+        # Most common colour of a 4-colour palette, not the (often muddy) mean
+        palette = preview.quantize(colors=4)
+        count, index = max(palette.getcolors())
+        red, green, blue = palette.getpalette()[index * 3:index * 3 + 3]
+
+        return {
+            'placeholder': 'data:image/webp;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii'),
+            'dominant_color': f'#{red:02x}{green:02x}{blue:02x}'
+        }
+
+    @staticmethod
+    def compute_placeholder(source: ImageSource) -> Dict[str, str]:
+        """Placeholder for an already-stored image; decodes at reduced resolution"""
+        image, _ = SmartImageCompressor._decode(source, PLACEHOLDER_SIZE * 8, PLACEHOLDER_SIZE * 8)
+        return SmartImageCompressor._placeholder(image)
+
+    @staticmethod
+    def convert_to_web_format(
+        source: ImageSource,
+        max_width: int = 1920,
+        max_height: int = 1080,
+        quality: int = 85
+    ) -> Tuple[bytes, Dict[str, Any]]:
+        """Convert ANY image format to web-compatible JPEG"""
+        
+        original_size = SmartImageCompressor._source_size(source)
+        
+        try:
+            started = time.perf_counter()
+            image, source_info = SmartImageCompressor._decode(source, max_width, max_height)
+            decoded = time.perf_counter()
+
+            # Resize if needed
+            image = SmartImageCompressor._fit(image, max_width, max_height)
+            resized = time.perf_counter()
+
+            # ALWAYS save as JPEG for web compatibility
+            jpeg_bytes = SmartImageCompressor._encode_jpeg(image, quality)
+            encoded = time.perf_counter()
+
+            metadata = SmartImageCompressor._build_metadata(
+                original_size, source_info, image, jpeg_bytes, quality
+            )
+            metadata.update(SmartImageCompressor._placeholder(image))
+            metadata['timings'] = {
+                'decode_ms': round((decoded - started) * 1000, 1),
+                'resize_ms': round((resized - decoded) * 1000, 1),
+                'encode_ms': round((encoded - resized) * 1000, 1),
+                'total_ms': round((encoded - started) * 1000, 1)
+            }
+            
+            return jpeg_bytes, metadata
+            
+        except Exception as e:
+            raise Exception(f"Image conversion failed: {str(e)}")
+    
+    @staticmethod
+    def render_variant(
+        source: ImageSource,
+        width: int,
+        fmt: str = 'jpeg'
+    ) -> Tuple[bytes, Dict[str, Any]]:
+        """Render a width-bounded rendition (never upscaled) as JPEG or WebP"""
+        return SmartImageCompressor.render_variants(source, [width], [fmt])[0]
+
+    @staticmethod
+    def render_variants(
+        source: ImageSource,
+        widths: Sequence[int],
+        formats: Sequence[str] = ('jpeg', 'webp')
+    ) -> List[Tuple[bytes, Dict[str, Any]]]:
+        """Decode once and render every width/format pair, encoding on parallel threads.
+
+        Pillow releases the GIL while resizing and encoding, so threads give
+        real parallelism here. Every rendition is fitted straight from the
+        full decode, so a given width/format comes out byte-identical whether
+        it is rendered alone or as part of a set.
+        """
+        image, _ = SmartImageCompressor._decode(source)
+        jobs = [(width, fmt) for width in widths for fmt in formats]
+
+        def render(job: Tuple[int, str]) -> Tuple[bytes, Dict[str, Any]]:
+            width, fmt = job
+            fitted = SmartImageCompressor._fit(image, width, RENDITION_MAX_HEIGHT)
+            if fitted is image:
+                # save() stores per-call state on the image object; never share it between threads
+                fitted = image.copy()
+            data = SmartImageCompressor._encode(fitted, fmt, RENDITION_QUALITY[fmt])
+            return data, {
+                'width': fitted.size[0],
+                'height': fitted.size[1],
+                'format': fmt,
+                'size': len(data)
+            }
+
+        if len(jobs) == 1:
+            return [render(jobs[0])]
+        with ThreadPoolExecutor(max_workers=min(len(jobs), RENDITION_ENCODE_THREADS)) as pool:
+            return list(pool.map(render, jobs))
+
+    @staticmethod
+    def compress_image(
+        source: ImageSource,
+        max_width: int = 1920,
+        max_height: int = 1080,
+        quality: int = 85
+    ) -> Tuple[bytes, Dict[str, Any]]:
+        """Compress image (wrapper for convert_to_web_format)"""
+        return SmartImageCompressor.convert_to_web_format(
+            source, max_width, max_height, quality
+        )
+    
+    @staticmethod
+    def progressive_compress(
+        source: ImageSource,
+        target_size: int = 5 * 1024 * 1024,  # 5MB target
+        strategy: str = "bisect",
+        max_encodes: int = LADDER_MAX_ENCODES
+    ) -> Tuple[bytes, Dict[str, Any]]:
+        """Progressive compression - always outputs JPEG
+
+        The source is decoded and normalised once; resized rasters are cached
+        per target box and only the JPEG encoder runs again for each attempt.
+
+        strategy="bisect" (default) searches quality, then scale, for a result
+        between TARGET_TOLERANCE * target_size and target_size, and never
+        encodes more often than the ladder would have (nor more than
+        max_encodes). strategy="ladder" walks LADDER_QUALITIES then LADDER_SCALES.
+        """
+        
+        print(f"   🎯 Target size: {target_size / (1024*1024):.1f}MB ({strategy})")
+
+        try:
+            session = _EncodeSession(source)
+        except Exception as e:
+            raise Exception(f"All compression methods failed: {str(e)}")
+
+        if strategy == "ladder":
+            result = SmartImageCompressor._ladder_search(session, target_size)
+        elif strategy == "bisect":
+            result = SmartImageCompressor._bisect_search(session, target_size, max_encodes)
+        else:
+            raise ValueError(f"Unknown compression strategy: {strategy}")
+
+        if result is not None:
+            jpeg_bytes, metadata = result
+            metadata['target_achieved'] = True
+        else:
+            # Best effort fallback
+            try:
+                jpeg_bytes, metadata = session.attempt(800, 600, 20)
+                metadata['compression_level'] = 'maximum_effort'
+                metadata['target_achieved'] = False
+            except Exception as e:
+                raise Exception(f"All compression methods failed: {str(e)}")
+
+        metadata['strategy'] = strategy
+        return session.finish(jpeg_bytes, metadata)
+
+    @staticmethod
+    def _ladder_search(session: "_EncodeSession", target_size: int):
+        """Fixed quality ladder followed by a fixed scale ladder"""
+        # Try different quality levels
+        for quality in LADDER_QUALITIES:
+            try:
+                print(f"   🔧 Trying quality {quality}")
+                jpeg_bytes, metadata = session.attempt(1920, 1080, quality)
+                
+                if len(jpeg_bytes) <= target_size:
+                    print(f"   ✅ Target achieved with quality {quality}")
+                    metadata['compression_level'] = 'progressive'
+                    return jpeg_bytes, metadata
+                    
+            except Exception as e:
+                print(f"   ⚠️ Quality {quality} failed: {e}")
+                continue
+        
+        # Try dimension reduction
+        try:
+            for scale in LADDER_SCALES:
+                max_w = int(1920 * scale)
+                max_h = int(1080 * scale)
+                
+                print(f"   📏 Trying {scale*100}% scale ({max_w}x{max_h})")
+                
+                jpeg_bytes, metadata = session.attempt(max_w, max_h, 35)
+                
+                if len(jpeg_bytes) <= target_size:
+                    print(f"   ✅ Target achieved with {scale*100}% scale")
+                    metadata['compression_level'] = 'progressive_with_resize'
+                    metadata['scale_factor'] = scale
+                    return jpeg_bytes, metadata
+                    
+        except Exception as e:
+            print(f"   ⚠️ Progressive resize failed: {e}")
+
+        return None
+
+    @staticmethod
+    def _ladder_encodes(too_big_quality: int, too_big_scale: float = 1.0) -> int:
+        """Fewest encodes the ladder needs once this quality (at this scale) came out too big"""
+        if too_big_scale >= 1.0:
+            return 1 + sum(quality >= too_big_quality for quality in LADDER_QUALITIES)
+        return 1 + len(LADDER_QUALITIES) + sum(scale >= too_big_scale for scale in LADDER_SCALES)
+
+    @staticmethod
+    def _bisect_search(session: "_EncodeSession", target_size: int, max_encodes: int):
+        """Search quality (then scale) for a result just under target_size.
+
+        Each probe is interpolated on log(size), or sqrt(size) for scales,
+        from the attempts either side of the target. The search stops at the
+        first result within TARGET_TOLERANCE of the target, and as soon as it
+        has a fitting result and has spent as many encodes as the ladder
+        would have needed for the attempts that came out too big.
+        """
+        max_quality, min_quality = LADDER_QUALITIES[0], LADDER_QUALITIES[-1]
+        min_scale = LADDER_SCALES[-1]
+        max_encodes = min(max_encodes, LADDER_MAX_ENCODES)
+
+        def settled(fits, ladder_encodes: int) -> bool:
+            return fits is not None and (
+                len(fits[0]) >= target_size * TARGET_TOLERANCE or session.encode_attempts >= ladder_encodes
+            )
+
+        # Most uploads fit at full quality - that costs a single encode
+        print(f"   🔧 Trying quality {max_quality}")
+        too_big = session.attempt(1920, 1080, max_quality)
+        if len(too_big[0]) <= target_size:
+            too_big[1]['compression_level'] = 'progressive'
+            return too_big
+
+        fits = None
+        while session.encode_attempts < max_encodes:
+            high_q, high_size = too_big[1]['quality_used'], len(too_big[0])
+            if settled(fits, SmartImageCompressor._ladder_encodes(high_q)):
+                break
+            if fits is None:
+                # Step down along a typical size/quality slope, aiming a little under the target
+                drop = (math.log(high_size) - math.log(target_size * 0.95)) / QUALITY_LOG_SLOPE
+                quality = max(min(int(high_q - drop), high_q - 1), min_quality)
+            else:
+                low_q, low_size = fits[1]['quality_used'], len(fits[0])
+                if high_q - low_q <= 2:
+                    break
+                fraction = (
+                    (math.log(target_size) - math.log(low_size))
+                    / (math.log(high_size) - math.log(low_size))
+                ) if high_size > low_size else 0.5
+                quality = min(max(low_q + int(fraction * (high_q - low_q)), low_q + 1), high_q - 1)
+            print(f"   🔧 Bisecting quality {quality}")
+            candidate = session.attempt(1920, 1080, quality)
+            if len(candidate[0]) <= target_size:
+                fits = candidate
+            elif quality <= min_quality:
+                too_big = candidate
+                break
+            else:
+                too_big = candidate
+
+        if fits is not None:
+            print(f"   ✅ Target achieved with quality {fits[1]['quality_used']}")
+            fits[1]['compression_level'] = 'progressive'
+            return fits
+        if too_big[1]['quality_used'] > min_quality:
+            # Out of encodes before reaching the lowest quality
+            return None
+
+        # Even the lowest quality is too big - shrink the raster instead
+        def at_scale(scale: float):
+            return session.attempt(int(1920 * scale), int(1080 * scale), min_quality)
+
+        # Encoded size grows roughly with pixel area: the first probe is the
+        # scale predicted from the full-size attempt, later probes interpolate
+        # between the largest fitting and smallest oversized attempts
+        best, best_scale = None, min_scale
+        too_big_scale = 1.0
+        while session.encode_attempts < max_encodes:
+            if settled(best, SmartImageCompressor._ladder_encodes(min_quality, too_big_scale)):
+                break
+            if best is not None and too_big_scale - best_scale <= 0.05:
+                break
+            if best is None:
+                predicted = too_big_scale * math.sqrt(target_size / len(too_big[0])) * 0.97
+                scale = round(min(max(predicted, min_scale), too_big_scale - 0.01), 3)
+            else:
+                # Secant step on sqrt(size), kept off the bracket edges
+                low_root, high_root = math.sqrt(len(best[0])), math.sqrt(len(too_big[0]))
+                width = too_big_scale - best_scale
+                fraction = (
+                    (math.sqrt(target_size) - low_root) / (high_root - low_root)
+                ) if high_root > low_root else 0.5
+                scale = round(best_scale + width * min(max(fraction, 0.25), 0.75), 3)
+            print(f"   📏 Trying {scale*100:.1f}% scale")
+            candidate = at_scale(scale)
+            if len(candidate[0]) <= target_size:
+                best, best_scale = candidate, scale
+            elif scale <= min_scale:
+                return None
+            else:
+                too_big, too_big_scale = candidate, scale
+
+        if best is None:
+            return None
+        print(f"   ✅ Target achieved with {best_scale*100:.1f}% scale")
+        best[1]['compression_level'] = 'progressive_with_resize'
+        best[1]['scale_factor'] = best_scale
+        return best
+
+
+class _EncodeSession:
+    """A decoded source image plus cached rasters, shared by every encode attempt"""
+
+    def __init__(self, source: ImageSource):
+        self.original_size = SmartImageCompressor._source_size(source)
+        self.started = time.perf_counter()
+        self.timings = {'decode_ms': 0.0, 'resize_ms': 0.0, 'encode_ms': 0.0}
+        self.encode_attempts = 0
+        # Every raster this session produces fits the web-size box
+        self.source, self.source_info = SmartImageCompressor._decode(source, 1920, 1080)
+        self.timings['decode_ms'] = (time.perf_counter() - self.started) * 1000
+        self.rasters: Dict[Tuple[int, int], Image.Image] = {}
+
+    def raster(self, max_w: int, max_h: int) -> Image.Image:
+        if (max_w, max_h) not in self.rasters:
+            resize_started = time.perf_counter()
+            # Smaller boxes are derived from the full web-size raster rather than the original
+            base = self.rasters.get((1920, 1080), self.source)
+            self.rasters[(max_w, max_h)] = SmartImageCompressor._fit(base, max_w, max_h)
+            self.timings['resize_ms'] += (time.perf_counter() - resize_started) * 1000
+        return self.rasters[(max_w, max_h)]
+
+    def attempt(self, max_w: int, max_h: int, quality: int) -> Tuple[bytes, Dict[str, Any]]:
+        image = self.raster(max_w, max_h)
+        encode_started = time.perf_counter()
+        jpeg_bytes = SmartImageCompressor._encode_jpeg(image, quality)
+        self.timings['encode_ms'] += (time.perf_counter() - encode_started) * 1000
+        self.encode_attempts += 1
+        metadata = SmartImageCompressor._build_metadata(
+            self.original_size, self.source_info, image, jpeg_bytes, quality
+        )
+        return jpeg_bytes, metadata
+
+    def finish(self, jpeg_bytes: bytes, metadata: Dict[str, Any]) -> Tuple[bytes, Dict[str, Any]]:
+        # The placeholder is only worth computing for the attempt that is kept
+        final = next(
+            raster for raster in self.rasters.values() if raster.size == tuple(metadata['final_dimensions'])
+        )
+        metadata.update(SmartImageCompressor._placeholder(final))
+        metadata['timings'] = {key: round(value, 1) for key, value in self.timings.items()}
+        metadata['timings']['total_ms'] = round((time.perf_counter() - self.started) * 1000, 1)
+        metadata['encode_attempts'] = self.encode_attempts
+        metadata['decode_count'] = 1
+        return jpeg_bytes, metadata
+
+
+class ImageProcessingBusy(Exception):
+    """Raised when the image processing queue is full"""
+
+
+class ImageProcessingExecutor:
+    """Bounded process pool that runs SmartImageCompressor work off the event loop.
+
+    Decoding and encoding large photos is CPU bound and can take seconds, so
+    every compressor call is shipped to a worker process. At most
+    ``max_workers + max_queue`` jobs may be in flight; anything beyond that is
+    rejected with ImageProcessingBusy so callers can answer 503 instead of
+    piling up memory.
+
+    With ``wait_timeout`` set, jobs beyond that limit wait up to that many
+    seconds for a slot instead, and are only rejected once it runs out. That
+    suits image GETs: a page requesting dozens of cold thumbnails should get
+    them all a little later, since browsers never retry a failed <img>.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        start_method: Optional[str] = None,
+        wait_timeout: Optional[float] = None
+    ):
+        self.max_workers = max_workers or int(
+            os.getenv("IMAGE_WORKERS", min(4, os.cpu_count() or 1))
+        )
+        self.max_queue = max_queue if max_queue is not None else int(
+            os.getenv("IMAGE_QUEUE_LIMIT", 8)
+        )
+        # "spawn" keeps workers clear of the threads Motor starts in the parent
+        self.start_method = start_method or os.getenv("IMAGE_WORKER_START_METHOD", "spawn")
+        self.wait_timeout = wait_timeout
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._in_flight = 0
+        self._waiting = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context(self.start_method)
+            )
+        return self._pool
+
+    async def _acquire_slot(self):
+        if self.wait_timeout is None:
+            if self._in_flight >= self.capacity:
+                self._rejected += 1
+                raise ImageProcessingBusy(
+                    "Image processing queue is full. Please try again shortly."
+                )
+            return
+
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.capacity)
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.wait_timeout)
+        except asyncio.TimeoutError:
+            self._rejected += 1
+            raise ImageProcessingBusy(
+                "Image processing is busy. Please try again shortly."
+            )
+        finally:
+            self._waiting -= 1
+
+    async def run(self, fn: Callable, *args, **kwargs):
+        """Run ``fn(*args, **kwargs)`` in a worker process and await the result"""
+        await self._acquire_slot()
+
+        self._in_flight += 1
+        pool = None
+        succeeded = False
+        try:
+            loop = asyncio.get_running_loop()
+            pool = self._get_pool()
+            result = await loop.run_in_executor(pool, functools.partial(fn, *args, **kwargs))
+            succeeded = True
+            return result
+        except BrokenProcessPool:
+            # A worker died (usually out of memory) - start a fresh pool next time, and
+            # reap the broken one's surviving workers and management thread now.
+            # Other jobs that were on it fail here too; only the first replaces it.
+            if self._pool is pool:
+                self._pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise Exception("Image worker crashed while processing the file")
+        finally:
+            self._in_flight -= 1
+            # Errors, crashes and callers that gave up (cancelled) are not completions
+            if succeeded:
+                self._completed += 1
+            else:
+                self._failed += 1
+            if self._slots is not None:
+                self._slots.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.max_workers,
+            "queue_limit": self.max_queue,
+            "in_flight": self._in_flight,
+            "waiting": self._waiting,
+            "completed": self._completed,
+            "failed": self._failed,
+            "rejected": self._rejected
+        }
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
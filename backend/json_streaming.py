@@ -0,0 +1,67 @@
+import json
+from typing import Any, AsyncIterator, Callable, Dict
+
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+DEFAULT_STREAM_BATCH_SIZE = 200
+MAX_STREAM_BATCH_SIZE = 1000
+
+Present = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+def wants_ndjson(request: Request) -> bool:
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def _encode(document: Dict[str, Any], present: Present) -> str:
+    # jsonable_encoder plus JSONResponse's own dumps options keep the output identical to a regular FastAPI response
+    return json.dumps(
+        jsonable_encoder(present(document)), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    )
+
+
+async def iter_json_array(documents, present: Present, batch_size: int) -> AsyncIterator[bytes]:
+    """Write a JSON array one batch of documents at a time"""
+    yield b"["
+    first = True
+    batch = []
+    async for document in documents:
+        batch.append(_encode(document, present))
+        if len(batch) >= batch_size:
+            yield (("" if first else ",") + ",".join(batch)).encode()
+            first, batch = False, []
+    if batch:
+        yield (("" if first else ",") + ",".join(batch)).encode()
+    yield b"]"
+
+
+async def iter_ndjson(documents, present: Present, batch_size: int) -> AsyncIterator[bytes]:
+    """One JSON document per line, flushed a batch at a time"""
+    batch = []
+    async for document in documents:
+        batch.append(_encode(document, present) + "\n")
+        if len(batch) >= batch_size:
+            yield "".join(batch).encode()
+            batch = []
+    if batch:
+        yield "".join(batch).encode()
+
+
+def stream_documents(
+    request: Request,
+    documents,
+    present: Present,
+    batch_size: int = DEFAULT_STREAM_BATCH_SIZE
+) -> StreamingResponse:
+    """Stream a Motor cursor as a JSON array, or NDJSON when the client accepts it.
+
+    Only one cursor batch (``batch_size`` documents) is held in memory at a
+    time, however large the collection.
+    """
+    documents = documents.batch_size(batch_size)
+    if wants_ndjson(request):
+        return StreamingResponse(iter_ndjson(documents, present, batch_size), media_type=NDJSON_MEDIA_TYPE)
+    return StreamingResponse(iter_json_array(documents, present, batch_size), media_type="application/json")
@@ -0,0 +1,38 @@
+"""Move inline base64 images from existing documents into the image blob store.
+
+Also backfills the per-image placeholders, so it is safe (and useful) to re-run.
+
+Run once from the backend directory after deploying the blob store:
+
+    python migrate_inline_images.py
+"""
+import asyncio
+
+from fastapi import HTTPException
+
+from app import events_collection, latest_works_collection, intern_image_fields
+
+
+async def migrate(collection, name: str):
+    migrated = 0
+    async for document in collection.find({}, {"thumbnail": 1, "images": 1, "placeholders": 1}):
+        before = {field: document.get(field) for field in ("thumbnail", "images", "placeholders")}
+        try:
+            after = await intern_image_fields(dict(before))
+        except HTTPException as e:
+            print(f"⚠️ {name} {document['_id']}: skipped ({e.detail})")
+            continue
+        changes = {field: value for field, value in after.items() if value != before.get(field)}
+        if changes:
+            await collection.update_one({"_id": document["_id"]}, {"$set": changes})
+            migrated += 1
+    print(f"✅ {name}: moved images out of {migrated} documents")
+
+
+async def main():
+    await migrate(events_collection, "events")
+    await migrate(latest_works_collection, "latest_works")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
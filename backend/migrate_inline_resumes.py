@@ -0,0 +1,35 @@
+"""Move inline resume bytes from job applications into the resume blob store.
+
+Run once from the backend directory after deploying the resume store:
+
+    python migrate_inline_resumes.py
+"""
+import asyncio
+import base64
+
+from fastapi import HTTPException
+
+from app import job_applications_collection, store_resume
+
+
+async def main():
+    migrated = 0
+    async for application in job_applications_collection.find({"resume": {"$ne": None}}):
+        resume = application["resume"]
+        if isinstance(resume, bytes):
+            resume = base64.b64encode(resume).decode("ascii")
+        try:
+            resume_file = await store_resume(resume)
+        except HTTPException as e:
+            print(f"⚠️ job_applications {application['_id']}: skipped ({e.detail})")
+            continue
+        await job_applications_collection.update_one(
+            {"_id": application["_id"]},
+            {"$set": {"resume_file": resume_file}, "$unset": {"resume": ""}}
+        )
+        migrated += 1
+    print(f"✅ job_applications: moved resumes out of {migrated} documents")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
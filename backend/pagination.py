@@ -0,0 +1,79 @@
+import base64
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from bson import json_util
+from fastapi import HTTPException, Request, Response
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# (field, direction) pairs; the last one must be unique (normally _id) so pages never overlap
+SortSpec = Sequence[Tuple[str, int]]
+
+
+def encode_cursor(document: Dict[str, Any], sort: SortSpec) -> str:
+    """Opaque token holding the sort-key values of the last document on a page"""
+    values = [document.get(field) for field, _ in sort]
+    return base64.urlsafe_b64encode(json_util.dumps(values).encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, sort: SortSpec) -> List[Any]:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json_util.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception:
+        # Anything json_util can choke on (bad $date/$oid payloads, ...) is a bad token, not a server error
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(values, list) or len(values) != len(sort):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    # Sort keys are scalars; a document here would be spliced into the query as operators
+    if any(isinstance(value, (dict, list)) for value in values):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def keyset_filter(sort: SortSpec, values: List[Any]) -> Dict[str, Any]:
+    """Match documents strictly after ``values`` in ``sort`` order.
+
+    For sort (a, b) that is: a beyond the cursor, or a equal and b beyond it.
+    """
+    branches = []
+    for position, (field, direction) in enumerate(sort):
+        branch = {sort[i][0]: values[i] for i in range(position)}
+        branch[field] = {"$gt" if direction > 0 else "$lt": values[position]}
+        branches.append(branch)
+    return {"$or": branches}
+
+
+async def fetch_page(
+    collection,
+    query: Dict[str, Any],
+    sort: SortSpec,
+    limit: Optional[int],
+    cursor: Optional[str],
+    projection: Optional[Dict[str, int]] = None
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Return (documents, next cursor) for one keyset page"""
+    if cursor is not None:
+        query = {"$and": [query, keyset_filter(sort, decode_cursor(cursor, sort))]}
+    limit = limit or DEFAULT_PAGE_SIZE
+
+    if projection is not None and all(value for value in projection.values()):
+        # An inclusion projection must still carry the keys the cursor is built from
+        projection = {**projection, **{field: 1 for field, _ in sort}}
+
+    documents = collection.find(query, projection).sort(list(sort))
+    # One extra row tells us whether another page exists without a count query
+    page = await documents.limit(limit + 1).to_list(length=limit + 1)
+    if len(page) <= limit:
+        return page, None
+    page = page[:limit]
+    return page, encode_cursor(page[-1], sort)
+
+
+def set_next_cursor(response: Response, request: Request, next_cursor: Optional[str]):
+    """Advertise the next page in X-Next-Cursor and an RFC 8288 Link header"""
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+        next_url = request.url.include_query_params(cursor=next_cursor)
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
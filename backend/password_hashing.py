@@ -0,0 +1,138 @@
+import asyncio
+import hashlib
+import hmac
+import os
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+import bcrypt
+
+# bcrypt's own default; raise BCRYPT_ROUNDS and existing hashes are upgraded on login
+DEFAULT_ROUNDS = 12
+
+
+class PasswordHashingBusy(Exception):
+    """Raised when every hashing thread is busy and the queue is full"""
+
+
+def hash_rounds(hashed_password: str) -> Optional[int]:
+    """Cost factor of a "$2b$12$..." hash, or None if it is not a bcrypt hash"""
+    try:
+        return int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return None
+
+
+class PasswordHasher:
+    """bcrypt hashing and verification in a small dedicated thread pool.
+
+    A bcrypt call takes a few hundred milliseconds of CPU at cost 12; run on
+    the event loop it stalls every other request for that long. bcrypt
+    releases the GIL while hashing, so worker threads keep the loop free,
+    and a pool of its own means a burst of logins cannot take the threads
+    the rest of the app uses for run_in_threadpool. At most
+    ``max_workers + max_queue`` calls may be in flight; anything beyond that
+    raises PasswordHashingBusy, so a login flood is turned away instead of
+    queueing without bound.
+    """
+
+    def __init__(
+        self,
+        rounds: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        max_queue: Optional[int] = None
+    ):
+        self.rounds = rounds or int(os.getenv("BCRYPT_ROUNDS", DEFAULT_ROUNDS))
+        self.max_workers = max_workers or int(os.getenv("PASSWORD_HASH_WORKERS", min(2, os.cpu_count() or 1)))
+        self.max_queue = max_queue if max_queue is not None else int(os.getenv("PASSWORD_HASH_QUEUE_LIMIT", 16))
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="bcrypt")
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._rehashed = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue
+
+    async def _run(self, fn, *args):
+        if self._in_flight >= self.capacity:
+            self._rejected += 1
+            raise PasswordHashingBusy("Too many login attempts in progress. Please try again shortly.")
+
+        self._in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._pool, fn, *args)
+        finally:
+            self._in_flight -= 1
+            self._completed += 1
+
+    def _hash(self, password: str) -> str:
+        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=self.rounds)).decode("utf-8")
+
+    @staticmethod
+    def _verify(password: str, hashed_password: str) -> bool:
+        try:
+            return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+        except ValueError:
+            # Not a bcrypt hash (corrupt or legacy record)
+            return False
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self._hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(self._verify, password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return hash_rounds(hashed_password) != self.rounds
+
+    async def verify_and_upgrade(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """Verify a password; on success also return a new hash if the stored one has a different cost"""
+        if not await self.verify(password, hashed_password):
+            return False, None
+        if not self.needs_rehash(hashed_password):
+            return True, None
+        self._rehashed += 1
+        return True, await self.hash(password)
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "rounds": self.rounds,
+            "workers": self.max_workers,
+            "in_flight": self._in_flight,
+            "capacity": self.capacity,
+            "completed": self._completed,
+            "rejected": self._rejected,
+            "rehashed": self._rehashed
+        }
+
+
+class VerifiedPassword:
+    """Proof, kept with a pending 2FA code, that step 1 checked this password.
+
+    Step 2 of the login still receives the password, so it has to match
+    the one step 1 verified, but comparing an HMAC under a random per-login
+    key costs microseconds where a second bcrypt check costs a few hundred
+    milliseconds. The key and digest only live in process memory, next to
+    the code, until it expires.
+    """
+
+    def __init__(self, password: str, hashed_password: str):
+        self._key = secrets.token_bytes(32)
+        self._digest = self._mac(password)
+        # A password changed between the two steps invalidates the proof
+        self.hashed_password = hashed_password
+
+    def _mac(self, password: str) -> bytes:
+        return hmac.new(self._key, password.encode("utf-8"), hashlib.sha256).digest()
+
+    def matches(self, password: str, hashed_password: str) -> bool:
+        return (
+            hmac.compare_digest(self._mac(password), self._digest)
+            and hmac.compare_digest(hashed_password, self.hashed_password)
+        )
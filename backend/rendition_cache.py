@@ -0,0 +1,112 @@
+import os
+import re
+import tempfile
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+# Keys become file names, so keep them to a safe alphabet
+CACHE_KEY_PATTERN = re.compile(r"^[0-9A-Za-z._-]+$")
+
+
+class RenditionCache:
+    """Size-bounded on-disk LRU cache for generated image renditions.
+
+    Recency is tracked in memory (seeded from file access times on start)
+    and the least recently used files are deleted once the directory grows
+    past max_bytes. Each worker process keeps its own index, so a file may
+    appear (rendered by another worker) or disappear underneath us; get()
+    checks the disk either way.
+    """
+
+    def __init__(self, root: str, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(root, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self):
+        files = []
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            if CACHE_KEY_PATTERN.match(name) and os.path.isfile(path):
+                stat = os.stat(path)
+                files.append((stat.st_atime, name, stat.st_size))
+        for _, name, size in sorted(files):
+            self._entries[name] = size
+            self._total_bytes += size
+
+    def path(self, key: str) -> str:
+        if not CACHE_KEY_PATTERN.match(key):
+            raise ValueError(f"Invalid rendition cache key: {key}")
+        return os.path.join(self.root, key)
+
+    def _file_size(self, key: str) -> Optional[int]:
+        try:
+            return os.stat(self.path(key)).st_size
+        except FileNotFoundError:
+            return None
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached file's path (marking it recently used) or None.
+
+        The disk is the source of truth: a file another worker process
+        rendered is a hit too, and joins this process's index.
+        """
+        size = await run_in_threadpool(self._file_size, key)
+        if size is None:
+            self._forget(key)
+            self.misses += 1
+            return None
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        else:
+            self._entries[key] = size
+            self._total_bytes += size
+            await self._evict()
+        self.hits += 1
+        return self.path(key)
+
+    async def put(self, key: str, data: bytes):
+        await run_in_threadpool(self._write, key, data)
+        self._forget(key)
+        self._entries[key] = len(data)
+        self._total_bytes += len(data)
+        await self._evict()
+
+    def _write(self, key: str, data: bytes):
+        # Write to a temp file and rename so readers never see a partial file
+        with tempfile.NamedTemporaryFile(dir=self.root, prefix=".tmp-", delete=False) as handle:
+            handle.write(data)
+        os.replace(handle.name, self.path(key))
+
+    def _forget(self, key: str):
+        size = self._entries.pop(key, None)
+        if size is not None:
+            self._total_bytes -= size
+
+    async def _evict(self):
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self.evictions += 1
+            try:
+                await run_in_threadpool(os.unlink, self.path(key))
+            except FileNotFoundError:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
@@ -0,0 +1,158 @@
+import importlib
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Tuple
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    headers: Dict[str, str]
+
+
+class CacheBackend(ABC):
+    """Storage behind ResponseCache.
+
+    The default MemoryCacheBackend is per process, so with several workers an
+    invalidation only reaches the worker that handled the write and the others
+    catch up when their TTL expires. A shared backend (Redis, memcached, ...)
+    implementing these methods makes invalidation immediate everywhere; select
+    it with RESPONSE_CACHE_BACKEND=module:ClassName.
+
+    Each namespace has a version that invalidate() bumps. A render reads it
+    before querying and passes it to set(), which must drop the value if the
+    version has moved on since: the write that bumped it may have landed
+    after the query. The versions live in the backend so that guard also
+    holds when the write was handled by another worker.
+    """
+
+    @abstractmethod
+    async def get(self, namespace: str, key: str) -> Optional[CachedResponse]:
+        """The stored value, or None if missing or expired"""
+
+    @abstractmethod
+    async def set(self, namespace: str, key: str, value: CachedResponse, ttl: float, version: int):
+        """Store value for ttl seconds, unless the namespace's version is no longer ``version``"""
+
+    @abstractmethod
+    async def version(self, namespace: str) -> int:
+        """Current version of the namespace (0 until its first invalidation)"""
+
+    @abstractmethod
+    async def invalidate(self, namespace: str):
+        """Bump the namespace's version and drop its entries"""
+
+    def stats(self) -> Dict[str, int]:
+        return {}
+
+
+def entry_size(value: CachedResponse) -> int:
+    return len(value.body) + sum(len(name) + len(header) for name, header in value.headers.items())
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU with per-entry expiry, bounded by entry count and total bytes.
+
+    Bodies over ``max_entry_bytes`` are not stored at all, so one huge
+    listing cannot evict everything else.
+    """
+
+    def __init__(self, max_entries: int = 512, max_bytes: int = 64 * 1024 * 1024, max_entry_bytes: Optional[int] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes if max_entry_bytes is not None else max_bytes // 8
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, CachedResponse]]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._bytes = 0
+        self._oversized = 0
+
+    def _drop(self, entry_key: Tuple[str, str]):
+        _, value = self._entries.pop(entry_key)
+        self._bytes -= entry_size(value)
+
+    async def get(self, namespace, key):
+        entry = self._entries.get((namespace, key))
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._drop((namespace, key))
+            return None
+        self._entries.move_to_end((namespace, key))
+        return value
+
+    async def set(self, namespace, key, value, ttl, version):
+        if version != self._versions.get(namespace, 0):
+            return
+        size = entry_size(value)
+        if size > self.max_entry_bytes:
+            self._oversized += 1
+            return
+        if (namespace, key) in self._entries:
+            self._drop((namespace, key))
+        self._entries[(namespace, key)] = (time.monotonic() + ttl, value)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._drop(next(iter(self._entries)))
+
+    async def version(self, namespace):
+        return self._versions.get(namespace, 0)
+
+    async def invalidate(self, namespace):
+        self._versions[namespace] = self._versions.get(namespace, 0) + 1
+        for entry_key in [entry_key for entry_key in self._entries if entry_key[0] == namespace]:
+            self._drop(entry_key)
+
+    def stats(self):
+        return {"entries": len(self._entries), "bytes": self._bytes, "oversized": self._oversized}
+
+
+class ResponseCache:
+    """Serialised response bodies for read endpoints, grouped into namespaces
+    (one per collection) so a write can drop everything derived from it."""
+
+    def __init__(self, backend: CacheBackend, ttl: float):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    async def version(self, namespace: str) -> int:
+        """Read before rendering and pass to set(), so a render that raced a write is not cached"""
+        return await self.backend.version(namespace)
+
+    async def get(self, namespace: str, key: str) -> Optional[CachedResponse]:
+        value = await self.backend.get(namespace, key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, namespace: str, key: str, value: CachedResponse, version: int):
+        """Store value unless the namespace was invalidated since ``version`` was read"""
+        await self.backend.set(namespace, key, value, self.ttl, version)
+
+    async def invalidate(self, *namespaces: str):
+        for namespace in namespaces:
+            self.invalidations += 1
+            await self.backend.invalidate(namespace)
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "invalidations": self.invalidations, **self.backend.stats()}
+
+
+def create_response_cache() -> ResponseCache:
+    """Backend from RESPONSE_CACHE_BACKEND ("memory" by default, or module:ClassName)"""
+    backend_name = os.getenv("RESPONSE_CACHE_BACKEND", "memory")
+    if backend_name == "memory":
+        backend = MemoryCacheBackend(
+            int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", 512)),
+            int(os.getenv("RESPONSE_CACHE_MAX_MB", 64)) * 1024 * 1024
+        )
+    else:
+        module_name, _, class_name = backend_name.partition(":")
+        backend = getattr(importlib.import_module(module_name), class_name)()
+    return ResponseCache(backend, ttl=float(os.getenv("RESPONSE_CACHE_TTL", 60)))
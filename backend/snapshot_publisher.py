@@ -0,0 +1,222 @@
+import asyncio
+import datetime
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+    print("⚠️ Brotli snapshots not available - install brotli")
+
+# Snapshot names become file names
+SNAPSHOT_NAME_PATTERN = re.compile(r"^[a-z0-9-]+$")
+MANIFEST_FILE = "manifest.json"
+# Older versions stay on disk a while for clients still fetching a versioned URL
+KEEP_VERSIONS = 3
+# Writes arriving within this window are folded into one rebuild
+DEBOUNCE_SECONDS = 0.5
+# A failed rebuild (e.g. Atlas unreachable) keeps the last snapshot and tries again
+RETRY_SECONDS = 30
+
+# Content-Encoding -> file suffix, in order of preference
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+def _compress(body: bytes) -> Dict[str, bytes]:
+    """Pre-compressed variants; snapshots are small and rarely rebuilt, so use maximum effort"""
+    variants = {"gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+    if BROTLI_AVAILABLE:
+        variants["br"] = brotli.compress(body, mode=brotli.MODE_TEXT, quality=11)
+    return variants
+
+
+def _write_atomic(path: str, data: bytes):
+    with tempfile.NamedTemporaryFile(dir=os.path.dirname(path), suffix=".tmp", delete=False) as target:
+        target.write(data)
+    os.replace(target.name, path)
+
+
+def preferred_encoding(accept_encoding: Optional[str], available: Iterable[str]) -> Optional[str]:
+    """Best pre-compressed variant the client accepts, or None for the plain file"""
+    accepted = {}
+    for item in (accept_encoding or "").lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                continue
+        accepted[coding.strip()] = quality
+    for encoding in ENCODING_SUFFIXES:
+        if encoding in available and accepted.get(encoding, accepted.get("*", 0)) > 0:
+            return encoding
+    return None
+
+
+class SnapshotPublisher:
+    """Versioned JSON snapshots of public listings, published to local disk.
+
+    Each source renders the JSON body of one snapshot from a base URL (image
+    URLs inside are absolute). schedule() is called after admin writes and
+    rebuilds the affected snapshots in the background; a rebuild writes
+    ``<name>.<version>.json`` plus gzip/brotli variants, then points the
+    manifest at it. The version is a hash of the body, so an unchanged
+    listing keeps its version and its clients' ETags.
+
+    Readers only ever touch the files and the manifest, so they keep being
+    served when the database is unreachable. With several workers each one
+    re-reads the manifest when another has rewritten it.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        sources: Dict[str, Callable[[str], Awaitable[bytes]]],
+        base_url: str = ""
+    ):
+        invalid = [name for name in sources if not SNAPSHOT_NAME_PATTERN.match(name)]
+        if invalid:
+            raise ValueError(f"Invalid snapshot name(s): {', '.join(invalid)}")
+        self.root = root
+        self.sources = sources
+        self.base_url = base_url
+        self._manifest: Dict[str, Any] = {"base_url": "", "snapshots": {}}
+        self._manifest_mtime = None
+        self._dirty = set()
+        self._workers: Dict[str, asyncio.Task] = {}
+        # Every publish rewrites the shared manifest
+        self._write_lock = asyncio.Lock()
+        self.published = 0
+        self.unchanged = 0
+        self.failures = 0
+        os.makedirs(root, exist_ok=True)
+        self._reload_manifest()
+        # Without PUBLIC_BASE_URL, keep using the origin the last snapshots were built for
+        self.base_url = self.base_url or self._manifest["base_url"]
+
+    def _manifest_path(self) -> str:
+        return os.path.join(self.root, MANIFEST_FILE)
+
+    def _reload_manifest(self):
+        try:
+            mtime = os.stat(self._manifest_path()).st_mtime_ns
+        except FileNotFoundError:
+            return
+        if mtime == self._manifest_mtime:
+            return
+        try:
+            with open(self._manifest_path(), "rb") as manifest_file:
+                self._manifest = json.load(manifest_file)
+            self._manifest_mtime = mtime
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not read snapshot manifest: {str(e)}")
+
+    def path(self, name: str, version: str, encoding: Optional[str] = None) -> str:
+        return os.path.join(self.root, f"{name}.{version}.json{ENCODING_SUFFIXES.get(encoding, '')}")
+
+    def current(self, name: str) -> Optional[Dict[str, Any]]:
+        """Manifest entry of the published snapshot, or None before the first publish"""
+        self._reload_manifest()
+        return self._manifest["snapshots"].get(name)
+
+    def has_version(self, name: str, version: str) -> bool:
+        entry = self.current(name)
+        return bool(entry) and version in entry["versions"]
+
+    def _write_snapshot(self, name: str, body: bytes) -> Tuple[Dict[str, Any], Optional[List[str]]]:
+        """Write a new version unless the body is unchanged; returns (entry, versions to expire or None)"""
+        version = hashlib.blake2b(body, digest_size=8).hexdigest()
+        self._reload_manifest()
+        previous = self._manifest["snapshots"].get(name)
+        if previous and previous["version"] == version:
+            return previous, None
+
+        variants = _compress(body)
+        for encoding, data in variants.items():
+            _write_atomic(self.path(name, version, encoding), data)
+        _write_atomic(self.path(name, version), body)
+
+        versions = [version] + [v for v in (previous or {}).get("versions", []) if v != version]
+        entry = {
+            "version": version,
+            "versions": versions[:KEEP_VERSIONS],
+            "encodings": sorted(variants),
+            "size": len(body),
+            "published_at": datetime.datetime.utcnow().isoformat()
+        }
+        manifest = {
+            "base_url": self.base_url,
+            "snapshots": {**self._manifest["snapshots"], name: entry}
+        }
+        _write_atomic(self._manifest_path(), json.dumps(manifest, indent=2).encode())
+        self._manifest = manifest
+        self._manifest_mtime = os.stat(self._manifest_path()).st_mtime_ns
+        return entry, versions[KEEP_VERSIONS:]
+
+    def _remove_versions(self, name: str, versions: List[str]):
+        for version in versions:
+            for encoding in (None, *ENCODING_SUFFIXES):
+                try:
+                    os.unlink(self.path(name, version, encoding))
+                except FileNotFoundError:
+                    pass
+
+    async def publish(self, name: str) -> Dict[str, Any]:
+        """Rebuild one snapshot now; the previous one stays live if this raises"""
+        if not self.base_url:
+            raise RuntimeError("no base URL to build image URLs from yet")
+        body = await self.sources[name](self.base_url)
+        async with self._write_lock:
+            entry, expired = await run_in_threadpool(self._write_snapshot, name, body)
+        if expired is None:
+            self.unchanged += 1
+            return entry
+        await run_in_threadpool(self._remove_versions, name, expired)
+        self.published += 1
+        print(f"📸 Published snapshot {name} {entry['version']} ({entry['size']} bytes)")
+        return entry
+
+    def schedule(self, names: Iterable[str], base_url: str = ""):
+        """Rebuild the named snapshots in the background, coalescing bursts of writes"""
+        self.base_url = self.base_url or base_url
+        for name in names:
+            self._dirty.add(name)
+            worker = self._workers.get(name)
+            if worker is None or worker.done():
+                self._workers[name] = asyncio.create_task(self._rebuild(name))
+
+    async def _rebuild(self, name: str):
+        while name in self._dirty:
+            await asyncio.sleep(DEBOUNCE_SECONDS)
+            self._dirty.discard(name)
+            try:
+                await self.publish(name)
+            except Exception as e:
+                self.failures += 1
+                print(f"⚠️ Snapshot {name} not published, retrying in {RETRY_SECONDS}s: {str(e)}")
+                self._dirty.add(name)
+                await asyncio.sleep(RETRY_SECONDS)
+
+    async def close(self):
+        for worker in self._workers.values():
+            worker.cancel()
+        await asyncio.gather(*self._workers.values(), return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "published": self.published,
+            "unchanged": self.unchanged,
+            "failures": self.failures,
+            "pending": sorted(self._dirty),
+            "versions": {name: entry["version"] for name, entry in self._manifest["snapshots"].items()}
+        }
@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from blob_compression import CompressedBlobStore
+from blob_store import STREAM_CHUNK_SIZE, FilesystemBlobStore
+
+pytest.importorskip("zstandard")
+
+# Compressible, non-repeating text spanning several stream chunks
+DOCUMENT = "".join(f"line {number}: the quick brown fox jumps over the lazy dog\n" for number in range(40_000)).encode()
+RANGES = [
+    (0, None),
+    (0, 0),
+    (100, 99_999),
+    (STREAM_CHUNK_SIZE - 1, STREAM_CHUNK_SIZE),
+    (STREAM_CHUNK_SIZE * 2 + 17, None),
+    (len(DOCUMENT) - 1, len(DOCUMENT) - 1)
+]
+
+
+async def read_range(store, blob_id, start, end):
+    return b"".join([chunk async for chunk in store.stream(blob_id, start, end)])
+
+
+@pytest.mark.parametrize("from_file", [False, True])
+def test_ranges_of_a_compressed_blob_match_the_original(tmp_path, from_file):
+    source = tmp_path / "resume.txt"
+    source.write_bytes(DOCUMENT)
+
+    async def scenario():
+        store = CompressedBlobStore(FilesystemBlobStore(str(tmp_path / "blobs")))
+        if from_file:
+            info = await store.put_file(str(source), "text/plain")
+        else:
+            info = await store.put(DOCUMENT, "text/plain")
+        stored = await store.inner.get_info(info["id"])
+        return info, stored, [await read_range(store, info["id"], start, end) for start, end in RANGES]
+
+    info, stored, slices = asyncio.run(scenario())
+    assert stored["metadata"]["codec"] == "zstd"
+    assert stored["length"] < len(DOCUMENT) // 5
+    assert info["length"] == len(DOCUMENT)
+    for (start, end), data in zip(RANGES, slices):
+        assert data == DOCUMENT[start:None if end is None else end + 1]
+
+
+def test_incompressible_types_are_stored_as_is(tmp_path):
+    async def scenario():
+        store = CompressedBlobStore(FilesystemBlobStore(str(tmp_path)))
+        info = await store.put(DOCUMENT, "image/jpeg")
+        return await store.inner.get_info(info["id"]), await read_range(store, info["id"], 10, 19)
+
+    stored, data = asyncio.run(scenario())
+    assert "codec" not in stored["metadata"] and stored["length"] == len(DOCUMENT)
+    assert data == DOCUMENT[10:20]
@@ -0,0 +1,35 @@
+import asyncio
+
+import pytest
+
+from blob_store import BlobStore, FilesystemBlobStore
+
+
+def test_backend_missing_a_method_fails_when_created():
+    class WriteOnlyStore(BlobStore):
+        async def put(self, data, content_type, metadata=None):
+            return {}
+
+        async def get_info(self, blob_id):
+            return None
+
+        async def delete(self, blob_id):
+            pass
+
+    with pytest.raises(TypeError, match="stream"):
+        WriteOnlyStore()
+
+
+def test_filesystem_store_streams_byte_ranges(tmp_path):
+    data = bytes(range(256)) * 4000
+
+    async def scenario():
+        store = FilesystemBlobStore(str(tmp_path))
+        blob_id = (await store.put(data, "application/octet-stream"))["id"]
+        whole = await store.read(blob_id)
+        middle = b"".join([chunk async for chunk in store.stream(blob_id, 1000, 300_000)])
+        return whole, middle
+
+    whole, middle = asyncio.run(scenario())
+    assert whole == data
+    assert middle == data[1000:300_001]
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+import email_outbox
+from email_outbox import DEAD, MAX_ATTEMPTS, EmailOutbox, PermanentEmailError, retry_delay
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+
+def test_retry_delay_backs_off_exponentially_with_a_cap():
+    for attempts in range(1, 20):
+        expected = min(email_outbox.BASE_RETRY_DELAY * 2 ** (attempts - 1), email_outbox.MAX_RETRY_DELAY)
+        delays = [retry_delay(attempts) for _ in range(50)]
+        # Jitter only ever shortens the wait, by at most half
+        assert all(expected * 0.5 <= delay <= expected for delay in delays)
+    assert retry_delay(30) <= email_outbox.MAX_RETRY_DELAY
+
+
+def new_outbox(send, send_batch=None) -> EmailOutbox:
+    collection = mongomock_motor.AsyncMongoMockClient()["test"]["email_outbox"]
+    return EmailOutbox(collection, send, send_batch)
+
+
+async def run_due(outbox: EmailOutbox) -> bool:
+    """One worker iteration; False once nothing is due"""
+    emails = await outbox._claim()
+    if emails:
+        await outbox._deliver(emails)
+    return bool(emails)
+
+
+def params(to: str):
+    return {"from": "noreply@example.com", "to": [to], "subject": "Hi", "html": "<p>Hi</p>"}
+
+
+def test_email_is_dead_lettered_after_max_attempts(monkeypatch):
+    # Retries fall due at once, so the test can drive every attempt
+    monkeypatch.setattr(email_outbox, "retry_delay", lambda attempts: 0)
+
+    async def failing_send(_params):
+        raise RuntimeError("provider down")
+
+    async def scenario():
+        outbox = new_outbox(failing_send)
+        await outbox.enqueue(params("a@example.com"), "test")
+        rounds = 0
+        while await run_due(outbox):
+            rounds += 1
+        return outbox, await outbox.collection.find_one(), rounds
+
+    outbox, email, rounds = asyncio.run(scenario())
+    assert rounds == MAX_ATTEMPTS
+    assert email["status"] == DEAD and email["attempts"] == MAX_ATTEMPTS
+    assert email["last_error"] == "provider down"
+    assert outbox.stats()["retried"] == MAX_ATTEMPTS - 1 and outbox.stats()["dead"] == 1
+
+
+def test_permanent_error_dead_letters_at_once():
+    async def rejecting_send(_params):
+        raise PermanentEmailError("invalid address")
+
+    async def scenario():
+        outbox = new_outbox(rejecting_send)
+        await outbox.enqueue(params("broken"), "test")
+        await run_due(outbox)
+        return await outbox.collection.find_one()
+
+    email = asyncio.run(scenario())
+    assert email["status"] == DEAD and email["attempts"] == 1
@@ -0,0 +1,48 @@
+import re
+
+import pytest
+
+from email_templates import SAMPLE_CONTEXTS, EmailTemplateRegistry
+
+GLOBALS = {"contact_email": "esdecorationsind@gmail.com", "email_from": "E&S Decorations <noreply@esdecorations.in>"}
+
+
+@pytest.fixture(scope="module")
+def registry():
+    return EmailTemplateRegistry(globals=GLOBALS).load()
+
+
+@pytest.mark.parametrize("name", sorted(SAMPLE_CONTEXTS))
+def test_text_part_has_no_markup(registry, name):
+    email = registry.render_sample(name)
+    assert email.subject and not re.search(r"</?(p|div|ul|li|strong|br)\b", email.text)
+    assert "&amp;" not in email.text
+    assert "E&S Decorations" in email.text
+
+
+def test_values_are_escaped_in_html_only(registry):
+    email = registry.render("acceptance", applicant_name="<b>Anjali</b>")
+    assert "&lt;b&gt;Anjali&lt;/b&gt;" in email.html
+    assert "Dear <b>Anjali</b>," in email.text
+
+
+def test_reply_text_part_uses_the_plain_text_version(registry):
+    context = dict(SAMPLE_CONTEXTS["inquiry_reply"], reply_html="<p>Hello <b>there</b></p>", reply_text="Hi there")
+    email = registry.render("inquiry_reply", **context)
+    assert "Hello <b>there</b>" in email.html
+    assert "Hi there" in email.text and "Hello" not in email.text
+
+
+@pytest.mark.parametrize("name", ["acceptance", "rejection"])
+def test_render_many_matches_render(registry, name):
+    contexts = [{"applicant_name": value} for value in
+                ["Anjali", "A & B <c>", "O'Brien \"Jr\"", "  spaced\nname ", "", "Ravi"]]
+    assert registry.render_many(name, contexts) == [registry.render(name, **context) for context in contexts]
+
+
+def test_render_many_falls_back_when_values_are_transformed(registry):
+    contexts = [dict(SAMPLE_CONTEXTS["inquiry_reply"], original_message="m" * length) for length in (10, 200, 149)]
+    assert registry._skeleton("inquiry_reply", sorted(contexts[0])) is None
+    assert registry.render_many("inquiry_reply", contexts) == [
+        registry.render("inquiry_reply", **context) for context in contexts
+    ]
@@ -0,0 +1,76 @@
+import asyncio
+
+import httpx
+import pytest
+
+import fake_resend
+from email_outbox import DEAD, SENT, EmailOutbox, PermanentEmailError
+from email_transport import EmailTransportError, ResendHttpTransport
+
+
+def fake_resend_transport() -> ResendHttpTransport:
+    """ResendHttpTransport talking to fake_resend in-process"""
+    transport = ResendHttpTransport("test-key")
+    transport.client = httpx.AsyncClient(transport=httpx.ASGITransport(app=fake_resend.app), base_url="http://resend")
+    return transport
+
+
+def params(to: str):
+    return {"from": "noreply@example.com", "to": [to], "subject": "Hi", "html": "<p>Hi</p>"}
+
+
+def test_batch_with_one_bad_address_is_refused_permanently():
+    async def scenario():
+        transport = fake_resend_transport()
+        try:
+            ids = await transport.send_batch([params("a@example.com"), params("b@example.com")])
+            with pytest.raises(PermanentEmailError):
+                await transport.send_batch([params("a@example.com"), params("broken")])
+            return ids
+        finally:
+            await transport.close()
+
+    assert len(asyncio.run(scenario())) == 2
+
+
+def test_provider_outage_is_retryable(monkeypatch):
+    monkeypatch.setattr(fake_resend, "FAILURE_RATE", 1.0)
+
+    async def scenario():
+        transport = fake_resend_transport()
+        try:
+            with pytest.raises(EmailTransportError):
+                await transport.send(params("a@example.com"))
+        finally:
+            await transport.close()
+
+    asyncio.run(scenario())
+
+
+def test_refused_batch_falls_back_to_single_sends():
+    mongomock_motor = pytest.importorskip("mongomock_motor")
+    fake_resend.received.clear()
+
+    async def scenario():
+        transport = fake_resend_transport()
+        batches = []
+
+        async def send_batch(batch):
+            batches.append(len(batch))
+            return await transport.send_batch(batch)
+
+        collection = mongomock_motor.AsyncMongoMockClient()["test"]["email_outbox"]
+        outbox = EmailOutbox(collection, transport.send, send_batch)
+        recipients = ["a@example.com", "broken", "c@example.com", "d@example.com"]
+        await outbox.enqueue_many([params(to) for to in recipients], "rejection")
+        while emails := await outbox._claim():
+            await outbox._deliver(emails)
+        await transport.close()
+        return batches, {email["params"]["to"][0]: email async for email in collection.find()}
+
+    batches, emails = asyncio.run(scenario())
+    # One refused batch call, then every email on its own
+    assert batches == [4]
+    assert emails["broken"]["status"] == DEAD and emails["broken"]["attempts"] == 1
+    assert all(emails[to]["status"] == SENT for to in ("a@example.com", "c@example.com", "d@example.com"))
+    assert sorted(email["to"][0] for email in fake_resend.received) == ["a@example.com", "c@example.com", "d@example.com"]
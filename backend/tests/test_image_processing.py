@@ -0,0 +1,145 @@
+import asyncio
+import io
+import os
+
+import pytest
+from PIL import Image
+
+from image_processing import ImageProcessingBusy, ImageProcessingExecutor, SmartImageCompressor
+
+
+def encoded(image: Image.Image, fmt: str) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+def large_palette_image() -> Image.Image:
+    return Image.linear_gradient("L").resize((6000, 4000)).convert("RGB").quantize(64)
+
+
+@pytest.mark.parametrize("fmt", ["PNG", "GIF"])
+def test_large_palette_image_is_reduced_on_decode(fmt):
+    data = encoded(large_palette_image(), fmt)
+
+    jpeg_bytes, metadata = SmartImageCompressor.convert_to_web_format(data)
+    assert metadata["final_dimensions"] == (1620, 1080)
+    assert metadata["decode_reduction"] == "reduce 1/2"
+    assert Image.open(io.BytesIO(jpeg_bytes)).mode == "RGB"
+
+    _, metadata = SmartImageCompressor.progressive_compress(data)
+    assert metadata["final_dimensions"] == (1620, 1080)
+
+    assert SmartImageCompressor.compute_placeholder(data)["dominant_color"].startswith("#")
+
+
+def test_transparent_palette_image_keeps_white_background():
+    image = Image.new("P", (6000, 4000), 0)
+    image.putpalette([255, 0, 0] * 256)
+    image.info["transparency"] = 0
+    jpeg_bytes, _ = SmartImageCompressor.convert_to_web_format(encoded(image, "PNG"))
+    red, green, blue = Image.open(io.BytesIO(jpeg_bytes)).getpixel((10, 10))
+    assert min(red, green, blue) > 240
+
+
+@pytest.mark.parametrize("mode", ["1", "I;16"])
+def test_large_bilevel_and_16_bit_images_are_reduced_on_decode(mode):
+    data = encoded(Image.new(mode, (6000, 4000)), "TIFF")
+    _, metadata = SmartImageCompressor.convert_to_web_format(data)
+    assert metadata["final_dimensions"] == (1620, 1080)
+
+
+def test_progressive_compress_computes_placeholder_once(monkeypatch):
+    calls = []
+    placeholder = SmartImageCompressor._placeholder
+    monkeypatch.setattr(SmartImageCompressor, "_placeholder", lambda image: calls.append(image.size) or placeholder(image))
+    noisy = Image.effect_noise((3000, 2000), 100).convert("RGB")
+
+    _, metadata = SmartImageCompressor.progressive_compress(encoded(noisy, "PNG"), target_size=300 * 1024)
+    assert metadata["encode_attempts"] > 1
+    assert calls == [metadata["final_dimensions"]]
+    assert metadata["placeholder"].startswith("data:image/webp;base64,")
+
+
+def photo_like(width: int, height: int, noise: int) -> bytes:
+    gradient = Image.linear_gradient("L").resize((width, height))
+    texture = Image.effect_noise((width, height), noise)
+    return encoded(Image.merge("RGB", (gradient, texture, gradient.rotate(90).resize((width, height)))), "JPEG")
+
+
+@pytest.mark.parametrize("noise", [20, 60, 120])
+@pytest.mark.parametrize("target_kb", [400, 150, 60])
+def test_bisect_never_encodes_more_than_the_ladder(noise, target_kb):
+    source = photo_like(3000, 2000, noise)
+    _, ladder = SmartImageCompressor.progressive_compress(source, target_size=target_kb * 1024, strategy="ladder")
+    _, bisect = SmartImageCompressor.progressive_compress(source, target_size=target_kb * 1024, strategy="bisect")
+
+    assert bisect["encode_attempts"] <= ladder["encode_attempts"]
+    assert bisect["target_achieved"] == ladder["target_achieved"]
+    if bisect["target_achieved"]:
+        assert bisect["final_size"] <= target_kb * 1024
+
+
+def small_jpeg() -> bytes:
+    return encoded(Image.linear_gradient("L").resize((1200, 800)).convert("RGB"), "JPEG")
+
+
+async def render_concurrently(executor: ImageProcessingExecutor, count: int):
+    source = small_jpeg()
+    try:
+        return await asyncio.gather(
+            *(executor.run(SmartImageCompressor.render_variant, source, 320, "webp") for _ in range(count)),
+            return_exceptions=True
+        )
+    finally:
+        executor.shutdown()
+
+
+def test_waiting_executor_serves_a_burst_beyond_its_capacity():
+    executor = ImageProcessingExecutor(max_workers=1, max_queue=1, wait_timeout=60)
+    results = asyncio.run(render_concurrently(executor, 40))
+    assert all(isinstance(result, tuple) for result in results)
+    assert executor.stats()["rejected"] == 0
+    assert executor.stats()["waiting"] == 0
+
+
+def test_waiting_executor_rejects_once_its_timeout_runs_out():
+    executor = ImageProcessingExecutor(max_workers=1, max_queue=0, wait_timeout=0.001)
+    results = asyncio.run(render_concurrently(executor, 10))
+    assert any(isinstance(result, tuple) for result in results)
+    assert any(isinstance(result, ImageProcessingBusy) for result in results)
+
+
+def test_fail_fast_executor_rejects_beyond_its_capacity():
+    executor = ImageProcessingExecutor(max_workers=1, max_queue=1)
+    results = asyncio.run(render_concurrently(executor, 10))
+    assert sum(isinstance(result, tuple) for result in results) == 2
+    assert sum(isinstance(result, ImageProcessingBusy) for result in results) == 8
+
+
+def crash_worker():
+    os._exit(1)
+
+
+def test_crashed_worker_pool_is_shut_down_and_replaced():
+    async def scenario():
+        executor = ImageProcessingExecutor(max_workers=2, max_queue=2)
+        try:
+            await executor.run(SmartImageCompressor.render_variant, small_jpeg(), 320, "webp")
+            broken = executor._pool
+            shutdowns = []
+            broken.shutdown = lambda **options: shutdowns.append(options)
+            results = await asyncio.gather(
+                executor.run(crash_worker), executor.run(crash_worker), return_exceptions=True
+            )
+            assert all(isinstance(result, Exception) for result in results)
+            assert shutdowns and shutdowns[0] == {"wait": False, "cancel_futures": True}
+            assert executor._pool is None
+            data, _ = await executor.run(SmartImageCompressor.render_variant, small_jpeg(), 320, "webp")
+            assert data and executor._pool is not broken
+            assert executor.stats()["completed"] == 2
+            assert executor.stats()["failed"] == 2
+        finally:
+            executor.shutdown()
+
+    asyncio.run(scenario())
@@ -0,0 +1,67 @@
+import asyncio
+import base64
+import datetime
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+
+from pagination import decode_cursor, encode_cursor, fetch_page, keyset_filter
+
+SORT = (("created_at", -1), ("_id", 1))
+
+
+def raw_cursor(payload: str) -> str:
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def test_cursor_round_trips_bson_values():
+    document = {"_id": ObjectId(), "created_at": datetime.datetime(2024, 5, 1, 12, 30), "title": "ignored"}
+    values = decode_cursor(encode_cursor(document, SORT), SORT)
+    assert values == [document["created_at"], document["_id"]]
+    assert isinstance(values[1], ObjectId)
+
+
+def test_keyset_filter_matches_rows_after_the_cursor():
+    created_at, _id = datetime.datetime(2024, 5, 1), ObjectId()
+    assert keyset_filter(SORT, [created_at, _id]) == {"$or": [
+        {"created_at": {"$lt": created_at}},
+        {"created_at": created_at, "_id": {"$gt": _id}}
+    ]}
+
+
+@pytest.mark.parametrize("token", [
+    "not base64!",
+    raw_cursor("not json"),
+    raw_cursor('{"created_at": 1}'),
+    raw_cursor('[1]'),
+    raw_cursor('[{"$date": "x"}, 1]'),
+    raw_cursor('[{"$oid": "zz"}, 1]'),
+    raw_cursor('[{"$ne": null}, 1]')
+])
+def test_malformed_cursor_is_a_400(token):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(token, SORT)
+    assert error.value.status_code == 400
+    assert error.value.detail == "Invalid cursor"
+
+
+def test_pages_cover_every_document_once():
+    mongomock_motor = pytest.importorskip("mongomock_motor")
+
+    async def scenario():
+        collection = mongomock_motor.AsyncMongoMockClient()["test"]["items"]
+        # Repeated timestamps, so the _id tie-break decides page boundaries
+        await collection.insert_many([
+            {"created_at": datetime.datetime(2024, 1, 1 + number // 3), "number": number} for number in range(20)
+        ])
+        seen, cursor = [], None
+        while True:
+            page, cursor = await fetch_page(collection, {}, SORT, 7, cursor)
+            seen += [document["number"] for document in page]
+            if cursor is None:
+                return seen
+
+    seen = asyncio.run(scenario())
+    assert sorted(seen) == list(range(20))
+    assert len(seen) == 20
@@ -0,0 +1,50 @@
+import asyncio
+
+import bcrypt
+
+from password_hashing import PasswordHasher, PasswordHashingBusy, VerifiedPassword, hash_rounds
+
+# The minimum cost keeps the tests fast
+ROUNDS = 4
+
+
+def test_verified_password_matches_only_the_checked_password_and_hash():
+    hashed = bcrypt.hashpw(b"correct horse", bcrypt.gensalt(rounds=ROUNDS)).decode()
+    proof = VerifiedPassword("correct horse", hashed)
+
+    assert proof.matches("correct horse", hashed)
+    assert not proof.matches("wrong horse", hashed)
+    # The password was changed between the two login steps
+    rehashed = bcrypt.hashpw(b"correct horse", bcrypt.gensalt(rounds=ROUNDS)).decode()
+    assert not proof.matches("correct horse", rehashed)
+
+
+def test_verify_and_upgrade_rehashes_at_the_configured_cost():
+    async def scenario():
+        hasher = PasswordHasher(rounds=ROUNDS + 1, max_workers=1)
+        try:
+            old_hash = bcrypt.hashpw(b"secret", bcrypt.gensalt(rounds=ROUNDS)).decode()
+            assert await hasher.verify_and_upgrade("wrong", old_hash) == (False, None)
+            ok, new_hash = await hasher.verify_and_upgrade("secret", old_hash)
+            assert ok and hash_rounds(new_hash) == ROUNDS + 1
+            assert await hasher.verify_and_upgrade("secret", new_hash) == (True, None)
+            # A corrupt stored hash is a failed login, not an error
+            assert await hasher.verify("secret", "not-a-hash") is False
+        finally:
+            hasher.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_checks_beyond_capacity_are_turned_away():
+    async def scenario():
+        hasher = PasswordHasher(rounds=ROUNDS, max_workers=1, max_queue=1)
+        hashed = bcrypt.hashpw(b"secret", bcrypt.gensalt(rounds=10)).decode()
+        try:
+            return await asyncio.gather(*(hasher.verify("secret", hashed) for _ in range(5)), return_exceptions=True)
+        finally:
+            hasher.shutdown()
+
+    results = asyncio.run(scenario())
+    assert results.count(True) == 2
+    assert sum(isinstance(result, PasswordHashingBusy) for result in results) == 3
@@ -0,0 +1,21 @@
+import asyncio
+
+from rendition_cache import RenditionCache
+
+
+def test_rendition_written_by_another_worker_is_a_hit(tmp_path):
+    async def scenario():
+        # Two worker processes share the directory but not the in-memory index
+        writer = RenditionCache(str(tmp_path), max_bytes=10_000)
+        reader = RenditionCache(str(tmp_path), max_bytes=10_000)
+        await writer.put("abc-320.webp", b"x" * 100)
+        path = await reader.get("abc-320.webp")
+        assert path is not None and open(path, "rb").read() == b"x" * 100
+        assert reader.stats()["hits"] == 1 and reader.stats()["bytes"] == 100
+
+        # ...and one the other worker evicted is a miss
+        await writer.put("def-320.webp", b"y" * 9_950)
+        assert await reader.get("abc-320.webp") is None
+        assert reader.stats()["bytes"] == 0
+
+    asyncio.run(scenario())
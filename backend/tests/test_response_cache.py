@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from response_cache import CacheBackend, CachedResponse, MemoryCacheBackend, ResponseCache
+
+
+def body(size: int) -> CachedResponse:
+    return CachedResponse(b"x" * size, {})
+
+
+def test_memory_backend_is_bounded_by_total_bytes():
+    async def scenario():
+        backend = MemoryCacheBackend(max_entries=100, max_bytes=1000, max_entry_bytes=400)
+        for index in range(5):
+            await backend.set("faqs", str(index), body(300), 60, 0)
+        assert backend.stats()["bytes"] <= 1000
+        assert await backend.get("faqs", "0") is None
+        assert await backend.get("faqs", "4") is not None
+
+        await backend.set("faqs", "huge", body(500), 60, 0)
+        assert await backend.get("faqs", "huge") is None
+        assert backend.stats()["oversized"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_render_that_raced_an_invalidation_is_not_stored():
+    async def scenario():
+        backend = MemoryCacheBackend()
+        # Two workers sharing one backend: the write lands on the other one
+        reader, writer = ResponseCache(backend, ttl=60), ResponseCache(backend, ttl=60)
+        version = await reader.version("faqs")
+        await writer.invalidate("faqs")
+        await reader.set("faqs", "/faqs", body(10), version)
+        assert await reader.get("faqs", "/faqs") is None
+
+        await reader.set("faqs", "/faqs", body(10), await reader.version("faqs"))
+        assert await reader.get("faqs", "/faqs") is not None
+
+    asyncio.run(scenario())
+
+
+def test_backend_missing_a_method_fails_when_created():
+    class VersionlessBackend(CacheBackend):
+        async def get(self, namespace, key):
+            return None
+
+        async def set(self, namespace, key, value, ttl, version):
+            pass
+
+        async def invalidate(self, namespace):
+            pass
+
+    with pytest.raises(TypeError, match="version"):
+        VersionlessBackend()
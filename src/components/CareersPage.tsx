@@ -23,7 +23,7 @@ interface JobApplication {
   email: string;
   phone: string;
   experience: string;
-  resume?: string;
+  resume?: File;
   address?: string;
 }
 
@@ -67,7 +67,7 @@ const CareersPage = () => {
     const fetchJobs = async () => {
       try {
         const response = await axios.get(
-          "https://es-decorations.onrender.com/job-listings"
+          "https://es-decorations.onrender.com/snapshots/job-listings.json"
         );
         // Filter only active jobs
         const activeJobs = response.data.filter(
@@ -176,14 +176,23 @@ const CareersPage = () => {
     }
 
     try {
-      const applicationData = {
-        ...formData,
-        status: "pending",
-        appliedDate: new Date().toISOString(),
-      };
+      // Multipart upload: the resume file is sent as-is, not base64 in JSON
+      const applicationData = new FormData();
+      applicationData.append("jobId", formData.jobId);
+      applicationData.append("name", formData.name);
+      applicationData.append("email", formData.email);
+      applicationData.append("phone", formData.phone);
+      applicationData.append("experience", formData.experience);
+      applicationData.append("appliedDate", new Date().toISOString());
+      if (formData.address) {
+        applicationData.append("address", formData.address);
+      }
+      if (formData.resume) {
+        applicationData.append("resume", formData.resume);
+      }
 
       const response = await axios.post(
-        "https://es-decorations.onrender.com/job-applications",
+        "https://es-decorations.onrender.com/job-applications/upload",
         applicationData
       );
 
@@ -214,7 +223,7 @@ const CareersPage = () => {
     }
   };
 
-  const handleFileChange = async (e: React.ChangeEvent<HTMLInputElement>) => {
+  const handleFileChange = (e: React.ChangeEvent<HTMLInputElement>) => {
     setFileError("");
     setFormErrors((prev) => ({ ...prev, resume: undefined }));
     const file = e.target.files?.[0];
@@ -234,34 +243,10 @@ const CareersPage = () => {
         return;
       }
 
-      try {
-        // Convert file to base64
-        const base64String = await convertFileToBase64(file);
-        setFormData({ ...formData, resume: base64String });
-      } catch (error) {
-        console.error("Error converting file:", error);
-        setFileError("Error processing file. Please try again.");
-      }
+      setFormData({ ...formData, resume: file });
     }
   };
 
-  const convertFileToBase64 = (file: File): Promise<string> => {
-    return new Promise((resolve, reject) => {
-      const reader = new FileReader();
-      reader.readAsDataURL(file);
-      reader.onload = () => {
-        if (typeof reader.result === "string") {
-          // Remove the data URL prefix (e.g., "data:application/pdf;base64,")
-          const base64String = reader.result.split(",")[1];
-          resolve(base64String);
-        } else {
-          reject(new Error("Failed to convert file to base64"));
-        }
-      };
-      reader.onerror = (error) => reject(error);
-    });
-  };
-
   if (loading) {
     return (
       <>
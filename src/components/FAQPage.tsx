@@ -24,7 +24,7 @@ const FAQPage = () => {
     const fetchFAQs = async () => {
       try {
         const response = await axios.get(
-          "https://es-decorations.onrender.com/faqs"
+          "https://es-decorations.onrender.com/snapshots/faqs.json"
         );
         setFaqs(response.data);
         setError(null);
@@ -11,6 +11,7 @@ import {
   Maximize2,
 } from "lucide-react";
 import axios from "axios";
+import { ImagePlaceholder, imageVariant, placeholderStyle } from "../lib/utils";
 
 interface GalleryEvent {
   _id: string;
@@ -22,14 +23,18 @@ interface GalleryEvent {
   category: string;
   thumbnail: string;
   images: string[];
+  placeholders?: Record<string, ImagePlaceholder>;
   details: string;
   highlights: string[];
 }
 
+// The index grid loads ?view=summary, which leaves out the heavy fields
+type GalleryEventSummary = Omit<GalleryEvent, "images" | "details">;
+
 const InteractiveGallery = () => {
   const [selectedEvent, setSelectedEvent] = useState<GalleryEvent | null>(null);
   const [currentImageIndex, setCurrentImageIndex] = useState(0);
-  const [events, setEvents] = useState<GalleryEvent[]>([]);
+  const [events, setEvents] = useState<GalleryEventSummary[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [isFullscreen, setIsFullscreen] = useState(false);
@@ -38,7 +43,7 @@ const InteractiveGallery = () => {
     const fetchEvents = async () => {
       try {
         const response = await axios.get(
-          "https://es-decorations.onrender.com/gallery-events"
+          "https://es-decorations.onrender.com/snapshots/gallery-events.json"
         );
         setEvents(response.data);
         setError(null);
@@ -74,9 +79,16 @@ const InteractiveGallery = () => {
     };
   }, [isFullscreen]);
 
-  const openEventDetails = (event: GalleryEvent) => {
-    setSelectedEvent(event);
-    setCurrentImageIndex(0);
+  const openEventDetails = async (event: GalleryEventSummary) => {
+    try {
+      const response = await axios.get(
+        `https://es-decorations.onrender.com/gallery-events/${event._id}`
+      );
+      setSelectedEvent(response.data);
+      setCurrentImageIndex(0);
+    } catch (err) {
+      console.error("Error fetching event details:", err);
+    }
   };
 
   const closeEventDetails = () => {
@@ -188,9 +200,11 @@ const InteractiveGallery = () => {
                   <div className="bg-neutral-900/50 border border-neutral-800 rounded-xl overflow-hidden hover:border-neutral-700 transition-colors">
                     <div className="relative h-64 overflow-hidden">
                       <img
-                        src={event.thumbnail}
+                        src={imageVariant(event.thumbnail, 640)}
                         alt={event.title}
                         className="w-full h-full object-cover transform transition-transform duration-500 group-hover:scale-110"
+                        style={placeholderStyle(event.placeholders?.[event.thumbnail])}
+                        loading="lazy"
                       />
                       <div className="absolute top-4 right-4 bg-white/80 text-gray-800 px-3 py-1 rounded-full text-sm">
                         {event.category}
@@ -372,9 +386,11 @@ const InteractiveGallery = () => {
                             onClick={() => setCurrentImageIndex(index)}
                           >
                             <img
-                              src={image}
+                              src={imageVariant(image, 320)}
                               alt={`Thumbnail ${index + 1}`}
                               className="w-full h-24 object-cover"
+                              style={placeholderStyle(selectedEvent.placeholders?.[image])}
+                              loading="lazy"
                             />
                           </div>
                         ))}
@@ -460,7 +476,7 @@ const InteractiveGallery = () => {
                         }`}
                       >
                         <img
-                          src={image}
+                          src={imageVariant(image, 320)}
                           alt={`Thumbnail ${index + 1}`}
                           className="w-full h-full object-cover"
                         />
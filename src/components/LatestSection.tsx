@@ -2,12 +2,15 @@ import React, { useRef, useEffect, useState } from "react";
 import { motion, useScroll, useTransform } from "framer-motion";
 import { HeroParallax } from "./ui/hero-parallax";
 import axios from "axios";
+import { ImagePlaceholder } from "../lib/utils";
 
 interface LatestWork {
   _id: string;
   title: string;
   thumbnail: string;
   category: string;
+  placeholders?: Record<string, ImagePlaceholder>;
+  placeholder?: ImagePlaceholder;
 }
 
 const LatestSection = () => {
@@ -25,12 +28,15 @@ const LatestSection = () => {
     const fetchWorks = async () => {
       try {
         const response = await axios.get(
-          "https://es-decorations.onrender.com/latest-works"
+          "https://es-decorations.onrender.com/snapshots/latest-works.json"
         );
-        // Transform the works data to include the base64 image data
+        // Stored images come back as URLs; older works still hold raw base64
         const transformedWorks = response.data.map((work: LatestWork) => ({
           ...work,
-          thumbnail: `data:image/jpeg;base64,${work.thumbnail}`,
+          thumbnail: /^(data:|https?:)/.test(work.thumbnail)
+            ? work.thumbnail
+            : `data:image/jpeg;base64,${work.thumbnail}`,
+          placeholder: work.placeholders?.[work.thumbnail],
         }));
         setWorks(transformedWorks);
       } catch (error) {
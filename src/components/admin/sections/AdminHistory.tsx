@@ -37,7 +37,7 @@ const AdminHistory = () => {
       try {
         // Fetch events count
         const eventsResponse = await axios.get(
-          "https://es-decorations.onrender.com/events"
+          "https://es-decorations.onrender.com/events?fields=title,date,location"
         );
         const totalEvents = eventsResponse.data.length;
 
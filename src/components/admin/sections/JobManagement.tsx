@@ -25,7 +25,9 @@ interface JobApplication {
   phone: string;
   experience: string;
   address?: string;
-  resume?: string;
+  // Resumes are fetched on demand from this URL, not sent with the list
+  resume_url?: string;
+  resume_content_type?: string;
   status: "pending" | "approved" | "rejected";
   appliedDate: string;
 }
@@ -58,6 +60,8 @@ const JobManagement = () => {
     pdfUrl: string;
   } | null>(null);
   const [pdfZoom, setPdfZoom] = useState(1);
+  // Pending applications ticked for a bulk approve/reject
+  const [selectedIds, setSelectedIds] = useState<Set<string>>(new Set());
   const [newJob, setNewJob] = useState<JobListing>({
     id: "",
     title: "",
@@ -118,6 +122,52 @@ const JobManagement = () => {
     }
   };
 
+  const toggleSelected = (applicationId: string) => {
+    setSelectedIds((current) => {
+      const next = new Set(current);
+      if (next.has(applicationId)) {
+        next.delete(applicationId);
+      } else {
+        next.add(applicationId);
+      }
+      return next;
+    });
+  };
+
+  const pendingApplications = applications.filter(
+    (application) => application.status === "pending"
+  );
+  const allPendingSelected =
+    pendingApplications.length > 0 &&
+    pendingApplications.every((application) => selectedIds.has(application._id));
+
+  const toggleAllPending = () => {
+    setSelectedIds(
+      allPendingSelected
+        ? new Set()
+        : new Set(pendingApplications.map((application) => application._id))
+    );
+  };
+
+  // One request for the whole selection; the emails are sent in batches server-side
+  const handleBulkStatusChange = async (newStatus: "approved" | "rejected") => {
+    try {
+      await axios.patch(
+        "https://es-decorations.onrender.com/job-applications/status",
+        {
+          updates: Array.from(selectedIds).map((id) => ({
+            id,
+            status: newStatus,
+          })),
+        }
+      );
+      setSelectedIds(new Set());
+      fetchData();
+    } catch (error) {
+      console.error("Error updating application statuses:", error);
+    }
+  };
+
   const handleSubmitJob = async (e: React.FormEvent) => {
     e.preventDefault();
     try {
@@ -211,17 +261,13 @@ const JobManagement = () => {
     }
   };
 
-  const handleViewResume = (application: JobApplication) => {
-    if (application.resume) {
+  const handleViewResume = async (application: JobApplication) => {
+    if (application.resume_url) {
       try {
-        // Create a Blob from the base64 data
-        const byteCharacters = atob(application.resume);
-        const byteNumbers = new Array(byteCharacters.length);
-        for (let i = 0; i < byteCharacters.length; i++) {
-          byteNumbers[i] = byteCharacters.charCodeAt(i);
-        }
-        const byteArray = new Uint8Array(byteNumbers);
-        const blob = new Blob([byteArray], { type: "application/pdf" });
+        const response = await axios.get(application.resume_url, {
+          responseType: "blob",
+        });
+        const blob: Blob = response.data;
 
         // Create a URL for the Blob
         const fileURL = URL.createObjectURL(blob);
@@ -323,6 +369,43 @@ const JobManagement = () => {
 
         {activeTab === "applications" ? (
           <div className="grid gap-4">
+            {pendingApplications.length > 0 && (
+              <div className="flex items-center justify-between bg-neutral-900 rounded-lg px-6 py-3">
+                <label className="flex items-center gap-3 text-neutral-400">
+                  <input
+                    type="checkbox"
+                    checked={allPendingSelected}
+                    onChange={toggleAllPending}
+                    className="h-4 w-4"
+                  />
+                  {selectedIds.size > 0
+                    ? `${selectedIds.size} selected`
+                    : "Select all pending"}
+                </label>
+                {selectedIds.size > 0 && (
+                  <div className="flex items-center gap-2">
+                    <motion.button
+                      whileHover={{ scale: 1.05 }}
+                      whileTap={{ scale: 0.95 }}
+                      onClick={() => handleBulkStatusChange("approved")}
+                      className="px-3 py-1 bg-green-500/10 text-green-500 rounded-lg hover:bg-green-500/20 transition-colors flex items-center gap-1 text-sm"
+                    >
+                      <Check className="h-4 w-4" />
+                      Approve selected
+                    </motion.button>
+                    <motion.button
+                      whileHover={{ scale: 1.05 }}
+                      whileTap={{ scale: 0.95 }}
+                      onClick={() => handleBulkStatusChange("rejected")}
+                      className="px-3 py-1 bg-red-500/10 text-red-500 rounded-lg hover:bg-red-500/20 transition-colors flex items-center gap-1 text-sm"
+                    >
+                      <X className="h-4 w-4" />
+                      Reject selected
+                    </motion.button>
+                  </div>
+                )}
+              </div>
+            )}
             {applications.map((application) => {
               const Icon = getJobIcon(application.jobId);
               return (
@@ -334,6 +417,14 @@ const JobManagement = () => {
                 >
                   <div className="flex items-center justify-between">
                     <div className="flex items-center gap-4">
+                      {application.status === "pending" && (
+                        <input
+                          type="checkbox"
+                          checked={selectedIds.has(application._id)}
+                          onChange={() => toggleSelected(application._id)}
+                          className="h-4 w-4"
+                        />
+                      )}
                       <div className="h-12 w-12 rounded-full bg-neutral-800 flex items-center justify-center">
                         <Icon className="h-6 w-6 text-neutral-400" />
                       </div>
@@ -573,7 +664,7 @@ const JobManagement = () => {
                     </p>
                   </div>
 
-                  {selectedApplication.resume && (
+                  {selectedApplication.resume_url && (
                     <div>
                       <h4 className="text-sm font-medium text-neutral-400 mb-2">
                         Resume
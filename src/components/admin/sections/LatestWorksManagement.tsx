@@ -29,7 +29,7 @@ const LatestWorksManagement = () => {
       );
       const transformedWorks = response.data.map((work: LatestWork) => ({
         ...work,
-        thumbnail: work.thumbnail.startsWith("data:")
+        thumbnail: /^(data:|https?:)/.test(work.thumbnail)
           ? work.thumbnail
           : `data:image/jpeg;base64,${work.thumbnail}`,
       }));
@@ -85,7 +85,10 @@ const LatestWorksManagement = () => {
     try {
       const workData = {
         ...newWork,
-        thumbnail: newWork.thumbnail.split("base64,")[1],
+        // Unchanged images are sent back as their URL
+        thumbnail: newWork.thumbnail.startsWith("data:")
+          ? newWork.thumbnail.split("base64,")[1]
+          : newWork.thumbnail,
       };
 
       if (editingWork?._id) {
@@ -6,7 +6,7 @@ import {
   useSpring,
   MotionValue,
 } from "framer-motion";
-import { cn } from "../../lib/utils";
+import { cn, ImagePlaceholder, imageVariant, placeholderStyle } from "../../lib/utils";
 
 export const HeroParallax = ({
   products,
@@ -15,6 +15,7 @@ export const HeroParallax = ({
     title: string;
     thumbnail: string;
     category: string;
+    placeholder?: ImagePlaceholder;
   }[];
 }) => {
   // Dynamic column distribution
@@ -222,6 +223,7 @@ export const ProductCard = ({
     title: string;
     thumbnail: string;
     category: string;
+    placeholder?: ImagePlaceholder;
   };
   translate: MotionValue<number>;
   getImageSrc: (thumbnail: string) => string;
@@ -240,9 +242,10 @@ export const ProductCard = ({
       <div className="block group-hover/product:shadow-2xl w-full h-full">
         <div className="relative w-full h-full overflow-hidden rounded-xl border border-white/10 backdrop-blur-sm">
           <img
-            src={getImageSrc(product.thumbnail)}
+            src={imageVariant(getImageSrc(product.thumbnail), 640)}
             alt={product.title}
             className="w-full h-full object-cover transition-all duration-500 group-hover/product:scale-110 group-hover/product:brightness-110"
+            style={placeholderStyle(product.placeholder)}
             loading="lazy"
           />
           <div className="absolute inset-0 bg-gradient-to-t from-black/90 via-black/40 to-transparent opacity-0 group-hover/product:opacity-100 transition-all duration-300"></div>
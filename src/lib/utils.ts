@@ -1,6 +1,35 @@
 import { ClassValue, clsx } from "clsx";
+import type { CSSProperties } from "react";
 import { twMerge } from "tailwind-merge";
 
 export function cn(...inputs: ClassValue[]) {
   return twMerge(clsx(inputs));
-}
\ No newline at end of file
+}
+// Stored images are served from /images/<id>; ask the API for a resized
+// rendition instead of the full-size original. Other sources pass through.
+export function imageVariant(
+  src: string,
+  width: number,
+  fmt: "jpeg" | "webp" = "webp"
+) {
+  if (!/\/images\/[0-9a-f]{64}$/.test(src)) return src;
+  return `${src}?w=${width}&fmt=${fmt}`;
+}
+
+// Tiny preview + dominant colour the API stores for every image, keyed by
+// image URL in each document's `placeholders` map.
+export interface ImagePlaceholder {
+  placeholder: string;
+  dominant_color: string;
+}
+
+// Paint the placeholder behind an <img> so something shows before it loads.
+export function placeholderStyle(placeholder?: ImagePlaceholder): CSSProperties {
+  if (!placeholder) return {};
+  return {
+    backgroundColor: placeholder.dominant_color,
+    backgroundImage: `url(${placeholder.placeholder})`,
+    backgroundSize: "cover",
+    backgroundPosition: "center",
+  };
+}